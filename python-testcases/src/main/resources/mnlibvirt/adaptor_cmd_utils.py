@@ -0,0 +1,469 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Scripts run on a peer node to drive and observe the VMs
+            managed by the libvirt adaptor, and the watchdog the test
+            sets run them under.
+"""
+
+import os
+import time
+
+from remote_cmd_utils import RemoteCmdUtils
+from step_timer import timed_step
+
+# Return code of a script which gave up at its deadline, as for timeout
+DEADLINE_RETURN_CODE = 124
+
+# Seconds a command timed out by get_deadline_cmd is given to end on
+# SIGTERM before it is sent SIGKILL
+DEADLINE_KILL_AFTER = 10
+
+# The adaptor script behind every vm-service
+VM_UTILS = '/usr/share/litp_libvirt/vm_utils'
+
+# The service command the verbs of a vm-service are run through, as by
+# GenericTest.run_libvirt_service_cmd
+SERVICE = '/sbin/service'
+
+
+class AdaptorCmdUtils(object):
+    """
+    Generates the scripts used to drive and observe the VMs managed by
+    the libvirt adaptor on a peer node.
+    """
+
+    def __init__(self):
+        """
+        Initialise the remote command framing.
+        """
+        self.remote = RemoteCmdUtils()
+
+    @staticmethod
+    def get_adaptor_cmd(vm_name, adaptor_cmd, timeout=None):
+        """
+        Function to return the command which runs an adaptor verb
+        against a vm-service.
+
+        Args:
+            vm_name (str): The name of the vm-service.
+
+            adaptor_cmd (str): The verb and its options, e.g. "start" or
+                               "stop-undefine --stop-timeout 20".
+
+            timeout (int): If given, the process group is killed when it
+                           runs for longer than this many seconds.
+
+        Return:
+            str. The adaptor command.
+        """
+        cmd = '{0} {1} {2}'.format(VM_UTILS, vm_name, adaptor_cmd)
+        if timeout is not None:
+            cmd = '/usr/bin/timeout {0} {1}'.format(int(timeout), cmd)
+        return cmd
+
+    @staticmethod
+    def get_service_cmd(vm_name, verb, timeout=None):
+        """
+        Function to return the command which runs an adaptor verb
+        against a vm-service through its service, as
+        GenericTest.run_libvirt_service_cmd does.
+
+        Args:
+            vm_name (str): The name of the vm-service.
+
+            verb (str): The verb and its options, e.g. "start".
+
+            timeout (int): If given, the process group is killed when it
+                           runs for longer than this many seconds.
+
+        Return:
+            str. The service command.
+        """
+        cmd = '{0} {1} {2}'.format(SERVICE, vm_name, verb)
+        if timeout is not None:
+            cmd = '/usr/bin/timeout {0} {1}'.format(int(timeout), cmd)
+        return cmd
+
+    def get_deadline_cmd(self, cmd, timeout):
+        """
+        Function to return a command which runs a command for no longer
+        than a number of seconds. The command then has its process group
+        sent SIGTERM, and SIGKILL DEADLINE_KILL_AFTER seconds later if
+        it is still running.
+
+        Args:
+            cmd (str): The command.
+
+            timeout (int): The seconds the command may run for.
+
+        Return:
+            str. The command, which returns DEADLINE_RETURN_CODE if the
+            command was timed out, or 137 if it had to be killed.
+        """
+        return '/usr/bin/timeout -k {0} {1} /bin/bash -c {2}'.format(
+            DEADLINE_KILL_AFTER, max(1, int(timeout)), self.remote.quote(cmd))
+
+    def get_kill_cmd(self, vm_name):
+        """
+        Function to return a command which kills the process groups of
+        the adaptor runs against a vm-service, with the systemctl or
+        service calls which started them, listing each group first.
+
+        Args:
+            vm_name (str): The name of the vm-service.
+
+        Return:
+            str. The command.
+        """
+        # the bracketed first letters keep the pattern from matching the
+        # awk which searches for it
+        pattern = '([v]m_utils|[s]ystemctl [a-z-]+|[s]ervice) {0}( |$)'.format(
+            vm_name)
+        return ('own=$(/bin/ps -o pgid= $$); '
+                '/bin/ps -eo pgid=,args= | '
+                "/bin/awk -v pat={0} '$0 ~ pat {{print $1}}' | "
+                '/bin/sort -u | while read pgid; do '
+                '[ "$pgid" -eq "$own" ] && continue; '
+                '/bin/ps -eo pid=,pgid=,etimes=,args= | '
+                '/bin/awk -v pgid="$pgid" \'$2 == pgid\'; '
+                'kill -KILL -- -"$pgid"; done').format(
+                    self.remote.quote(pattern))
+
+    def get_diagnostic_cmds(self, vm_name, log_path, log_lines=50):
+        """
+        Function to return the commands which kill a hung adaptor run
+        against a vm-service and show the state it left the VM in, to be
+        run in a single batch.
+
+        Args:
+            vm_name (str): The name of the vm-service.
+
+            log_path (str): The adaptor log.
+
+            log_lines (int): The number of lines of the log shown.
+
+        Return:
+            list. (name, command) pairs.
+        """
+        return [('killed processes', self.get_kill_cmd(vm_name)),
+                ('virsh list', '/usr/bin/virsh list --all'),
+                ('virsh dominfo', '/usr/bin/virsh dominfo {0}'.format(
+                    vm_name)),
+                ('adaptor log', '/usr/bin/tail -n {0} {1}'.format(
+                    int(log_lines), self.remote.quote(log_path)))]
+
+    def get_console_wait_script(self, vm_name, banner, deadline):
+        """
+        Function to return a script which streams the serial console of
+        a VM until a banner appears on it.
+
+        The console is attached once and read as a stream. A carriage
+        return is written every two seconds so that a getty which has
+        already printed its banner prints it again. The console session
+        is killed as soon as the banner is seen. If the console cannot
+        be attached, for example because the domain is not yet running,
+        it is attached again until the deadline is reached.
+
+        Args:
+            vm_name (str): The name of the VM in virsh.
+
+            banner (str): The text to wait for, e.g. "login:".
+
+            deadline (int): The maximum number of seconds to wait.
+
+        Return:
+            list. The lines of the script, which returns 0 once the
+            banner is seen and DEADLINE_RETURN_CODE if it is not seen in
+            time.
+        """
+        console_cmd = self.remote.quote(
+            '/usr/bin/virsh console --force {0}'.format(vm_name))
+        return [
+            'fifo=$(/bin/mktemp -u /tmp/console_wait.XXXXXX)',
+            '/usr/bin/mkfifo "$fifo" || exit 1',
+            "trap '/bin/rm -f \"$fifo\"' EXIT",
+            'end=$((SECONDS + {0}))'.format(int(deadline)),
+            'while :; do',
+            '    remaining=$((end - SECONDS))',
+            '    [ "$remaining" -gt 0 ] || break',
+            # timeout leads its own process group, so killing the group
+            # ends the console session
+            '    /usr/bin/timeout "$remaining" /usr/bin/script -qfc '
+            '{0} /dev/null \\'.format(console_cmd),
+            "        < <(while :; do printf '\\r'; sleep 2; done 2>/dev/null) "
+            '\\',
+            '        > "$fifo" 2>/dev/null &',
+            '    console_pid=$!',
+            '    /bin/grep -q -m 1 -F -- {0} < "$fifo"'.format(
+                self.remote.quote(banner)),
+            '    found=$?',
+            '    kill -TERM -- -"$console_pid" 2>/dev/null',
+            '    wait "$console_pid" 2>/dev/null',
+            '    [ "$found" -eq 0 ] && exit 0',
+            '    sleep 1',
+            'done',
+            'exit {0}'.format(DEADLINE_RETURN_CODE)]
+
+    def get_console_wait_cmd(self, vm_name, banner, deadline):
+        """
+        Function to return the command which waits for a banner on the
+        serial console of a VM, see get_console_wait_script.
+
+        Args:
+            vm_name (str): The name of the VM in virsh.
+
+            banner (str): The text to wait for.
+
+            deadline (int): The maximum number of seconds to wait.
+
+        Return:
+            str. The command.
+        """
+        return self.remote.get_script_cmd(
+            self.get_console_wait_script(vm_name, banner, deadline))
+
+
+class AdaptorWatchdogMixin(object):
+    """
+    Test helpers running adaptor verbs and console waits under a
+    watchdog, which ends a hung verb on the node and fails the test
+    with what it finds there.
+
+    The verbs are built with the test's adaptor_cmds, and the findings
+    gathered with its run_cmd_batch.
+    """
+
+    # Seconds the next command run is given on the node, see
+    # run_libvirt_service_cmd
+    service_cmd_timeout = None
+
+    # Seconds an adaptor verb run by run_libvirt_service_cmd without a
+    # timeout of its own is given before the watchdog fails the test
+    service_cmd_deadline = int(
+        os.environ.get('MNLIBVIRT_STEP_DEADLINE', '1800'))
+
+    # Seconds the framework waits for an adaptor verb past its deadline
+    # on the node, should the node fail to end it
+    service_cmd_grace = 60
+
+    # Seconds a test is given before the watchdog fails it at its next
+    # adaptor verb or console wait. Test sets whose tests run plans give
+    # them longer.
+    test_deadline = int(os.environ.get('MNLIBVIRT_TEST_DEADLINE', '3600'))
+
+    # Seconds a VM is given to print its login banner after start
+    vm_boot_deadline = 600
+
+    # The adaptor's log on the nodes
+    libvirt_log = None
+
+    def setUp(self):
+        """
+        Description:
+            Start the test's deadline.
+        """
+        super(AdaptorWatchdogMixin, self).setUp()
+        self.test_deadline_time = time.time() + self.test_deadline
+        self.watchdog_fired = False
+
+    def run_command(self, node, cmd, *args, **kwargs):
+        """
+        Description:
+            Run a command on a node, see GenericTest. With
+            service_cmd_timeout set, the command is run under timeout on
+            the node, see AdaptorCmdUtils.get_deadline_cmd, and
+            service_cmd_timeout is cleared.
+        """
+        if self.service_cmd_timeout is not None:
+            cmd = self.adaptor_cmds.get_deadline_cmd(cmd,
+                                                     self.service_cmd_timeout)
+            self.service_cmd_timeout = None
+        return super(AdaptorWatchdogMixin, self).run_command(
+            node, cmd, *args, **kwargs)
+
+    def run_libvirt_service_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run an adaptor verb, see GenericTest, as a step named after
+            the verb and its options.
+
+            A verb given no timeout is given service_cmd_deadline, cut
+            to the time left before the test deadline. The node ends the
+            verb once that time is up, as the service command is run
+            under timeout there, see run_command. The framework itself
+            only gives up service_cmd_grace later. If the verb runs for
+            its time, the watchdog fails the test, see fail_on_watchdog,
+            or logs its findings if the verb raised, which is then
+            raised unchanged. A verb given a timeout of its own may be
+            expected to hang, so the test decides. Once the watchdog has
+            fired, it stays quiet for the rest of the test.
+        """
+        if len(args) < 3:
+            return super(AdaptorWatchdogMixin, self).run_libvirt_service_cmd(
+                *args, **kwargs)
+        node, vm_service_name, verb = args[:3]
+        watched = 'timeout' not in kwargs
+        if watched:
+            timeout = self.get_watchdog_timeout(node, vm_service_name,
+                                                self.service_cmd_deadline)
+            self.service_cmd_timeout = timeout
+            kwargs['timeout'] = timeout + self.service_cmd_grace
+        start_time = time.time()
+        reason = '"{0}" ran for {1}s'.format(verb, kwargs['timeout'])
+        try:
+            if self.step_timer is None:
+                result = super(AdaptorWatchdogMixin,
+                               self).run_libvirt_service_cmd(*args, **kwargs)
+            else:
+                with self.step_timer.step(
+                        'run_libvirt_service_cmd {0}'.format(verb)):
+                    result = super(AdaptorWatchdogMixin,
+                                   self).run_libvirt_service_cmd(*args,
+                                                                 **kwargs)
+        except Exception:
+            self.service_cmd_timeout = None
+            if watched and not self.watchdog_fired and \
+                    time.time() - start_time >= timeout:
+                self.log_watchdog_diagnostics(node, vm_service_name, reason)
+            raise
+        if watched and not self.watchdog_fired and \
+                time.time() - start_time >= timeout:
+            self.fail_on_watchdog(node, vm_service_name, reason)
+        return result
+
+    def get_watchdog_timeout(self, node, vm_service_name, step_timeout):
+        """
+        Description:
+            Return the seconds a step against a vm-service may run for:
+            its own timeout, cut to the time left before the test
+            deadline. Fails the test if no time is left. Once the
+            watchdog has fired, the steps run in the test's cleanup are
+            only given their own timeout.
+
+        Args:
+            node (str): The node the vm-service runs on.
+
+            vm_service_name (str): The name of the vm-service.
+
+            step_timeout (int): The step's own timeout, in seconds.
+
+        Returns:
+            int. The seconds.
+        """
+        if self.watchdog_fired:
+            return step_timeout
+        remaining = int(self.test_deadline_time - time.time())
+        if remaining <= 0:
+            self.fail_on_watchdog(node, vm_service_name,
+                                  'The test ran for over {0}s'.format(
+                                      self.test_deadline))
+        return min(step_timeout, remaining)
+
+    def fail_on_watchdog(self, node, vm_service_name, reason):
+        """
+        Description:
+            Fail a test whose step hung, with the findings of
+            log_watchdog_diagnostics.
+
+        Args:
+            node (str): The node the vm-service runs on.
+
+            vm_service_name (str): The name of the vm-service.
+
+            reason (str): What hung.
+        """
+        self.fail('\n'.join(self.log_watchdog_diagnostics(
+            node, vm_service_name, reason)))
+
+    def log_watchdog_diagnostics(self, node, vm_service_name, reason):
+        """
+        Description:
+            Deal with a step which hung and mark the watchdog as fired.
+            In a single batch, the adaptor processes left running
+            against the vm-service are killed with their process
+            groups, and the domains, the domain of the vm-service and
+            the end of the adaptor log are listed. These and the step
+            times so far are logged.
+
+        Args:
+            node (str): The node the vm-service runs on.
+
+            vm_service_name (str): The name of the vm-service.
+
+            reason (str): What hung.
+
+        Returns:
+            list. The lines logged.
+        """
+        self.watchdog_fired = True
+        lines = ['WATCHDOG {0}'.format(reason)]
+        for result in self.run_cmd_batch(
+                node, self.adaptor_cmds.get_diagnostic_cmds(
+                    vm_service_name, self.libvirt_log)):
+            lines.append('--- {0} (return code {1})'.format(result.name,
+                                                           result.rc))
+            lines.extend(result.stdout + result.stderr)
+        if self.step_timer is not None:
+            lines.extend(self.step_timer.format_summary())
+        for line in lines:
+            self.log("info", line)
+        return lines
+
+    @timed_step
+    def wait_for_vm_boot(self, node, vm_service_name, banner,
+                         deadline=None):
+        """
+        Description:
+            Wait for a VM to boot by streaming its serial console until
+            the login banner appears. The console is read in a single
+            remote command which returns as soon as the banner is seen,
+            and gives up at the deadline.
+
+            The boot time is logged and appended to
+            self.boot_times[vm_service_name].
+
+        Args:
+            node (str): The node the VM runs on.
+
+            vm_service_name (str): The name of the VM in virsh.
+
+            banner (str): The login banner, e.g.
+                          "vm-service-host.localdomain login:".
+
+            deadline (int): Seconds to wait for the banner, defaults to
+                            the class's vm_boot_deadline.
+
+        Returns:
+            float. The seconds it took for the banner to appear.
+        """
+        if deadline is None:
+            deadline = self.vm_boot_deadline
+        deadline = self.get_watchdog_timeout(node, vm_service_name,
+                                             deadline)
+        wait_cmd = self.adaptor_cmds.get_console_wait_cmd(vm_service_name,
+                                                          banner, deadline)
+        start_time = time.time()
+        _, _, return_code = self.run_command(node, wait_cmd, su_root=True)
+        boot_time = time.time() - start_time
+        self.boot_times.setdefault(vm_service_name, []).append(boot_time)
+        self.log("info", 'VM "{0}" boot wait finished after {1:.1f}s '
+                         'with return code {2}'.format(vm_service_name,
+                                                       boot_time,
+                                                       return_code))
+        if return_code == DEADLINE_RETURN_CODE and not self.watchdog_fired:
+            self.fail_on_watchdog(node, vm_service_name,
+                                  '"{0}" did not appear on the console of '
+                                  'VM "{1}" within {2}s'.format(
+                                      banner, vm_service_name, deadline))
+        self.assertEqual(0, return_code,
+                         '"{0}" did not appear on the console of VM "{1}" '
+                         'within {2}s'.format(banner, vm_service_name,
+                                              deadline))
+        return boot_time
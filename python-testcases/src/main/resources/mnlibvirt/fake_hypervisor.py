@@ -0,0 +1,203 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Stand-in hypervisor for driving the adaptor on a node
+            without libvirtd, real images or guest boots. Its libvirt
+            binding, virsh and status check server are in
+            fake_hypervisor_files.
+"""
+
+import hashlib
+import json
+import os
+
+from remote_cmd_utils import RemoteCmdUtils
+
+# Stands for the fake hypervisor among the installed packages
+FAKE_HYPERVISOR_PKG = 'mnlibvirt-fake-hypervisor'
+
+# Where the fake is installed on the node
+FAKE_ROOT = '/opt/mnlibvirt_fake'
+
+# Where the fake keeps its domains on the node
+FAKE_STATE_DIR = '/var/lib/mnlibvirt_fake'
+
+# The installed files, keyed by their name in fake_hypervisor_files
+FAKE_FILES = {
+    'libvirt.py': FAKE_ROOT + '/lib/libvirt.py',
+    'virsh': FAKE_ROOT + '/bin/virsh',
+    'fake_guest': FAKE_ROOT + '/bin/fake_guest'}
+
+# The virsh the test sets and the adaptor run
+VIRSH_PATH = '/usr/bin/virsh'
+
+# Python path file making the fake binding importable as libvirt
+PTH_FILENAME = 'mnlibvirt_fake.pth'
+
+# Pythons the binding is made importable for
+PYTHONS = ('/usr/bin/python', '/usr/bin/python2', '/usr/bin/python3')
+
+# Profile of a guest which boots and passes the status check. A fake
+# image is the JSON profile of its guest: "status" is the HTTP status
+# of the status check, 0 for none; "boot_seconds" the seconds from start
+# to the login banner; "shutdown_seconds" the seconds from an ACPI
+# shutdown to the domain being shut off, negative if the guest ignores
+# it.
+DEFAULT_PROFILE = {'status': 200, 'boot_seconds': 2, 'shutdown_seconds': 1}
+
+# The images of the MS image directory the test sets use, and the
+# profile of each where it is not the default one
+FAKE_MS_IMAGES = {
+    'vm_test_image-1-1.0.8.qcow2': {},
+    'vm_test_image-2-1.0.8.qcow2': {},
+    'vm_test_image-3-1.0.8.qcow2': {},
+    'vm_test_image-5-1.0.7.qcow2': {},
+    'vm_test_image_neg-1-1.0.7.qcow2': {'status': 400},
+    'vm_test_image_neg-2-1.0.7.qcow2': {'status': 503},
+    'vm_test_image_neg-3-1.0.6.qcow2': {'status': 400}}
+
+
+class FakeHypervisor(object):
+    """
+    Installs the stand-in hypervisor on a node and builds its images.
+    """
+
+    def __init__(self, files_dir=None):
+        """
+        Args:
+            files_dir (str): Directory holding the files to install,
+                             fake_hypervisor_files next to this module
+                             by default.
+        """
+        self.files_dir = files_dir or os.path.join(
+            os.path.dirname(os.path.realpath(__file__)),
+            'fake_hypervisor_files')
+        self.remote = RemoteCmdUtils()
+
+    @staticmethod
+    def get_ms_image_names():
+        """
+        Function to return the images of the fake MS image directory.
+
+        Return:
+            list. The image names, sorted as the directory listing is.
+        """
+        return sorted(FAKE_MS_IMAGES)
+
+    @staticmethod
+    def get_image_lines(ms_image_name):
+        """
+        Function to return the content of the fake copy of an MS image.
+
+        Args:
+            ms_image_name (str): The image name on the MS.
+
+        Return:
+            list. The lines of the image, its guest's profile.
+        """
+        profile = dict(DEFAULT_PROFILE)
+        profile.update(FAKE_MS_IMAGES.get(ms_image_name, {}))
+        return [json.dumps(profile, sort_keys=True)]
+
+    def get_image_checksum(self, ms_image_name):
+        """
+        Function to return the md5 checksum of the fake copy of an MS
+        image, as written by get_write_file_cmd.
+
+        Args:
+            ms_image_name (str): The image name on the MS.
+
+        Return:
+            str. The checksum.
+        """
+        content = '\n'.join(self.get_image_lines(ms_image_name)) + '\n'
+        return hashlib.md5(content.encode('utf-8')).hexdigest()
+
+    def _read_file_lines(self, filename):
+        """
+        Return the lines of one of the files to install.
+        """
+        with open(os.path.join(self.files_dir, filename)) as fake_file:
+            return fake_file.read().rstrip('\n').split('\n')
+
+    def get_check_cmd(self):
+        """
+        Function to return the command which succeeds only if the fake
+        is installed.
+
+        Return:
+            str. The command.
+        """
+        return '[ -x {0} ] && [ {1} -ef {0} ]'.format(FAKE_FILES['virsh'],
+                                                    VIRSH_PATH)
+
+    def get_install_cmd(self):
+        """
+        Function to return the command which installs the fake. It fails
+        on a node with libvirt installed or a virsh of its own, rather
+        than shadow them.
+
+        Return:
+            str. The command.
+        """
+        script = [
+            'if /bin/rpm -q libvirt > /dev/null 2>&1; then',
+            '    echo "libvirt is installed, not installing the fake" >&2',
+            '    exit 1',
+            'fi',
+            'if [ -e {0} ] && [ ! -L {0} ]; then'.format(VIRSH_PATH),
+            '    echo "{0} exists, not installing the fake" >&2'.format(
+                VIRSH_PATH),
+            '    exit 1',
+            'fi',
+            'set -e',
+            '/bin/mkdir -p {0}/bin {0}/lib {1}'.format(FAKE_ROOT,
+                                                       FAKE_STATE_DIR)]
+        for filename, path in sorted(FAKE_FILES.items()):
+            script.append(self.remote.get_write_file_cmd(
+                path, self._read_file_lines(filename)))
+        script.extend([
+            '/bin/chmod 755 {0} {1}'.format(FAKE_FILES['virsh'],
+                                            FAKE_FILES['fake_guest']),
+            '/bin/ln -sfn {0} {1}'.format(FAKE_FILES['virsh'], VIRSH_PATH),
+            'for python in {0}; do'.format(' '.join(PYTHONS)),
+            '    [ -x "$python" ] || continue',
+            '    site=$("$python" -c "from distutils.sysconfig import '
+            'get_python_lib; print(get_python_lib())" 2>/dev/null) || '
+            'continue',
+            '    echo {0}/lib > "$site/{1}"'.format(FAKE_ROOT, PTH_FILENAME),
+            'done'])
+        return self.remote.get_script_cmd(script)
+
+    def get_uninstall_cmd(self):
+        """
+        Function to return the command which removes the fake, the
+        guest server and the addresses of its guests.
+
+        Return:
+            str. The command.
+        """
+        return self.remote.get_script_cmd([
+            '/bin/kill $(/bin/cat {0}/fake_guest.pid 2>/dev/null) '
+            '2>/dev/null'.format(FAKE_STATE_DIR),
+            'for address in $(/bin/sed -n \'s/.*"address": "\\([0-9.]*\\)".*'
+            '/\\1/p\' {0}/domains/*.json 2>/dev/null); do'.format(
+                FAKE_STATE_DIR),
+            '    /sbin/ip addr del "$address/32" dev lo 2>/dev/null',
+            'done',
+            '[ {0} -ef {1} ] && /bin/rm -f {1}'.format(FAKE_FILES['virsh'],
+                                                       VIRSH_PATH),
+            'for python in {0}; do'.format(' '.join(PYTHONS)),
+            '    [ -x "$python" ] || continue',
+            '    site=$("$python" -c "from distutils.sysconfig import '
+            'get_python_lib; print(get_python_lib())" 2>/dev/null) && '
+            '/bin/rm -f "$site/{0}"'.format(PTH_FILENAME),
+            'done',
+            '/bin/rm -rf {0} {1}'.format(FAKE_ROOT, FAKE_STATE_DIR),
+            'exit 0'])
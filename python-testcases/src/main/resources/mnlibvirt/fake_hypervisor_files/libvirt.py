@@ -0,0 +1,522 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Stand-in for the libvirt python binding, installed on a box
+            without libvirt by fake_hypervisor.FakeHypervisor. Implements
+            the part of the binding used to manage persistent domains.
+
+            Domains are records in STATE_DIR. No guest is run: a domain's
+            boot, its answer to the internal status check and how it
+            reacts to a shutdown come from the profile held, as JSON, in
+            the image file its first disk points at.
+"""
+
+import fcntl
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+import xml.etree.ElementTree as ET
+
+# Where the domain records are kept
+STATE_DIR = os.environ.get('MNLIBVIRT_FAKE_STATE', '/var/lib/mnlibvirt_fake')
+
+# Where the adaptor keeps the config.json and meta-data of a vm-service
+INSTANCES_DIR = '/var/lib/libvirt/instances'
+
+# The server answering the internal status check for every domain
+GUEST_SERVER = '/opt/mnlibvirt_fake/bin/fake_guest'
+
+# Profile of a domain whose image holds none
+DEFAULT_PROFILE = {'status': 200, 'boot_seconds': 2, 'shutdown_seconds': 1}
+
+# The builtin open, which the binding's open shadows
+_open_file = open
+
+VIR_DOMAIN_NOSTATE = 0
+VIR_DOMAIN_RUNNING = 1
+VIR_DOMAIN_BLOCKED = 2
+VIR_DOMAIN_PAUSED = 3
+VIR_DOMAIN_SHUTDOWN = 4
+VIR_DOMAIN_SHUTOFF = 5
+VIR_DOMAIN_CRASHED = 6
+
+VIR_ERR_OPERATION_FAILED = 9
+VIR_ERR_XML_ERROR = 27
+VIR_ERR_NO_DOMAIN = 42
+VIR_ERR_OPERATION_INVALID = 55
+
+VIR_CONNECT_LIST_DOMAINS_ACTIVE = 1
+VIR_CONNECT_LIST_DOMAINS_INACTIVE = 2
+
+VIR_DOMAIN_XML_SECURE = 1
+VIR_DOMAIN_UNDEFINE_MANAGED_SAVE = 1
+
+
+class libvirtError(Exception):
+    """
+    Raised as the binding raises it, with a libvirt error code.
+    """
+
+    def __init__(self, msg, code=VIR_ERR_OPERATION_FAILED):
+        Exception.__init__(self, msg)
+        self.msg = msg
+        self.err = (code, 0, msg, 2, None, None, None, 0, 0)
+
+    def get_error_code(self):
+        """
+        Return the libvirt error code.
+        """
+        return self.err[0]
+
+    def get_error_message(self):
+        """
+        Return the error message.
+        """
+        return self.msg
+
+
+def registerErrorHandler(handler, ctx):
+    """
+    Errors are only raised, never reported to a handler.
+    """
+    return 0
+
+
+def open(name=None):
+    """
+    Return a connection to the fake hypervisor, whatever the URI.
+    """
+    return virConnect(name)
+
+
+def openReadOnly(name=None):
+    """
+    Return a connection to the fake hypervisor, whatever the URI.
+    """
+    return virConnect(name)
+
+
+def openAuth(uri, auth, flags=0):
+    """
+    Return a connection to the fake hypervisor, whatever the URI.
+    """
+    return virConnect(uri)
+
+
+class _State(object):
+    """
+    The domain records, each a JSON file, changed under a lock shared
+    by every process using the fake.
+    """
+
+    def __init__(self):
+        self.domains_dir = os.path.join(STATE_DIR, 'domains')
+        if not os.path.isdir(self.domains_dir):
+            os.makedirs(self.domains_dir)
+        self.lock_file = None
+
+    def __enter__(self):
+        self.lock_file = _open_file(os.path.join(STATE_DIR, '.lock'), 'a')
+        fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_UN)
+        self.lock_file.close()
+
+    def _path(self, name):
+        return os.path.join(self.domains_dir, name + '.json')
+
+    def names(self):
+        return sorted(filename[:-len('.json')]
+                      for filename in os.listdir(self.domains_dir)
+                      if filename.endswith('.json'))
+
+    def load(self, name):
+        path = self._path(name)
+        if not os.path.exists(path):
+            raise libvirtError("Domain not found: no domain with matching "
+                               "name '{0}'".format(name), VIR_ERR_NO_DOMAIN)
+        record_file = _open_file(path)
+        try:
+            return json.load(record_file)
+        finally:
+            record_file.close()
+
+    def save(self, record):
+        path = self._path(record['name'])
+        record_file = _open_file(path + '.tmp', 'w')
+        try:
+            json.dump(record, record_file)
+        finally:
+            record_file.close()
+        os.rename(path + '.tmp', path)
+
+    def remove(self, name):
+        os.remove(self._path(name))
+
+
+def _read_profile(disk_path):
+    """
+    Return the profile held in a fake image, or the default profile.
+    """
+    profile = dict(DEFAULT_PROFILE)
+    try:
+        image_file = _open_file(disk_path)
+        try:
+            profile.update(json.load(image_file))
+        finally:
+            image_file.close()
+    except (IOError, OSError, ValueError, TypeError):
+        pass
+    return profile
+
+
+def _read_check_address(name):
+    """
+    Return the address the internal status check of a vm-service is
+    made on, from its config.json, or None.
+    """
+    try:
+        config_file = _open_file(os.path.join(INSTANCES_DIR, name,
+                                              'config.json'))
+        try:
+            config = json.load(config_file)
+        finally:
+            config_file.close()
+        return config['adaptor_data']['internal_status_check'][
+            'ip_address'] or None
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _run_quietly(args):
+    """
+    Run a command, ignoring its output and outcome.
+    """
+    devnull = _open_file(os.devnull, 'w')
+    try:
+        return subprocess.call(args, stdout=devnull, stderr=devnull)
+    finally:
+        devnull.close()
+
+
+def _start_guest_server():
+    """
+    Start the status check server, unless it is already running.
+    """
+    pid_path = os.path.join(STATE_DIR, 'fake_guest.pid')
+    try:
+        pid_file = _open_file(pid_path)
+        try:
+            os.kill(int(pid_file.read().strip()), 0)
+            return
+        finally:
+            pid_file.close()
+    except (IOError, OSError, ValueError):
+        pass
+    devnull = _open_file(os.devnull, 'r+')
+    try:
+        process = subprocess.Popen(['/usr/bin/setsid', sys.executable,
+                                    GUEST_SERVER],
+                                   stdin=devnull, stdout=devnull,
+                                   stderr=devnull, close_fds=True)
+    finally:
+        devnull.close()
+    pid_file = _open_file(pid_path, 'w')
+    try:
+        pid_file.write('{0}\n'.format(process.pid))
+    finally:
+        pid_file.close()
+
+
+def refresh(record, now=None):
+    """
+    Bring a domain record up to date with the time: a domain asked to
+    shut down is shut off once its profile's shutdown_seconds have
+    passed, and never if they are negative.
+
+    Return True if the record changed.
+    """
+    now = time.time() if now is None else now
+    requested = record.get('shutdown_requested')
+    delay = record['profile'].get('shutdown_seconds', 1)
+    if record['active'] and requested is not None and delay >= 0 and \
+            now >= requested + delay:
+        record['active'] = False
+        record['id'] = -1
+        record['shutdown_requested'] = None
+        return True
+    return False
+
+
+def is_booted(record, now=None):
+    """
+    Return True if a domain is running and its guest has booted.
+    """
+    now = time.time() if now is None else now
+    return record['active'] and \
+        now >= record['started'] + record['profile'].get('boot_seconds', 2)
+
+
+def load_record(name):
+    """
+    Return the up to date record of a domain, for the fake virsh and
+    the fake guest.
+    """
+    with _State() as state:
+        record = state.load(name)
+        if refresh(record):
+            state.save(record)
+        return record
+
+
+def list_records():
+    """
+    Return the up to date records of every domain.
+    """
+    records = []
+    with _State() as state:
+        for name in state.names():
+            try:
+                record = state.load(name)
+            except libvirtError:
+                continue
+            if refresh(record):
+                state.save(record)
+            records.append(record)
+    return records
+
+
+class virConnect(object):
+    """
+    A connection to the fake hypervisor.
+    """
+
+    def __init__(self, uri=None):
+        self.uri = uri or 'qemu:///system'
+
+    def close(self):
+        return 0
+
+    def getURI(self):
+        return self.uri
+
+    def getHostname(self):
+        return os.uname()[1]
+
+    def lookupByName(self, name):
+        load_record(name)
+        return virDomain(self, name)
+
+    def lookupByID(self, dom_id):
+        for record in list_records():
+            if record['active'] and record['id'] == dom_id:
+                return virDomain(self, record['name'])
+        raise libvirtError('Domain not found: no domain with matching id '
+                           '{0}'.format(dom_id), VIR_ERR_NO_DOMAIN)
+
+    def lookupByUUIDString(self, uuid_string):
+        for record in list_records():
+            if record['uuid'] == uuid_string:
+                return virDomain(self, record['name'])
+        raise libvirtError('Domain not found: no domain with matching '
+                           'uuid {0}'.format(uuid_string), VIR_ERR_NO_DOMAIN)
+
+    def defineXML(self, xml):
+        try:
+            root = ET.fromstring(xml)
+        except Exception:
+            raise libvirtError('XML error: failed to parse the domain',
+                               VIR_ERR_XML_ERROR)
+        name = root.findtext('name')
+        if not name:
+            raise libvirtError('XML error: the domain has no name',
+                               VIR_ERR_XML_ERROR)
+        disk_path = None
+        for disk in root.findall('devices/disk'):
+            source = disk.find('source')
+            if disk.get('device', 'disk') == 'disk' and source is not None:
+                disk_path = source.get('file') or source.get('dev')
+                break
+        with _State() as state:
+            try:
+                record = state.load(name)
+            except libvirtError:
+                record = {'name': name, 'uuid': root.findtext('uuid') or
+                          str(uuid.uuid4()), 'id': -1, 'active': False,
+                          'started': None, 'shutdown_requested': None,
+                          'address': None}
+            record['xml'] = xml
+            record['disk'] = disk_path
+            record['profile'] = _read_profile(disk_path)
+            state.save(record)
+        return virDomain(self, name)
+
+    def createXML(self, xml, flags=0):
+        domain = self.defineXML(xml)
+        domain.create()
+        return domain
+
+    def listAllDomains(self, flags=0):
+        domains = []
+        for record in list_records():
+            if flags & VIR_CONNECT_LIST_DOMAINS_ACTIVE and \
+                    not record['active']:
+                continue
+            if flags & VIR_CONNECT_LIST_DOMAINS_INACTIVE and \
+                    record['active']:
+                continue
+            domains.append(virDomain(self, record['name']))
+        return domains
+
+    def listDomainsID(self):
+        return [record['id'] for record in list_records()
+                if record['active']]
+
+    def listDefinedDomains(self):
+        return [record['name'] for record in list_records()
+                if not record['active']]
+
+    def numOfDomains(self):
+        return len(self.listDomainsID())
+
+    def numOfDefinedDomains(self):
+        return len(self.listDefinedDomains())
+
+
+class virDomain(object):
+    """
+    A persistent domain of the fake hypervisor.
+    """
+
+    def __init__(self, conn, name):
+        self._conn = conn
+        self._name = name
+
+    def connect(self):
+        return self._conn
+
+    def name(self):
+        return self._name
+
+    def _record(self):
+        return load_record(self._name)
+
+    def ID(self):
+        return self._record()['id']
+
+    def UUIDString(self):
+        return self._record()['uuid']
+
+    def XMLDesc(self, flags=0):
+        return self._record()['xml']
+
+    def isActive(self):
+        return 1 if self._record()['active'] else 0
+
+    def isPersistent(self):
+        return 1
+
+    def state(self, flags=0):
+        record = self._record()
+        if not record['active']:
+            return [VIR_DOMAIN_SHUTOFF, 1]
+        if record.get('shutdown_requested') is not None:
+            return [VIR_DOMAIN_SHUTDOWN, 1]
+        return [VIR_DOMAIN_RUNNING, 1]
+
+    def info(self):
+        return [self.state()[0], 262144, 262144, 1, 0]
+
+    def create(self):
+        with _State() as state:
+            record = state.load(self._name)
+            refresh(record)
+            if record['active']:
+                raise libvirtError('Requested operation is not valid: '
+                                   'domain is already running',
+                                   VIR_ERR_OPERATION_INVALID)
+            used_ids = [other['id'] for other in
+                        [state.load(name) for name in state.names()]]
+            record['id'] = max([0] + used_ids) + 1
+            record['active'] = True
+            record['started'] = time.time()
+            record['shutdown_requested'] = None
+            record['profile'] = _read_profile(record['disk'])
+            record['address'] = _read_check_address(self._name)
+            state.save(record)
+        if record['address']:
+            # the guest answers the status check on its own address
+            _run_quietly(['/sbin/ip', 'addr', 'add',
+                          record['address'] + '/32', 'dev', 'lo'])
+        _start_guest_server()
+        return 0
+
+    def createWithFlags(self, flags=0):
+        return self.create()
+
+    def shutdown(self):
+        with _State() as state:
+            record = state.load(self._name)
+            refresh(record)
+            if not record['active']:
+                raise libvirtError('Requested operation is not valid: '
+                                   'domain is not running',
+                                   VIR_ERR_OPERATION_INVALID)
+            if record.get('shutdown_requested') is None:
+                record['shutdown_requested'] = time.time()
+            state.save(record)
+        return 0
+
+    def shutdownFlags(self, flags=0):
+        return self.shutdown()
+
+    def destroy(self):
+        with _State() as state:
+            record = state.load(self._name)
+            refresh(record)
+            if not record['active']:
+                raise libvirtError('Requested operation is not valid: '
+                                   'domain is not running',
+                                   VIR_ERR_OPERATION_INVALID)
+            record['active'] = False
+            record['id'] = -1
+            record['shutdown_requested'] = None
+            state.save(record)
+        return 0
+
+    def destroyFlags(self, flags=0):
+        return self.destroy()
+
+    def reboot(self, flags=0):
+        with _State() as state:
+            record = state.load(self._name)
+            record['started'] = time.time()
+            state.save(record)
+        return 0
+
+    def undefine(self):
+        with _State() as state:
+            record = state.load(self._name)
+            refresh(record)
+            if record['active']:
+                # a running domain becomes transient, gone once stopped;
+                # the fake only keeps persistent domains
+                raise libvirtError('Requested operation is not valid: '
+                                   'cannot undefine a running domain',
+                                   VIR_ERR_OPERATION_INVALID)
+            state.remove(self._name)
+        return 0
+
+    def undefineFlags(self, flags=0):
+        return self.undefine()
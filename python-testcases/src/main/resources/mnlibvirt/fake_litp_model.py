@@ -0,0 +1,712 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   In process stand-in for the LITP model and the litp CLI,
+            seeded from a snapshot of a deployment, so that the model
+            building helpers of the test sets run without an MS.
+"""
+
+import copy
+import os
+import shlex
+import time
+
+from litp_model_cache import LitpModelCache, COLLECTION_SUFFIX, \
+    INHERIT_SUFFIX
+from litp_model_batch import CREATE, UPDATE, INHERIT
+from plan_monitor import PLAN_SUCCESSFUL
+from remote_cmd_utils import CmdResult
+from step_timer import timed_step
+
+# Subtrees held by a snapshot, one litp export file each
+SNAPSHOT_ROOTS = ('/deployments', '/infrastructure', '/software', '/ms')
+
+# Item states, as litp show prints them
+ITEM_INITIAL = 'Initial'
+ITEM_UPDATED = 'Updated'
+ITEM_APPLIED = 'Applied'
+ITEM_FOR_REMOVAL = 'ForRemoval'
+
+# Plan state of a plan created but not yet run
+PLAN_INITIAL = 'Initial'
+
+# Properties whose values are addresses taken on a network
+ADDRESS_PROPS = ('ipaddress', 'ipaddresses', 'gateway')
+
+
+class FakeLitpError(Exception):
+    """
+    A litp CLI error, printed as the CLI prints it.
+    """
+
+    def __init__(self, error_type, message):
+        Exception.__init__(self, '{0}    {1}'.format(error_type, message))
+        self.error_type = error_type
+
+
+class FakeLitpModel(LitpModelCache):
+    """
+    The items of a deployment, changed as the litp CLI changes them.
+
+    Running a plan completes at once: every task is recorded as having
+    taken the seconds configured for its item type, and the items are
+    applied or removed.
+    """
+
+    def __init__(self, task_timings=None):
+        """
+        Args:
+            task_timings (dict): Seconds a plan task takes, keyed by the
+                                 type of its item. Tasks of other items
+                                 take no time.
+        """
+        super(FakeLitpModel, self).__init__()
+        self.task_timings = dict(task_timings or {})
+        self.sources = {}
+        self.states = {}
+        self.plan_tasks = None
+        self.plan_state = None
+
+    @staticmethod
+    def get_snapshot_filename(url):
+        """
+        Function to return the name of the snapshot file of a subtree.
+
+        Args:
+            url (str): The root of the subtree, one of SNAPSHOT_ROOTS.
+
+        Return:
+            str. The filename.
+        """
+        return '{0}.xml'.format(url.strip('/').replace('/', '_'))
+
+    def load_snapshot(self, snapshot_dir):
+        """
+        Add the subtrees of a snapshot to the model.
+
+        Args:
+            snapshot_dir (str): Directory holding a litp export of each
+                                of SNAPSHOT_ROOTS, see
+                                get_snapshot_filename. Missing subtrees
+                                are left out of the model.
+        """
+        for url in SNAPSHOT_ROOTS:
+            path = os.path.join(snapshot_dir,
+                                self.get_snapshot_filename(url))
+            if not os.path.exists(path):
+                continue
+            with open(path) as export_file:
+                self.load(url, export_file.read().split('\n'))
+
+    def _load_element(self, element, parent_url):
+        """
+        Add an item element and its descendants to the model, as
+        applied items.
+        """
+        super(FakeLitpModel, self)._load_element(element, parent_url)
+        url = '{0}/{1}'.format(parent_url.rstrip('/'), element.get('id'))
+        if element.get('source_path'):
+            self.sources[url] = element.get('source_path')
+        self.states[url] = ITEM_APPLIED
+
+    def copy(self):
+        """
+        Function to return an independent copy of the model, e.g. to
+        give each test the snapshot as it was loaded.
+
+        Return:
+            FakeLitpModel. The copy.
+        """
+        return copy.deepcopy(self)
+
+    @staticmethod
+    def parse_options(options):
+        """
+        Function to return the properties given to litp -o.
+
+        Args:
+            options (str): The properties, e.g. "name='a b' active=1".
+
+        Return:
+            dict. The property values, keyed by property name.
+        """
+        props = {}
+        for word in shlex.split(options or ''):
+            name, _, value = word.partition('=')
+            props[name] = value
+        return props
+
+    def _get_subtree(self, url):
+        """
+        Return the URLs of an item and its descendants, parents first.
+        """
+        return sorted(other for other in self.items
+                      if other == url or other.startswith(url + '/'))
+
+    def _assert_exists(self, url):
+        """
+        Raise the litp error for a path which is not in the model.
+        """
+        if url not in self.items:
+            raise FakeLitpError('InvalidLocationError',
+                                'Path not found: {0}'.format(url))
+
+    def get_props(self, url):
+        """
+        Function to return the properties of an item. A reference has
+        the properties of its source, overridden by its own.
+
+        Args:
+            url (str): The URL of the item.
+
+        Return:
+            tuple. The item type and a dict of its properties, or None
+            if the item is not in the model.
+        """
+        url = url.rstrip('/')
+        if url not in self.items:
+            return None
+        item_type, props = self.items[url]
+        source = self.get_props(self.sources[url]) \
+            if url in self.sources else None
+        merged = dict(source[1]) if source else {}
+        merged.update(props)
+        return item_type, merged
+
+    def get_state(self, url):
+        """
+        Function to return the state of an item.
+
+        Args:
+            url (str): The URL of the item.
+
+        Return:
+            str. One of the ITEM_* states, or None if the item is not in
+            the model.
+        """
+        return self.states.get(url.rstrip('/'))
+
+    def create(self, url, item_type, options=''):
+        """
+        Create an item, as litp create does.
+
+        Args:
+            url (str): The URL of the item.
+
+            item_type (str): The item type.
+
+            options (str): The item's properties.
+        """
+        url = url.rstrip('/')
+        if url in self.items and self.states[url] != ITEM_FOR_REMOVAL:
+            raise FakeLitpError('ItemExistsError',
+                                'Item already exists in model: '
+                                '{0}'.format(url))
+        self._assert_exists(url.rsplit('/', 1)[0])
+        self.items[url] = (item_type, self.parse_options(options))
+        self.states[url] = ITEM_INITIAL
+
+    def update(self, url, options):
+        """
+        Update the properties of an item, as litp update does.
+
+        Args:
+            url (str): The URL of the item.
+
+            options (str): The properties to set.
+        """
+        url = url.rstrip('/')
+        self._assert_exists(url)
+        self.items[url][1].update(self.parse_options(options))
+        if self.states[url] == ITEM_APPLIED:
+            self.states[url] = ITEM_UPDATED
+
+    def inherit(self, url, source_url, options=''):
+        """
+        Create a reference to an item, as litp inherit does. The
+        descendants of the source are referenced under the reference.
+
+        Args:
+            url (str): The URL of the reference.
+
+            source_url (str): The URL of the item referenced.
+
+            options (str): Properties overridden in the reference.
+        """
+        url = url.rstrip('/')
+        source_url = source_url.rstrip('/')
+        self._assert_exists(source_url)
+        if url in self.items and self.states[url] != ITEM_FOR_REMOVAL:
+            raise FakeLitpError('ItemExistsError',
+                                'Item already exists in model: '
+                                '{0}'.format(url))
+        self._assert_exists(url.rsplit('/', 1)[0])
+        for source_item in self._get_subtree(source_url):
+            item_url = url + source_item[len(source_url):]
+            item_type = self.items[source_item][0]
+            if not item_type.endswith(INHERIT_SUFFIX):
+                item_type += INHERIT_SUFFIX
+            self.items[item_url] = (item_type, {})
+            self.sources[item_url] = source_item
+            self.states[item_url] = ITEM_INITIAL
+        self.items[url][1].update(self.parse_options(options))
+
+    def remove(self, url):
+        """
+        Remove an item and its descendants, as litp remove does. Items
+        never applied go at once, the others when a plan is run.
+
+        Args:
+            url (str): The URL of the item.
+        """
+        url = url.rstrip('/')
+        self._assert_exists(url)
+        for item_url in self._get_subtree(url):
+            if self.states[item_url] == ITEM_INITIAL:
+                self._delete(item_url)
+            else:
+                self.states[item_url] = ITEM_FOR_REMOVAL
+
+    def _delete(self, url):
+        """
+        Drop an item from the model.
+        """
+        del self.items[url]
+        del self.states[url]
+        self.sources.pop(url, None)
+
+    def create_plan(self):
+        """
+        Create a plan with a task per item to apply or remove, as litp
+        create_plan does. Collections get no task.
+        """
+        tasks = []
+        for url in sorted(self.items):
+            item_type = self.items[url][0]
+            state = self.states[url]
+            if state == ITEM_APPLIED or \
+                    item_type.replace(INHERIT_SUFFIX, '').endswith(
+                        COLLECTION_SUFFIX):
+                continue
+            action = 'Remove' if state == ITEM_FOR_REMOVAL else 'Configure'
+            tasks.append((url, '{0} {1} "{2}"'.format(
+                action, item_type, url.rsplit('/', 1)[-1]),
+                self.task_timings.get(
+                    item_type.replace(INHERIT_SUFFIX, ''), 0)))
+        if not tasks:
+            raise FakeLitpError('DoNothingPlanError',
+                                'Create plan failed: no tasks were '
+                                'generated')
+        self.plan_tasks = tasks
+        self.plan_state = PLAN_INITIAL
+
+    def run_plan(self):
+        """
+        Run the plan, as litp run_plan does. The plan succeeds at once.
+        """
+        if self.plan_tasks is None:
+            raise FakeLitpError('InvalidLocationError', 'Plan does not '
+                                'exist')
+        if self.plan_state != PLAN_INITIAL:
+            raise FakeLitpError('InvalidRequestError', 'Plan not in '
+                                'initial state')
+        for url in sorted(self.items, reverse=True):
+            if self.states[url] == ITEM_FOR_REMOVAL:
+                self._delete(url)
+            else:
+                self.states[url] = ITEM_APPLIED
+        self.plan_state = PLAN_SUCCESSFUL
+
+    def get_task_durations(self):
+        """
+        Function to return the configured time of each task of the
+        plan, as for PlanMonitor.get_task_durations.
+
+        Return:
+            list. (item path, task description, seconds) tuples, in
+            plan order.
+        """
+        return list(self.plan_tasks or [])
+
+    def get_node_url(self, hostname):
+        """
+        Function to return the URL of a deployed node.
+
+        Args:
+            hostname (str): The hostname of the node.
+
+        Return:
+            str. The URL of the node, or None.
+        """
+        for url in self.find('/deployments', 'node'):
+            if self.get_props(url)[1].get('hostname') == hostname:
+                return url
+        return None
+
+    def get_management_network_name(self):
+        """
+        Function to return the name of the management network.
+
+        Return:
+            str. The network name, or None.
+        """
+        for url in self.find('/infrastructure', 'network'):
+            props = self.get_props(url)[1]
+            if props.get('litp_management') == 'true':
+                return props.get('name')
+        return None
+
+    def get_default_route_path(self, node_url):
+        """
+        Function to return the default route of a node.
+
+        Args:
+            node_url (str): The URL of the node, e.g. /ms.
+
+        Return:
+            str. The URL of the route, or None.
+        """
+        for url in self._get_subtree(node_url.rstrip('/')):
+            item_type, props = self.get_props(url)
+            if item_type.replace(INHERIT_SUFFIX, '') == 'route' and \
+                    props.get('subnet') == '0.0.0.0/0':
+                return url
+        return None
+
+    @staticmethod
+    def _to_int(address):
+        """
+        Return an IPv4 address as an integer.
+        """
+        value = 0
+        for octet in address.split('.'):
+            value = value * 256 + int(octet)
+        return value
+
+    @staticmethod
+    def _to_address(value):
+        """
+        Return an integer as an IPv4 address.
+        """
+        return '.'.join(str((value >> shift) & 255)
+                        for shift in (24, 16, 8, 0))
+
+    def get_free_ips(self, net_name):
+        """
+        Function to return the addresses of a network which no item
+        in the model uses.
+
+        Args:
+            net_name (str): The name of the network.
+
+        Return:
+            list. The free addresses, lowest first.
+        """
+        subnet = None
+        for url in self.find('/infrastructure', 'network'):
+            props = self.get_props(url)[1]
+            if props.get('name') == net_name:
+                subnet = props.get('subnet')
+        if not subnet:
+            return []
+        address, prefix = subnet.split('/')
+        size = 2 ** (32 - int(prefix))
+        first = self._to_int(address) & ~(size - 1)
+
+        used = set()
+        for url in self.items:
+            props = self.get_props(url)[1]
+            for name in ADDRESS_PROPS:
+                for value in props.get(name, '').split(','):
+                    if value.count('.') == 3:
+                        used.add(value.strip())
+        return [self._to_address(value)
+                for value in range(first + 1, first + size - 1)
+                if self._to_address(value) not in used]
+
+
+class FakeLitpModelMixin(object):
+    """
+    Test helpers running the model helpers and litp CLI commands of a
+    test against a FakeLitpModel, when fake_litp_snapshot is set,
+    instead of the model on the MS.
+    """
+
+    # Directory of a model snapshot, see save_model_snapshot, which the
+    # model helpers use instead of the model on the MS
+    fake_litp_snapshot = os.environ.get('MNLIBVIRT_FAKE_LITP_SNAPSHOT')
+
+    # Seconds a plan task of the fake model takes, per item type, as
+    # "<item type>:<seconds>,..." in MNLIBVIRT_FAKE_PLAN_TASK_TIMINGS
+    fake_plan_task_timings = dict(
+        (timing.split(':')[0], float(timing.split(':')[1]))
+        for timing in os.environ.get('MNLIBVIRT_FAKE_PLAN_TASK_TIMINGS',
+                                     '').split(',') if timing)
+
+    # Model snapshots loaded during this run, keyed by snapshot
+    # directory. Each test works on a copy.
+    fake_litp_models = {}
+
+    def setUp(self):
+        """
+        Description:
+            Give the test its copy of the fake model, if any.
+        """
+        super(FakeLitpModelMixin, self).setUp()
+        self.litp_model = self._get_fake_litp_model() \
+            if self.fake_litp_snapshot else None
+
+    def _get_fake_litp_model(self):
+        """
+        Return a copy of the model snapshot in fake_litp_snapshot, which
+        is only read once per run.
+        """
+        if self.fake_litp_snapshot not in self.fake_litp_models:
+            model = FakeLitpModel(self.fake_plan_task_timings)
+            model.load_snapshot(self.fake_litp_snapshot)
+            self.fake_litp_models[self.fake_litp_snapshot] = model
+        return self.fake_litp_models[self.fake_litp_snapshot].copy()
+
+    def save_model_snapshot(self, ms_node, snapshot_dir):
+        """
+        Description:
+            Save a snapshot of the model on an MS for fake_litp_snapshot:
+            a litp export of each of fake_litp_model.SNAPSHOT_ROOTS, in
+            a directory on the test host.
+
+        Args:
+            ms_node (str): The MS node with the deployment tree.
+
+            snapshot_dir (str): The directory to save the snapshot to.
+        """
+        if not os.path.isdir(snapshot_dir):
+            os.makedirs(snapshot_dir)
+        for url in SNAPSHOT_ROOTS:
+            stdout, _, _ = self.run_command(
+                ms_node, LitpModelCache.get_export_cmd(
+                    url, '/tmp/mnlibvirt_model_export.{0}.xml'.format(
+                        os.getpid())), default_asserts=True)
+            with open(os.path.join(
+                    snapshot_dir,
+                    FakeLitpModel.get_snapshot_filename(url)),
+                      'w') as export_file:
+                export_file.write('\n'.join(stdout) + '\n')
+
+    def _run_fake_litp_cmd(self, method, args, expect_positive=True):
+        """
+        Run a litp CLI command against the fake model, and return and
+        assert its outcome as GenericTest's execute_cli_*_cmd do.
+        """
+        try:
+            method(*args)
+        except FakeLitpError as error:
+            self.assertFalse(expect_positive, str(error))
+            return [], [str(error)], 1
+        self.assertTrue(expect_positive,
+                        'litp command on {0} did not fail'.format(args))
+        return [], [], 0
+
+    def find(self, node, path, resource, *args, **kwargs):
+        """
+        Description:
+            Find items in the model, see GenericTest. With
+            fake_litp_snapshot set, the fake model is searched.
+        """
+        if self.litp_model is None:
+            return super(FakeLitpModelMixin, self).find(
+                node, path, resource, *args, **kwargs)
+        urls = self.litp_model.find(path, resource)
+        if kwargs.get('assert_not_empty', True):
+            self.assertNotEqual([], urls,
+                                'No items of type "{0}" found under '
+                                '{1}'.format(resource, path))
+        return urls
+
+    def get_props_from_url(self, node, url, *args, **kwargs):
+        """
+        Description:
+            Return the properties of an item, see GenericTest. With
+            fake_litp_snapshot set, they come from the fake model.
+        """
+        if self.litp_model is None:
+            return super(FakeLitpModelMixin, self).get_props_from_url(
+                node, url, *args, **kwargs)
+        filter_prop = kwargs.get('filter_prop', args[0] if args else None)
+        item = self.litp_model.get_props(url)
+        self.assertNotEqual(None, item, 'Path not found: {0}'.format(url))
+        if filter_prop is None:
+            return item[1]
+        return item[1].get(filter_prop)
+
+    def get_node_url_from_filename(self, ms_node, filename, *args,
+                                   **kwargs):
+        """
+        Description:
+            Return the model URL of a node, see GenericTest. With
+            fake_litp_snapshot set, it comes from the fake model.
+        """
+        if self.litp_model is None:
+            return super(FakeLitpModelMixin,
+                         self).get_node_url_from_filename(
+                             ms_node, filename, *args, **kwargs)
+        return self.litp_model.get_node_url(
+            self.get_node_att(filename, 'hostname'))
+
+    def get_management_network_name(self, ms_node, *args, **kwargs):
+        """
+        Description:
+            Return the name of the management network, see
+            GenericTest. With fake_litp_snapshot set, it comes from the
+            fake model.
+        """
+        if self.litp_model is None:
+            return super(FakeLitpModelMixin,
+                         self).get_management_network_name(
+                             ms_node, *args, **kwargs)
+        return self.litp_model.get_management_network_name()
+
+    def get_free_ip_by_net_name(self, ms_node, net_name, *args, **kwargs):
+        """
+        Description:
+            Return a free address, or every free address, of a network,
+            see GenericTest. With fake_litp_snapshot set, addresses are
+            free if no item of the fake model uses them.
+        """
+        if self.litp_model is None:
+            return super(FakeLitpModelMixin, self).get_free_ip_by_net_name(
+                ms_node, net_name, *args, **kwargs)
+        free_ips = self.litp_model.get_free_ips(net_name)
+        if kwargs.get('full_list', args[0] if args else False):
+            return free_ips
+        self.assertNotEqual([], free_ips,
+                            'No free address on {0}'.format(net_name))
+        return free_ips[0]
+
+    def get_default_route_path(self, ms_node, *args, **kwargs):
+        """
+        Description:
+            Return the default route of the MS, see GenericTest. With
+            fake_litp_snapshot set, it comes from the fake model.
+        """
+        if self.litp_model is None:
+            return super(FakeLitpModelMixin, self).get_default_route_path(
+                ms_node, *args, **kwargs)
+        return self.litp_model.get_default_route_path('/ms')
+
+    def _apply_fake_model_batch(self, model_batch):
+        """
+        Apply the changes of a LitpModelBatch to the fake model, and
+        return a CmdResult per change as run_cmd_batch would. The
+        changes after a failed one are not applied.
+        """
+        methods = {CREATE: self.litp_model.create,
+                   UPDATE: self.litp_model.update,
+                   INHERIT: self.litp_model.inherit}
+        results = []
+        failed = False
+        for name, change in zip(
+                [name for name, _ in model_batch.get_named_cmds()],
+                model_batch.changes):
+            if failed:
+                results.append(CmdResult(name, [], [], None, None, None))
+                continue
+            start_time = time.time()
+            try:
+                methods[change.action](change.url, *change.args)
+                stderr, return_code = [], 0
+            except FakeLitpError as error:
+                stderr, return_code = [str(error)], 1
+                failed = True
+            results.append(CmdResult(name, [], stderr, return_code,
+                                     start_time, time.time()))
+        return results
+
+    @timed_step
+    def execute_cli_create_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run litp create, see GenericTest. With fake_litp_snapshot
+            set, it is run against the fake model.
+        """
+        if self.litp_model is not None:
+            return self._run_fake_litp_cmd(
+                self.litp_model.create, args[1:4],
+                kwargs.get('expect_positive', True))
+        return super(FakeLitpModelMixin, self).execute_cli_create_cmd(
+            *args, **kwargs)
+
+    @timed_step
+    def execute_cli_update_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run litp update, see GenericTest. With fake_litp_snapshot
+            set, it is run against the fake model.
+        """
+        if self.litp_model is not None:
+            return self._run_fake_litp_cmd(
+                self.litp_model.update, args[1:3],
+                kwargs.get('expect_positive', True))
+        return super(FakeLitpModelMixin, self).execute_cli_update_cmd(
+            *args, **kwargs)
+
+    @timed_step
+    def execute_cli_inherit_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run litp inherit, see GenericTest. With fake_litp_snapshot
+            set, it is run against the fake model.
+        """
+        if self.litp_model is not None:
+            return self._run_fake_litp_cmd(
+                self.litp_model.inherit, args[1:4],
+                kwargs.get('expect_positive', True))
+        return super(FakeLitpModelMixin, self).execute_cli_inherit_cmd(
+            *args, **kwargs)
+
+    @timed_step
+    def execute_cli_remove_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run litp remove, see GenericTest. With fake_litp_snapshot
+            set, it is run against the fake model.
+        """
+        if self.litp_model is not None:
+            return self._run_fake_litp_cmd(
+                self.litp_model.remove, args[1:2],
+                kwargs.get('expect_positive', True))
+        return super(FakeLitpModelMixin, self).execute_cli_remove_cmd(
+            *args, **kwargs)
+
+    @timed_step
+    def execute_cli_createplan_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run litp create_plan, see GenericTest. With
+            fake_litp_snapshot set, the plan is made by the fake model.
+        """
+        if self.litp_model is not None:
+            return self._run_fake_litp_cmd(
+                self.litp_model.create_plan, (),
+                kwargs.get('expect_positive', True))
+        return super(FakeLitpModelMixin, self).execute_cli_createplan_cmd(
+            *args, **kwargs)
+
+    @timed_step
+    def execute_cli_runplan_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run litp run_plan, see GenericTest. With fake_litp_snapshot
+            set, the fake model's plan is run, and ends at once.
+        """
+        if self.litp_model is not None:
+            return self._run_fake_litp_cmd(
+                self.litp_model.run_plan, (),
+                kwargs.get('expect_positive', True))
+        return super(FakeLitpModelMixin, self).execute_cli_runplan_cmd(
+            *args, **kwargs)
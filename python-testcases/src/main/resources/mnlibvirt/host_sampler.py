@@ -0,0 +1,165 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Samples the CPU, memory and disk I/O of a node from /proc
+            while a benchmark runs on it.
+"""
+
+from collections import namedtuple
+
+from remote_cmd_utils import RemoteCmdUtils
+
+# One sample: the node's time, the jiffies the CPUs spent busy, idle and
+# waiting for I/O since boot, total and available memory in kB and the
+# kB paged in and out since boot
+HostSample = namedtuple('HostSample', 'time busy idle iowait mem_total '
+                                      'mem_available paged_in paged_out')
+
+# Longest a sampler is left running, should the test never stop it
+MAX_SAMPLING_SECONDS = 4 * 3600
+
+
+class HostSampler(object):
+    """
+    Runs a sampling loop in the background on a node, and summarises
+    the samples it took once it is stopped.
+    """
+
+    def __init__(self, node, work_path):
+        """
+        Args:
+            node (str): The node to sample.
+
+            work_path (str): Prefix of the sampler's files on the node.
+        """
+        self.node = node
+        self.work_path = work_path
+        self.remote = RemoteCmdUtils()
+        self.samples = []
+
+    def get_sample_script(self, interval):
+        """
+        Function to return the sampling loop, which appends a line per
+        sample to the samples file.
+
+        Args:
+            interval (int): Seconds between two samples.
+
+        Return:
+            list. The lines of the script.
+        """
+        awk_program = (
+            'FILENAME == "/proc/stat" && $1 == "cpu" { '
+            'busy = $2 + $3 + $4 + $7 + $8 + $9; idle = $5; iowait = $6 } '
+            'FILENAME == "/proc/meminfo" { mem[$1] = $2 } '
+            'FILENAME == "/proc/vmstat" { vm[$1] = $2 } '
+            'END { avail = mem["MemAvailable:"]; '
+            'if (avail == "") avail = mem["MemFree:"] + mem["Buffers:"] + '
+            'mem["Cached:"]; '
+            'print t, busy, idle, iowait, mem["MemTotal:"], avail, '
+            'vm["pgpgin"], vm["pgpgout"] }')
+        return [
+            'end=$((SECONDS + {0}))'.format(MAX_SAMPLING_SECONDS),
+            'while [ "$SECONDS" -lt "$end" ]; do',
+            '    /bin/awk -v t="$(/bin/date +%s.%N)" {0} /proc/stat '
+            '/proc/meminfo /proc/vmstat >> {1}.samples'.format(
+                self.remote.quote(awk_program), self.work_path),
+            '    sleep {0}'.format(int(interval)),
+            'done']
+
+    def get_start_cmd(self, interval=1):
+        """
+        Function to return the command which starts sampling. The
+        sampling loop is detached from the command, which returns at
+        once.
+
+        Args:
+            interval (int): Seconds between two samples.
+
+        Return:
+            str. The command.
+        """
+        return self.remote.get_script_cmd([
+            self.remote.get_write_file_cmd(
+                '{0}.sh'.format(self.work_path),
+                self.get_sample_script(interval)),
+            ': > {0}.samples'.format(self.work_path),
+            '/usr/bin/setsid /bin/bash {0}.sh < /dev/null > /dev/null 2>&1 '
+            '&'.format(self.work_path),
+            'echo $! > {0}.pid'.format(self.work_path)])
+
+    def get_stop_cmd(self):
+        """
+        Function to return the command which stops sampling, prints the
+        samples taken and removes the sampler's files.
+
+        Return:
+            str. The command.
+        """
+        # the loop leads its own process group, see get_start_cmd
+        return ('/bin/kill -- -$(/bin/cat {0}.pid) 2>/dev/null; '
+                '/bin/cat {0}.samples; '
+                '/bin/rm -f {0}.sh {0}.pid {0}.samples').format(
+                    self.work_path)
+
+    def update(self, stdout):
+        """
+        Record the samples printed by the stop command.
+
+        Args:
+            stdout (list): The output of the stop command.
+        """
+        self.samples = []
+        for line in stdout:
+            fields = line.split()
+            if len(fields) != len(HostSample._fields):
+                continue
+            try:
+                self.samples.append(
+                    HostSample(*[float(field) for field in fields]))
+            except ValueError:
+                continue
+
+    def get_summary(self):
+        """
+        Function to return the load on the node between the first and
+        the last sample.
+
+        Return:
+            dict. The mean and peak CPU busy and I/O wait percentages
+            and disk read and write rates in kB/s, None if fewer than
+            two samples were taken, and the peak memory used in MB.
+        """
+        rates = dict((name, []) for name in
+                     ('cpu_busy_pct', 'iowait_pct', 'read_kbps',
+                      'write_kbps'))
+        for prev, sample in zip(self.samples, self.samples[1:]):
+            elapsed = sample.time - prev.time
+            jiffies = (sample.busy + sample.idle + sample.iowait) - \
+                (prev.busy + prev.idle + prev.iowait)
+            if elapsed <= 0 or jiffies <= 0:
+                continue
+            rates['cpu_busy_pct'].append(
+                100.0 * (sample.busy - prev.busy) / jiffies)
+            rates['iowait_pct'].append(
+                100.0 * (sample.iowait - prev.iowait) / jiffies)
+            rates['read_kbps'].append(
+                (sample.paged_in - prev.paged_in) / elapsed)
+            rates['write_kbps'].append(
+                (sample.paged_out - prev.paged_out) / elapsed)
+
+        summary = {}
+        for name, values in rates.items():
+            summary['mean_' + name] = \
+                sum(values) / len(values) if values else None
+            summary['max_' + name] = max(values) if values else None
+        summary['max_mem_used_mb'] = \
+            max((sample.mem_total - sample.mem_available) / 1024.0
+                for sample in self.samples) if self.samples else None
+        return summary
@@ -0,0 +1,200 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Listing of a vm-service's instance directory, including
+            the copies stop-undefine archives to last_undefined_vm.
+"""
+
+import os
+from collections import namedtuple
+
+from step_timer import timed_step
+from vm_config import VMConfig
+
+# Subdirectory of the instance directory stop-undefine archives the
+# image and the .live files of the VM to
+ARCHIVE_DIR = 'last_undefined_vm'
+
+# Suffix of the files the adaptor generates from the instance data
+LIVE_SUFFIX = '.live'
+
+
+class ManifestEntry(namedtuple('ManifestEntry', 'name size mtime md5')):
+    """
+    A file of the manifest. mtime is in epoch seconds; md5 is None
+    unless the file's checksum was asked for.
+    """
+    __slots__ = ()
+
+
+class InstanceDirManifest(object):
+    """
+    The files of an instance directory, keyed by name, and the files
+    archived in its last_undefined_vm directory, keyed by the name they
+    had before the timestamp suffix was appended to it.
+
+    config holds the parsed config.json of the directory, if it was
+    read along with the files.
+    """
+
+    def __init__(self, files, archived, archive_suffixes, config=None):
+        """
+        Args:
+            files (dict): ManifestEntry by name, of the instance dir.
+
+            archived (dict): ManifestEntry by unsuffixed name, of the
+                             last_undefined_vm dir.
+
+            archive_suffixes (set): The timestamp suffixes found in the
+                                    last_undefined_vm dir.
+
+            config (VMConfig): The config.json of the directory.
+        """
+        self.files = files
+        self.archived = archived
+        self.archive_suffixes = archive_suffixes
+        self.config = config
+
+    @staticmethod
+    def get_find_cmd(instance_dir):
+        """
+        Function to return a command which lists the files of an
+        instance directory and of its last_undefined_vm directory, one
+        per line as "<path>\\t<size>\\t<mtime>".
+
+        Args:
+            instance_dir (str): The instance directory.
+
+        Return:
+            str. The command.
+        """
+        return ("/bin/find {0} -mindepth 1 -maxdepth 2 -type f "
+                "-printf '%P\\t%s\\t%T@\\n'".format(instance_dir))
+
+    @staticmethod
+    def get_md5_cmd(instance_dir, names):
+        """
+        Function to return a command which prints the md5sum of some
+        files of an instance directory and of their archived copies in
+        its last_undefined_vm directory.
+
+        Args:
+            instance_dir (str): The instance directory.
+
+            names (list): The names of the files, e.g. the VM's image.
+
+        Return:
+            str. The command.
+        """
+        paths = []
+        for name in names:
+            paths.extend(["-path './{0}'".format(name),
+                          "-path './{0}/{1}-*'".format(ARCHIVE_DIR, name)])
+        return ("cd {0} && /bin/find . -mindepth 1 -maxdepth 2 -type f "
+                "\\( {1} \\) -exec /usr/bin/md5sum {{}} +".format(
+                    instance_dir, ' -o '.join(paths)))
+
+    @classmethod
+    def from_lines(cls, find_lines, md5_lines=None):
+        """
+        Function to return the manifest from the output of the commands
+        of get_find_cmd and get_md5_cmd.
+
+        Files of other subdirectories of the instance directory are left
+        out.
+
+        Args:
+            find_lines (list): The output of the get_find_cmd command.
+
+            md5_lines (list): The output of the get_md5_cmd command.
+
+        Return:
+            InstanceDirManifest. The manifest.
+        """
+        checksums = {}
+        for line in md5_lines or []:
+            md5, path = line.split(None, 1)
+            checksums[path[2:] if path.startswith('./') else path] = md5
+        files = {}
+        archived = {}
+        archive_suffixes = set()
+        for line in find_lines:
+            if not line.strip():
+                continue
+            path, size, mtime = line.rsplit('\t', 2)
+            dir_name, _, name = path.rpartition('/')
+            entry = ManifestEntry(name, int(size), float(mtime),
+                                  checksums.get(path))
+            if not dir_name:
+                files[name] = entry
+            elif dir_name == ARCHIVE_DIR:
+                original_name, _, suffix = name.rpartition('-')
+                archived[original_name] = entry
+                archive_suffixes.add(suffix)
+        return cls(files, archived, archive_suffixes)
+
+    def get_live_files(self):
+        """
+        Function to return the names of the .live files of the instance
+        directory.
+
+        Return:
+            set. The names.
+        """
+        return set(name for name in self.files
+                   if name.endswith(LIVE_SUFFIX))
+
+
+class InstanceDirManifestMixin(object):
+    """
+    Test helper listing an instance directory as an InstanceDirManifest.
+    """
+
+    @timed_step
+    def get_instance_dir_manifest(self, node, instance_dir,
+                                  checksum_files=None, read_config=True):
+        """
+        Description:
+            List the files of a vm-service's instance directory and of
+            its last_undefined_vm directory, with their sizes and
+            mtimes, in a single round trip.
+
+        Args:
+            node (str): The node the vm-service runs on.
+
+            instance_dir (str): The instance directory.
+
+            checksum_files (list): Names of files of the instance
+                                   directory whose md5sum is taken
+                                   too, with that of their archived
+                                   copies.
+
+            read_config (bool): If True, the config.json of the
+                                directory is read and parsed too.
+
+        Returns:
+            InstanceDirManifest. The files of the directories.
+        """
+        named_cmds = [('find', InstanceDirManifest.get_find_cmd(
+            instance_dir))]
+        if checksum_files:
+            named_cmds.append(('md5sum', InstanceDirManifest.get_md5_cmd(
+                instance_dir, checksum_files)))
+        if read_config:
+            named_cmds.append(('config', '/bin/cat {0}'.format(
+                os.path.join(instance_dir, 'config.json'))))
+        results = dict((result.name, result)
+                       for result in self.run_cmd_batch(node, named_cmds))
+        self.assert_cmd_results_ok(results.values())
+        manifest = InstanceDirManifest.from_lines(
+            results['find'].stdout,
+            results['md5sum'].stdout if checksum_files else None)
+        if read_config:
+            manifest.config = VMConfig.from_lines(results['config'].stdout)
+        return manifest
@@ -0,0 +1,222 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Percentile summaries of benchmark latencies, and the
+            reports of the benchmark test sets.
+"""
+
+import json
+import math
+import os
+import time
+
+from timing_history import RUN_ID
+
+# Percentiles reported for every group of samples
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyStats(object):
+    """
+    Latency samples in seconds, grouped by a key such as
+    (image type, adaptor verb), kept in the order the keys were first
+    seen.
+    """
+
+    def __init__(self, key_names):
+        """
+        Args:
+            key_names (tuple): The names of the fields of a key, e.g.
+                               ("image", "verb"), used in the summary.
+        """
+        self.key_names = tuple(key_names)
+        self.keys = []
+        self.samples = {}
+        self.failures = {}
+
+    def _get_key(self, key):
+        """
+        Return a key as a tuple, recording it the first time it is seen.
+        """
+        key = tuple(key)
+        if key not in self.samples:
+            self.keys.append(key)
+            self.samples[key] = []
+            self.failures[key] = 0
+        return key
+
+    def add(self, key, seconds):
+        """
+        Record a latency.
+
+        Args:
+            key (tuple): The group of the sample.
+
+            seconds (float): The latency.
+        """
+        self.samples[self._get_key(key)].append(seconds)
+
+    def add_failure(self, key):
+        """
+        Record a failed attempt, which has no latency.
+
+        Args:
+            key (tuple): The group of the attempt.
+        """
+        self.failures[self._get_key(key)] += 1
+
+    @staticmethod
+    def get_percentile(samples, percentile):
+        """
+        Function to return a percentile of a set of samples, by the
+        nearest rank method.
+
+        Args:
+            samples (list): The samples.
+
+            percentile (int): The percentile, from 1 to 100.
+
+        Return:
+            float. The sample at the percentile, or None if there are no
+            samples.
+        """
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = int(math.ceil(percentile / 100.0 * len(ordered)))
+        return ordered[max(rank, 1) - 1]
+
+    def get_summary(self):
+        """
+        Function to return the statistics of every group.
+
+        Return:
+            list. A dict per group, in the order the groups were first
+            seen, holding the key fields, "count", "failures", "min",
+            "mean", "max" and "p<percentile>" for each of PERCENTILES.
+            The statistics of a group with no samples are None.
+        """
+        summary = []
+        for key in self.keys:
+            samples = self.samples[key]
+            group = dict(zip(self.key_names, key))
+            group['count'] = len(samples)
+            group['failures'] = self.failures[key]
+            group['min'] = min(samples) if samples else None
+            group['max'] = max(samples) if samples else None
+            group['mean'] = \
+                sum(samples) / len(samples) if samples else None
+            for percentile in PERCENTILES:
+                group['p{0}'.format(percentile)] = \
+                    self.get_percentile(samples, percentile)
+            summary.append(group)
+        return summary
+
+    def get_failed_keys(self):
+        """
+        Function to return the groups with failed attempts.
+
+        Return:
+            list. The keys of the groups, in the order first seen.
+        """
+        return [key for key in self.keys if self.failures[key]]
+
+    def format_summary(self):
+        """
+        Function to return the summary as lines of a table, for the log.
+
+        Return:
+            list. A header line and a line per group, latencies in
+            seconds.
+        """
+        stat_names = ['p{0}'.format(percentile)
+                      for percentile in PERCENTILES] + ['max']
+        lines = [' '.join(['{0:<24}'.format('/'.join(self.key_names))] +
+                          ['{0:>8}'.format(name) for name in
+                           ['count', 'failed'] + stat_names])]
+        for group in self.get_summary():
+            key = '/'.join(str(group[name]) for name in self.key_names)
+            values = ['{0:>8}'.format(group['count']),
+                      '{0:>8}'.format(group['failures'])]
+            for name in stat_names:
+                if group[name] is None:
+                    values.append('{0:>8}'.format('-'))
+                else:
+                    values.append('{0:>8.2f}'.format(group[name]))
+            lines.append(' '.join(['{0:<24}'.format(key)] + values))
+        return lines
+
+
+class BenchmarkMixin(object):
+    """
+    Test helpers for the benchmark test sets.
+    """
+
+    # Iterations run by the benchmark test sets
+    benchmark_iterations = int(
+        os.environ.get('MNLIBVIRT_BENCHMARK_ITERATIONS', '20'))
+
+    # Directory on the test host the benchmark reports are written to.
+    # Defaults to one for this run under the job's workspace
+    benchmark_report_dir = os.environ.get('MNLIBVIRT_BENCHMARK_DIR') or (
+        os.path.join(os.environ['WORKSPACE'], 'mnlibvirt_benchmarks',
+                     RUN_ID) if os.environ.get('WORKSPACE') else None)
+
+    def make_benchmark_report_dir(self):
+        """
+        Description:
+            Create benchmark_report_dir on the test host if it does not
+            exist yet. Asserts that it is set, so that a benchmark fails
+            before it runs rather than when its report is written.
+
+        Returns:
+            str. The directory.
+        """
+        self.assertTrue(self.benchmark_report_dir,
+                        'No directory for the benchmark report: set '
+                        'MNLIBVIRT_BENCHMARK_DIR, or WORKSPACE to the '
+                        'job workspace')
+        try:
+            os.makedirs(self.benchmark_report_dir)
+        except OSError:
+            # ANOTHER PROCESS OF THE RUN MAY HAVE CREATED IT
+            if not os.path.isdir(self.benchmark_report_dir):
+                raise
+        return self.benchmark_report_dir
+
+    def write_benchmark_report(self, benchmark_name, report):
+        """
+        Description:
+            Write a benchmark report as JSON to benchmark_report_dir on
+            the test host, named after the benchmark and the test
+            invocation. Without MNLIBVIRT_BENCHMARK_DIR set, that is a
+            directory for the run under the job's WORKSPACE.
+
+        Args:
+            benchmark_name (str): The name of the benchmark.
+
+            report (dict): The results. The benchmark name, the test id
+                           and the time are added to them.
+
+        Returns:
+            str. The path of the report.
+        """
+        report = dict(report)
+        report['benchmark'] = benchmark_name
+        report['test'] = self.id()
+        report['written'] = time.time()
+        report_path = os.path.join(
+            self.make_benchmark_report_dir(),
+            'mnlibvirt_{0}_{1}.json'.format(benchmark_name,
+                                            self.test_token))
+        with open(report_path, 'w') as report_file:
+            json.dump(report, report_file, indent=2, sort_keys=True)
+        self.log("info", 'Benchmark report written to {0}'.format(
+            report_path))
+        return report_path
@@ -0,0 +1,317 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Common base for the libvirt adaptor test sets.
+"""
+
+import os
+import uuid
+
+from litp_generic_test import GenericTest
+from json_utils import JSONUtils
+from redhat_cmd_utils import RHCmdUtils
+import test_constants
+from adaptor_cmd_utils import AdaptorCmdUtils, AdaptorWatchdogMixin
+from fake_litp_model import FakeLitpModelMixin
+from instance_dir_manifest import InstanceDirManifestMixin
+from latency_stats import BenchmarkMixin
+from litp_model_batch import ModelBatchMixin
+from litp_model_cache import ModelCacheMixin
+from log_follower import LogFollowerMixin
+from networking_utils import NetworkingUtils
+from node_lease import NodeLeaseMixin
+from plan_monitor import PlanMonitorMixin
+from remote_cmd_utils import RemoteCmdUtils
+from step_timer import timed_step
+from stop_undefine_timeline import StopUndefineTimelineMixin
+from timing_history import StepTimesMixin
+from vm_config import VMConfigMixin
+from vm_image_utils import VMImageUtils, ImageStagingMixin, \
+    PROVISION_CLONE, PROVISION_COPY
+
+
+class LibvirtAdaptorTest(StepTimesMixin, AdaptorWatchdogMixin,
+                         NodeLeaseMixin, ImageStagingMixin, ModelBatchMixin,
+                         ModelCacheMixin, FakeLitpModelMixin,
+                         PlanMonitorMixin, LogFollowerMixin,
+                         StopUndefineTimelineMixin, InstanceDirManifestMixin,
+                         VMConfigMixin, BenchmarkMixin, GenericTest):
+    """
+    Base class for the libvirt adaptor test sets, holding the helpers
+    they share. The helpers of each feature are mixed in from the
+    module of the feature; this class sets what they need from
+    test_constants and runs the remote commands they build.
+    """
+
+    # Whether the test sets run against the stand-in hypervisor of
+    # fake_hypervisor rather than libvirt
+    fake_hypervisor = os.environ.get('MNLIBVIRT_FAKE_HYPERVISOR') == '1'
+
+    # How images are provisioned into the libvirt image directory, see
+    # VMImageUtils.get_provision_cmd. A fake image is only copied
+    # faithfully.
+    image_provision_mode = \
+        PROVISION_COPY if fake_hypervisor else PROVISION_CLONE
+
+    # Seconds an adaptor verb is given when run from a remote script
+    adaptor_cmd_timeout = 600
+
+    # Paths and names on the nodes and the MS, for the mixed in helpers
+    libvirt_log = test_constants.LITP_LIBVIRT_LOG
+    instances_dir = test_constants.LIBVIRT_INSTANCES_DIR
+    libvirt_image_dir = test_constants.LIBVIRT_IMAGE_DIR
+    ms_image_dir = test_constants.VM_IMAGE_MS_DIR
+    adaptor_pkg_name = test_constants.LIBVIRT_ADAPTOR_PKG_NAME
+    plan_complete_state = test_constants.PLAN_COMPLETE
+
+    def setUp(self):
+        """
+        Description:
+            Runs before every single test
+        Actions:
+            Create the utility objects used by the shared helpers
+        Results:
+            Class variables that are required to execute tests
+        """
+        super(LibvirtAdaptorTest, self).setUp()
+        self.image_utils = VMImageUtils(self.libvirt_image_dir)
+        self.adaptor_cmds = AdaptorCmdUtils()
+        self.remote_cmds = RemoteCmdUtils()
+        self.rh_cmds = RHCmdUtils()
+        self.json_utils = JSONUtils()
+        self.net_utils = NetworkingUtils()
+        self.test_token = uuid.uuid4().hex[:8]
+        self.boot_times = {}
+        self.node_cmd_queues = {}
+
+    def run_command(self, node, cmd, *args, **kwargs):
+        """
+        Description:
+            Run a command on a node, see GenericTest, counting it and
+            the bytes it moved against the current step.
+        """
+        stdout, stderr, return_code = super(
+            LibvirtAdaptorTest, self).run_command(node, cmd, *args,
+                                                  **kwargs)
+        if self.step_timer is not None:
+            self.step_timer.count_cmd(
+                len(cmd), sum(len(line) + 1 for line in
+                              (stdout or []) + (stderr or [])))
+        return stdout, stderr, return_code
+
+    def get_test_name(self, name):
+        """
+        Description:
+            Return a name unique to the current test invocation, for the
+            VM names, instance directories and image files it creates on
+            a node. Tests using these names never touch each other's
+            artifacts, so they may run concurrently on one node.
+
+        Args:
+            name (str): The base name, e.g. "testapp6209_0" or
+                        "rhel.img". The extension of a file name is
+                        kept.
+
+        Returns:
+            str. The name with the test's token appended, e.g.
+            "testapp6209_0_1f2e3d4c" or "rhel_1f2e3d4c.img".
+        """
+        root, ext = os.path.splitext(name)
+        return '{0}_{1}{2}'.format(root, self.test_token, ext)
+
+    def get_pkg_version(self, node, pkg_name):
+        """
+        Description:
+            Return the version of an installed package.
+
+        Args:
+            node (str): The node the package is installed on.
+
+            pkg_name (str): The package name.
+
+        Returns:
+            str. "<version>-<release>", or None if it is not installed.
+        """
+        stdout, _, return_code = self.run_command(
+            node, "/bin/rpm -q --qf '%{{VERSION}}-%{{RELEASE}}\\n' "
+            "{0}".format(pkg_name))
+        if return_code != 0 or not stdout:
+            return None
+        return stdout[0]
+
+    def run_parallel_cmds(self, node, named_cmds):
+        """
+        Description:
+            Run commands concurrently on a node as root, in a single
+            remote command.
+
+        Args:
+            node (str): The node to run the commands on.
+
+            named_cmds (list): (name, command) pairs.
+
+        Returns:
+            list. A CmdResult per command, in the order given.
+        """
+        names = [name for name, _ in named_cmds]
+        script = self.remote_cmds.get_parallel_script(
+            [cmd for _, cmd in named_cmds])
+        stdout, _, _ = self.run_command(
+            node, self.remote_cmds.get_script_cmd(script), su_root=True)
+        return self.remote_cmds.parse_script_output(names, stdout)
+
+    def queue_node_cmd(self, node, name, cmd):
+        """
+        Description:
+            Queue a command to be run on a node as root by the next
+            flush_node_cmds call for that node. Queued commands are
+            pipelined, so any number of them cost a single round trip.
+
+        Args:
+            node (str): The node to run the command on.
+
+            name (str): A name for the command, reported in its result.
+
+            cmd (str): The command.
+        """
+        self.node_cmd_queues.setdefault(node, []).append((name, cmd))
+
+    def flush_node_cmds(self, node):
+        """
+        Description:
+            Run the commands queued for a node one after the other in a
+            single remote command, and empty the queue.
+
+        Args:
+            node (str): The node whose queue is flushed.
+
+        Returns:
+            list. A CmdResult per queued command, in the order queued.
+        """
+        return self.run_cmd_batch(node, self.node_cmd_queues.pop(node, []))
+
+    def run_cmd_batch(self, node, named_cmds, su_root=True,
+                      stop_on_error=False):
+        """
+        Description:
+            Run commands one after the other on a node, in a single
+            remote command. Unless stop_on_error is given, every command
+            is run whatever the outcome of those before it, so callers
+            check each result as they would the output of separate
+            run_command calls.
+
+        Args:
+            node (str): The node to run the commands on.
+
+            named_cmds (list): (name, command) pairs.
+
+            su_root (bool): If True, the commands are run as root.
+
+            stop_on_error (bool): If True, the commands after the first
+                                  one to fail are not run, and are
+                                  reported with a return code of None.
+
+        Returns:
+            list. A CmdResult per command, in the order given.
+        """
+        if not named_cmds:
+            return []
+        script = self.remote_cmds.get_sequential_script(
+            [cmd for _, cmd in named_cmds], stop_on_error=stop_on_error)
+        stdout, _, _ = self.run_command(
+            node, self.remote_cmds.get_script_cmd(script), su_root=su_root)
+        return self.remote_cmds.parse_script_output(
+            [name for name, _ in named_cmds], stdout)
+
+    def assert_cmd_results_ok(self, results):
+        """
+        Description:
+            Assert that every command of a batch returned 0 and wrote
+            nothing to stderr.
+
+        Args:
+            results (list): The CmdResults of the batch.
+        """
+        for result in results:
+            self.assertEqual(0, result.rc,
+                             '"{0}" failed with return code {1}: {2}'.format(
+                                 result.name, result.rc, result.stderr))
+            self.assertEqual([], result.stderr,
+                             '"{0}" wrote to stderr: {1}'.format(
+                                 result.name, result.stderr))
+
+    @timed_step
+    def run_vm_lifecycle_parallel(self, node, vm_service_names, banner,
+                                  steps=('start', 'boot', 'status',
+                                         'stop')):
+        """
+        Description:
+            Take a set of provisioned vm-services through their
+            lifecycle concurrently. Each step is run against every VM at
+            once in a single remote command, so the lifecycle of N VMs
+            takes roughly as long as that of one.
+
+            The "boot" step waits for the login banner on each VM's
+            console; every other step is an adaptor verb, run through
+            the vm-service's service as run_libvirt_service_cmd runs
+            it. A VM whose step fails is not taken through the later
+            steps, the other VMs carry on. Per VM and per step timings
+            are logged.
+
+        Args:
+            node (str): The node the vm-services are provisioned on.
+
+            vm_service_names (list): The vm-services to run.
+
+            banner (str): The login banner the VMs print once booted.
+
+            steps (tuple): The steps to run, in order.
+
+        Returns:
+            dict. For each vm-service, a list of CmdResult, one per
+            step it was taken through.
+        """
+        results = dict((vm_name, []) for vm_name in vm_service_names)
+        failed = []
+        for step in steps:
+            vm_names = [vm_name for vm_name in vm_service_names
+                        if vm_name not in failed]
+            if not vm_names:
+                break
+            if step == 'boot':
+                named_cmds = [
+                    (step, self.adaptor_cmds.get_console_wait_cmd(
+                        vm_name, banner, self.vm_boot_deadline))
+                    for vm_name in vm_names]
+            else:
+                named_cmds = [
+                    (step, self.adaptor_cmds.get_service_cmd(
+                        vm_name, step, self.adaptor_cmd_timeout))
+                    for vm_name in vm_names]
+            step_results = self.run_parallel_cmds(node, named_cmds)
+            for vm_name, result in zip(vm_names, step_results):
+                results[vm_name].append(result)
+                if step == 'boot':
+                    self.boot_times.setdefault(vm_name, []).append(
+                        result.duration)
+                if result.rc != 0:
+                    failed.append(vm_name)
+
+        for vm_name in vm_service_names:
+            timings = ['{0} {1:.1f}s rc={2}'.format(result.name,
+                                                    result.duration,
+                                                    result.rc)
+                       for result in results[vm_name]]
+            self.log("info", 'VM "{0}" lifecycle: {1}'.format(
+                vm_name, ', '.join(timings)))
+        self.assertEqual([], failed,
+                         'Lifecycle failed for VMs {0}: {1}'.format(
+                             failed, dict((vm_name, results[vm_name][-1])
+                                          for vm_name in failed)))
+        return results
@@ -0,0 +1,189 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Batches LITP model changes into one remote command.
+"""
+
+from collections import namedtuple
+
+from step_timer import timed_step
+
+# One queued model change. args are the arguments of the LitpModelBatch
+# method which queued it, after the URL.
+ModelChange = namedtuple('ModelChange', 'action url cmd args')
+
+# Model change actions
+CREATE = 'create'
+UPDATE = 'update'
+INHERIT = 'inherit'
+
+
+class LitpModelBatch(object):
+    """
+    An ordered list of litp create, update and inherit commands.
+    """
+
+    def __init__(self):
+        """
+        Start with no changes.
+        """
+        self.changes = []
+
+    def create(self, url, class_type, options=''):
+        """
+        Queue the creation of an item, as for execute_cli_create_cmd.
+
+        Args:
+            url (str): The URL of the item.
+
+            class_type (str): The item type.
+
+            options (str): The item's properties, as for litp create -o.
+        """
+        cmd = '/usr/bin/litp create -p {0} -t {1}'.format(url, class_type)
+        if options:
+            cmd += ' -o {0}'.format(options)
+        self.changes.append(ModelChange(CREATE, url, cmd,
+                                        (class_type, options)))
+
+    def update(self, url, options):
+        """
+        Queue an update of an item's properties, as for
+        execute_cli_update_cmd.
+
+        Args:
+            url (str): The URL of the item.
+
+            options (str): The properties, as for litp update -o.
+        """
+        cmd = '/usr/bin/litp update -p {0} -o {1}'.format(url, options)
+        self.changes.append(ModelChange(UPDATE, url, cmd, (options,)))
+
+    def inherit(self, url, source_url, options=''):
+        """
+        Queue the creation of a reference, as for
+        execute_cli_inherit_cmd.
+
+        Args:
+            url (str): The URL of the reference.
+
+            source_url (str): The URL of the item it refers to.
+
+            options (str): Properties overridden in the reference.
+        """
+        cmd = '/usr/bin/litp inherit -p {0} -s {1}'.format(url, source_url)
+        if options:
+            cmd += ' -o {0}'.format(options)
+        self.changes.append(ModelChange(INHERIT, url, cmd,
+                                        (source_url, options)))
+
+    def get_named_cmds(self):
+        """
+        Function to return the queued changes as commands for a batch.
+
+        Return:
+            list. (name, command) pairs, named "<action> <url>".
+        """
+        return [('{0} {1}'.format(change.action, change.url), change.cmd)
+                for change in self.changes]
+
+    def get_created_urls(self):
+        """
+        Function to return the URLs of the items the batch adds to the
+        model.
+
+        Return:
+            list. The URLs of the created items and references.
+        """
+        return [change.url for change in self.changes
+                if change.action in (CREATE, INHERIT)]
+
+    @staticmethod
+    def get_top_level_urls(urls):
+        """
+        Function to return the URLs which do not lie under another URL
+        of a list. Removing these removes every item in the list.
+
+        Args:
+            urls (list): Model URLs.
+
+        Return:
+            list. The top level URLs, in the order given.
+        """
+        return [url for url in urls
+                if not any(url.startswith(other.rstrip('/') + '/')
+                           for other in urls if other != url)]
+
+
+class ModelBatchMixin(object):
+    """
+    Test helper applying a LitpModelBatch to the model.
+    """
+
+    def setUp(self):
+        """
+        Description:
+            Start the test with no batch created items.
+        """
+        super(ModelBatchMixin, self).setUp()
+        self.batch_created_urls = []
+
+    @timed_step
+    def apply_model_batch(self, ms_node, model_batch):
+        """
+        Description:
+            Apply the changes queued in a LitpModelBatch to the model
+            from a single remote command. The command runs one litp CLI
+            call per change, one after the other, on the MS: only the
+            round trip of each change is saved, not its litp call. The
+            changes stop at the first failure, which is asserted against
+            the item it concerns.
+
+            The items added are registered for removal with the test's
+            cleanups, through execute_cli_remove_cmd, as the items
+            created with execute_cli_create_cmd are. An item under an
+            item already registered is removed with it. With
+            fake_litp_snapshot set, the changes are applied to the fake
+            model, which is dropped when the test ends.
+
+        Args:
+            ms_node (str): The MS node with the deployment tree.
+
+            model_batch (LitpModelBatch): The changes to apply.
+
+        Returns:
+            list. A CmdResult per change, in the order queued.
+        """
+        self.model_cache.clear()
+        if self.litp_model is not None:
+            results = self._apply_fake_model_batch(model_batch)
+        else:
+            results = self.run_cmd_batch(ms_node,
+                                         model_batch.get_named_cmds(),
+                                         su_root=False, stop_on_error=True)
+            created_urls = [
+                change.url
+                for change, result in zip(model_batch.changes, results)
+                if result.rc == 0 and change.action in (CREATE, INHERIT)]
+            for url in LitpModelBatch.get_top_level_urls(
+                    self.batch_created_urls + created_urls):
+                if url in created_urls:
+                    self.addCleanup(self.execute_cli_remove_cmd, ms_node,
+                                    url)
+            self.batch_created_urls.extend(created_urls)
+        self.log("info", 'Applied {0} model changes in {1:.1f}s'.format(
+            len([result for result in results if result.rc == 0]),
+            sum(result.duration for result in results
+                if result.rc is not None)))
+        for result in results:
+            self.assertEqual(0, result.rc,
+                             'Model change "{0}" failed: {1}'.format(
+                                 result.name,
+                                 result.stderr or result.stdout))
+        return results
@@ -0,0 +1,307 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   In memory copy of LITP model subtrees, loaded from a single
+            litp export per subtree, and the model lookups served from
+            it.
+"""
+
+import os
+import xml.etree.ElementTree as ET
+
+# Namespace of the item elements in a litp export
+LITP_NAMESPACE = 'http://www.ericsson.com/litp'
+
+# Suffix of the element tags of collections and references, which are
+# not item types
+COLLECTION_SUFFIX = '-collection'
+INHERIT_SUFFIX = '-inherit'
+
+
+class LitpModelCache(object):
+    """
+    Holds the items of LITP model subtrees, keyed by URL, so that finds
+    and property lookups against them need no litp CLI call.
+
+    The cache does not follow model changes; it must be cleared whenever
+    the model is modified.
+    """
+
+    def __init__(self):
+        """
+        Start with an empty cache.
+        """
+        self.roots = []
+        self.items = {}
+
+    @staticmethod
+    def get_export_cmd(url, export_path):
+        """
+        Function to return the command which prints the XML export of a
+        model subtree.
+
+        Args:
+            url (str): The root of the subtree.
+
+            export_path (str): Scratch file for the export on the MS.
+
+        Return:
+            str. The command, whose output is the export.
+        """
+        return ('/usr/bin/litp export -p {0} -f {1} && /bin/cat {1}; '
+                'rc=$?; /bin/rm -f {1}; exit $rc').format(url, export_path)
+
+    def clear(self):
+        """
+        Forget every cached subtree.
+        """
+        self.roots = []
+        self.items = {}
+
+    def covers(self, url):
+        """
+        Function to check whether a URL lies in a cached subtree.
+
+        Args:
+            url (str): The model URL.
+
+        Return:
+            bool. True if the URL lies in a cached subtree.
+        """
+        url = url.rstrip('/') or '/'
+        for root in self.roots:
+            if url == root or url.startswith(root.rstrip('/') + '/'):
+                return True
+        return False
+
+    def load(self, url, export_lines):
+        """
+        Add a subtree to the cache from its XML export.
+
+        Args:
+            url (str): The root of the exported subtree.
+
+            export_lines (list): The lines of the export.
+        """
+        url = url.rstrip('/') or '/'
+        root = ET.fromstring('\n'.join(export_lines).encode('utf-8'))
+        parent_url = url.rsplit('/', 1)[0]
+        self._load_element(root, parent_url)
+        self.roots.append(url)
+
+    def _load_element(self, element, parent_url):
+        """
+        Add an item element and its descendants to the cache.
+        """
+        item_type = element.tag.split('}', 1)[-1]
+        url = '{0}/{1}'.format(parent_url.rstrip('/'), element.get('id'))
+        props = {}
+        for child in element:
+            if child.tag.startswith('{{{0}}}'.format(LITP_NAMESPACE)):
+                self._load_element(child, url)
+            else:
+                props[child.tag] = (child.text or '').strip()
+        self.items[url] = (item_type, props)
+
+    def find(self, path, resource_type):
+        """
+        Function to return the URLs of the cached items of a type under
+        a path, as for GenericTest.find.
+
+        Args:
+            path (str): The path to search under.
+
+            resource_type (str): The item type to find.
+
+        Return:
+            list. The sorted URLs of the matching items.
+        """
+        prefix = path.rstrip('/') + '/'
+        return sorted(url for url, (item_type, _) in self.items.items()
+                      if item_type == resource_type and
+                      (url + '/').startswith(prefix))
+
+    def get_props(self, url):
+        """
+        Function to return the properties of a cached item.
+
+        The properties of a reference are incomplete, as those it
+        inherits from its source are not part of the export.
+
+        Args:
+            url (str): The URL of the item.
+
+        Return:
+            tuple. The item type and a dict of its properties, or None
+            if the item is not cached.
+        """
+        return self.items.get(url.rstrip('/'))
+
+    @staticmethod
+    def is_complete_type(item_type):
+        """
+        Function to check whether every property of an item of a type is
+        held in its export.
+
+        Args:
+            item_type (str): The element tag of the item.
+
+        Return:
+            bool. False for references and collections.
+        """
+        return not (item_type.endswith(INHERIT_SUFFIX) or
+                    item_type.endswith(COLLECTION_SUFFIX))
+
+
+class ModelCacheMixin(object):
+    """
+    Test helpers reading the model through a LitpModelCache, which is
+    cleared by every helper changing the model.
+
+    With a fake model set up, see FakeLitpModelMixin, the lookups go
+    to it instead.
+    """
+
+    def setUp(self):
+        """
+        Description:
+            Start the test with an empty model cache.
+        """
+        super(ModelCacheMixin, self).setUp()
+        self.model_cache = LitpModelCache()
+
+    def _cache_model_subtree(self, ms_node, url):
+        """
+        Load a model subtree into the model cache with a single litp
+        export, and return True if it was loaded.
+        """
+        export_cmd = self.model_cache.get_export_cmd(
+            url, '/tmp/mnlibvirt_model_export.{0}.xml'.format(os.getpid()))
+        stdout, _, return_code = self.run_command(ms_node, export_cmd)
+        if return_code != 0 or not stdout:
+            return False
+        self.model_cache.load(url, stdout)
+        return True
+
+    def find_cached(self, ms_node, path, resource_type,
+                    assert_not_empty=True):
+        """
+        Description:
+            Find items in the model as for find, from the model cache.
+            The subtree under path is exported into the cache the first
+            time it is searched, and every later find or property
+            lookup in it is served from memory until the model is
+            modified.
+
+        Args:
+            ms_node (str): The MS node with the deployment tree.
+
+            path (str): The path to search under.
+
+            resource_type (str): The item type to find.
+
+            assert_not_empty (bool): If True, assert that an item is
+                                     found.
+
+        Returns:
+            list. The URLs of the items found.
+        """
+        if self.litp_model is not None:
+            return self.find(ms_node, path, resource_type,
+                             assert_not_empty=assert_not_empty)
+        if not self.model_cache.covers(path) and \
+                not self._cache_model_subtree(ms_node, path):
+            return self.find(ms_node, path, resource_type,
+                             assert_not_empty=assert_not_empty)
+        urls = self.model_cache.find(path, resource_type)
+        if assert_not_empty:
+            self.assertNotEqual([], urls,
+                                'No items of type "{0}" found under '
+                                '{1}'.format(resource_type, path))
+        return urls
+
+    def get_cached_props(self, ms_node, url, filter_prop=None):
+        """
+        Description:
+            Return the properties of an item as for get_props_from_url,
+            from the model cache. Items outside the cached subtrees, and
+            properties missing from the export such as those a
+            reference inherits, are read from the model itself.
+
+        Args:
+            ms_node (str): The MS node with the deployment tree.
+
+            url (str): The URL of the item.
+
+            filter_prop (str): If given, only this property is returned.
+
+        Returns:
+            dict. The item's properties, or the value of filter_prop,
+            or None if the item has no such property.
+        """
+        if self.litp_model is not None:
+            return self.get_props_from_url(ms_node, url,
+                                           filter_prop=filter_prop)
+        if not self.model_cache.covers(url):
+            self._cache_model_subtree(ms_node, url)
+        cached = self.model_cache.get_props(url)
+        if cached is not None:
+            item_type, props = cached
+            if filter_prop is None and \
+                    self.model_cache.is_complete_type(item_type):
+                return dict(props)
+            if filter_prop is not None and filter_prop in props:
+                return props[filter_prop]
+        return self.get_props_from_url(ms_node, url,
+                                       filter_prop=filter_prop)
+
+    def execute_cli_create_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run litp create, see GenericTest, and clear the model cache.
+        """
+        self.model_cache.clear()
+        return super(ModelCacheMixin, self).execute_cli_create_cmd(
+            *args, **kwargs)
+
+    def execute_cli_update_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run litp update, see GenericTest, and clear the model cache.
+        """
+        self.model_cache.clear()
+        return super(ModelCacheMixin, self).execute_cli_update_cmd(
+            *args, **kwargs)
+
+    def execute_cli_inherit_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run litp inherit, see GenericTest, and clear the model cache.
+        """
+        self.model_cache.clear()
+        return super(ModelCacheMixin, self).execute_cli_inherit_cmd(
+            *args, **kwargs)
+
+    def execute_cli_remove_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run litp remove, see GenericTest, and clear the model cache.
+        """
+        self.model_cache.clear()
+        return super(ModelCacheMixin, self).execute_cli_remove_cmd(
+            *args, **kwargs)
+
+    def execute_cli_runplan_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run litp run_plan, see GenericTest, and clear the model cache.
+        """
+        self.model_cache.clear()
+        return super(ModelCacheMixin, self).execute_cli_runplan_cmd(
+            *args, **kwargs)
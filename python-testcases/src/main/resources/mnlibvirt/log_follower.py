@@ -0,0 +1,333 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Byte offset tracking for reading only new log lines on a
+            node.
+"""
+
+from remote_cmd_utils import RemoteCmdUtils
+from step_timer import timed_step
+
+# Return code of a wait script which gave up at its deadline
+DEADLINE_RETURN_CODE = 124
+
+
+class LogFollower(object):
+    """
+    Tracks the read position of a set of log files on one node.
+
+    start_offsets holds the size of each file when the follower was
+    started, and offsets how far each file has been read since. A file
+    which shrinks, e.g. because it was rotated, is read again from its
+    start.
+    """
+
+    def __init__(self, node, paths):
+        """
+        Args:
+            node (str): The node the log files are on.
+
+            paths (list): The log files to follow.
+        """
+        self.node = node
+        self.paths = list(paths)
+        self.start_offsets = {}
+        self.offsets = {}
+        self.remote = RemoteCmdUtils()
+
+    def get_mark_cmd(self):
+        """
+        Function to return the command which prints the current size of
+        each followed file, one per line, 0 for a missing file.
+
+        Return:
+            str. The command.
+        """
+        return ' ; '.join(
+            '/usr/bin/stat -c %s {0} 2>/dev/null || echo 0'.format(
+                self.remote.quote(path))
+            for path in self.paths)
+
+    def mark(self, stdout):
+        """
+        Start following the files from the sizes printed by the mark
+        command.
+
+        Args:
+            stdout (list): The output of the command from get_mark_cmd.
+        """
+        for path, size in zip(self.paths, stdout):
+            self.start_offsets[path] = int(size)
+            self.offsets[path] = int(size)
+
+    def get_wait_script(self, patterns, deadline):
+        """
+        Function to return the script which reads the followed files
+        from their offsets until a line containing any of the patterns
+        is written to any of them.
+
+        The files are read about once a second. Only whole lines are
+        read, so a pattern is never missed because a line was still
+        being written.
+
+        Args:
+            patterns (list): The fixed strings to look for.
+
+            deadline (int): The maximum number of seconds to wait.
+
+        Return:
+            list. The lines of the script. It prints the offsets read up
+            to as "O <offset>...", then on a match
+            "M <file index> <pattern index> <offset> <line>", and
+            returns DEADLINE_RETURN_CODE if nothing matched in time.
+        """
+        quoted_paths = ' '.join(self.remote.quote(path)
+                                for path in self.paths)
+        offsets = ' '.join(str(self.offsets[path]) for path in self.paths)
+        awk_program = (
+            'FNR == NR { pats[++n] = $0; next } '
+            'function check(line) { '
+            'for (p = 1; p <= n; p++) if (index(line, pats[p])) { '
+            'print "M", file, p - 1, base + used, line; found = 1; exit } } '
+            '{ if (have) { used += length(prev) + 1; check(prev) } '
+            'prev = $0; have = 1 } '
+            'END { if (found) exit; '
+            'if (have && !partial) { used += length(prev) + 1; '
+            'check(prev) } '
+            'if (!found) print "C", base + used }')
+        return [
+            # the matched line is split into words below, never globbed
+            'set -f',
+            'work_dir=$(/bin/mktemp -d /tmp/log_follow.XXXXXX)',
+            "trap '/bin/rm -rf \"$work_dir\"' EXIT",
+            self.remote.get_write_file_cmd('"$work_dir/patterns"',
+                                           patterns),
+            'files=({0})'.format(quoted_paths),
+            'offs=({0})'.format(offsets),
+            'end=$((SECONDS + {0}))'.format(int(deadline)),
+            'while :; do',
+            '    for i in "${!files[@]}"; do',
+            '        f=${files[$i]}',
+            '        off=${offs[$i]}',
+            '        size=$(/usr/bin/stat -c %s "$f" 2>/dev/null || echo 0)',
+            '        [ "$size" -ge "$off" ] || off=0',
+            '        [ "$size" -gt "$off" ] || continue',
+            '        /usr/bin/tail -c +$((off + 1)) "$f" | '
+            '/usr/bin/head -c $((size - off)) > "$work_dir/chunk"',
+            '        partial=0',
+            '        [ -z "$(/usr/bin/tail -c 1 "$work_dir/chunk")" ] || '
+            'partial=1',
+            '        result=$(LC_ALL=C /bin/awk -v file="$i" -v base="$off" '
+            '-v partial="$partial" {0} "$work_dir/patterns" '
+            '"$work_dir/chunk")'.format(self.remote.quote(awk_program)),
+            '        set -- $result',
+            '        if [ "$1" = M ]; then',
+            '            offs[$i]=$4',
+            '            echo "O ${offs[*]}"',
+            '            echo "$result"',
+            '            exit 0',
+            '        fi',
+            '        offs[$i]=$2',
+            '    done',
+            '    [ "$SECONDS" -lt "$end" ] || break',
+            '    sleep 1',
+            'done',
+            'echo "O ${offs[*]}"',
+            'exit {0}'.format(DEADLINE_RETURN_CODE)]
+
+    def get_wait_cmd(self, patterns, deadline):
+        """
+        Function to return the command which waits for any of the
+        patterns, see get_wait_script.
+
+        Args:
+            patterns (list): The fixed strings to look for.
+
+            deadline (int): The maximum number of seconds to wait.
+
+        Return:
+            str. The command.
+        """
+        return self.remote.get_script_cmd(
+            self.get_wait_script(patterns, deadline))
+
+    def update(self, patterns, stdout):
+        """
+        Advance the offsets from the output of a wait script.
+
+        Args:
+            patterns (list): The patterns the script waited for.
+
+            stdout (list): The script's output lines.
+
+        Return:
+            tuple. The file, the pattern and the line matched, or None if
+            nothing matched.
+        """
+        match = None
+        for line in stdout:
+            fields = line.split(' ', 4)
+            if fields[0] == 'O' and \
+                    len(line.split()) - 1 == len(self.paths):
+                for path, offset in zip(self.paths, line.split()[1:]):
+                    self.offsets[path] = int(offset)
+            elif fields[0] == 'M' and len(fields) >= 4:
+                path = self.paths[int(fields[1])]
+                self.offsets[path] = int(fields[3])
+                match = (path, patterns[int(fields[2])],
+                         fields[4] if len(fields) == 5 else '')
+        return match
+
+    def get_tail_cmd(self, path, offset):
+        """
+        Function to return the command which prints a file from an
+        offset, or from its start if it has shrunk below the offset,
+        e.g. because it was truncated or rotated.
+
+        Args:
+            path (str): The file to print.
+
+            offset (int): The offset to print from.
+
+        Return:
+            str. The command.
+        """
+        quoted_path = self.remote.quote(path)
+        return ('size=$(/usr/bin/stat -c %s {0} 2>/dev/null || echo 0); '
+                'off={1}; [ "$size" -ge "$off" ] || off=0; '
+                '/usr/bin/tail -c +$((off + 1)) {0}').format(quoted_path,
+                                                           int(offset))
+
+    def get_scan_cmd(self, path, pattern, last_lines=None):
+        """
+        Function to return the command which prints the lines containing
+        a pattern written to a file since the follower started.
+
+        Only the part of the file written since then is read.
+
+        Args:
+            path (str): The followed file to scan.
+
+            pattern (str): The fixed string to look for.
+
+            last_lines (int): If given, only the last lines of that part
+                              of the file are scanned.
+
+        Return:
+            str. The command, which returns 1 if the pattern is absent.
+        """
+        cmd = self.get_tail_cmd(path, self.start_offsets[path])
+        if last_lines is not None:
+            cmd += ' | /usr/bin/tail -n {0}'.format(int(last_lines))
+        return '{0} | /bin/grep -F -e {1}'.format(cmd,
+                                                 self.remote.quote(pattern))
+
+    def get_read_cmd(self, path):
+        """
+        Function to return the command which prints the lines written
+        to a followed file since the last wait on the follower, or since
+        it started.
+
+        Args:
+            path (str): The followed file to read.
+
+        Return:
+            str. The command.
+        """
+        return self.get_tail_cmd(path, self.offsets[path])
+
+
+class LogFollowerMixin(object):
+    """
+    Test helpers waiting for and checking the lines written to log
+    files on a node with a LogFollower.
+    """
+
+    def start_log_follower(self, node, paths):
+        """
+        Description:
+            Start following log files on a node from their current ends.
+            Later waits and checks on the follower only read what has
+            been written to the files since, and never read a line
+            twice.
+
+        Args:
+            node (str): The node the log files are on.
+
+            paths (list): The log files to follow.
+
+        Returns:
+            LogFollower. The follower, for wait_for_log_patterns and
+            assert_log_pattern_absent.
+        """
+        follower = LogFollower(node, paths)
+        stdout, _, _ = self.run_command(node, follower.get_mark_cmd(),
+                                        su_root=True)
+        follower.mark(stdout)
+        return follower
+
+    @timed_step
+    def wait_for_log_patterns(self, follower, patterns, timeout):
+        """
+        Description:
+            Wait for a line containing any of the patterns to be written
+            to any of the followed files, reading on from where the last
+            wait on the follower stopped. Asserts that a pattern is
+            seen within the timeout.
+
+        Args:
+            follower (LogFollower): The follower, from
+                                    start_log_follower.
+
+            patterns (list): The fixed strings to wait for.
+
+            timeout (int): Seconds to wait.
+
+        Returns:
+            tuple. The file, the pattern and the line matched.
+        """
+        stdout, _, _ = self.run_command(
+            follower.node, follower.get_wait_cmd(patterns, timeout),
+            su_root=True)
+        match = follower.update(patterns, stdout)
+        self.assertNotEqual(None, match,
+                            'None of {0} was written to {1} within '
+                            '{2}s'.format(patterns, follower.paths,
+                                          timeout))
+        self.log("info", 'Found "{0}" in {1}'.format(match[1], match[0]))
+        return match
+
+    def assert_log_pattern_absent(self, follower, path, pattern,
+                                  last_lines=None):
+        """
+        Description:
+            Assert that no line containing a pattern has been written to
+            a followed file since the follower was started.
+
+        Args:
+            follower (LogFollower): The follower, from
+                                    start_log_follower.
+
+            path (str): The followed file to check.
+
+            pattern (str): The fixed string which must not appear.
+
+            last_lines (int): If given, only the last lines written since
+                              then are checked.
+        """
+        stdout, stderr, return_code = self.run_command(
+            follower.node, follower.get_scan_cmd(path, pattern,
+                                                 last_lines=last_lines),
+            su_root=True)
+        self.assertEqual([], stderr)
+        self.assertEqual([], stdout,
+                         '"{0}" was written to {1}: {2}'.format(pattern,
+                                                                 path,
+                                                                 stdout))
+        self.assertEqual(1, return_code)
@@ -0,0 +1,590 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Node path leases and shared package holds for test sets
+            run concurrently on a cluster.
+"""
+
+import os
+import re
+import socket
+import time
+import zlib
+
+from fake_hypervisor import FakeHypervisor, FAKE_HYPERVISOR_PKG
+from remote_cmd_utils import RemoteCmdUtils
+from step_timer import timed_step
+
+# Directory holding one lease file per leased path, on each node
+LEASE_DIR = '/var/lock/mnlibvirt'
+
+# Lock file serialising every lease change on a node
+LEASE_LOCK_FILE = LEASE_DIR + '/.lock'
+
+# Directory holding the state of the packages installed for the tests,
+# and a hold file per holder, on each node
+DEPENDENCY_DIR = LEASE_DIR + '/.dependencies'
+
+# Replies of DependencyLease.get_acquire_cmd
+DEPENDENCIES_READY = 'READY'
+DEPENDENCIES_INSTALL = 'INSTALL'
+DEPENDENCIES_WAIT = 'WAIT'
+
+
+def get_locked_script(remote, owner, lines):
+    """
+    Function to return a script running lines under the node wide lease
+    lock, with $owner set.
+
+    Args:
+        remote (RemoteCmdUtils): The remote command framing.
+
+        owner (str): The holder the lines are run for.
+
+        lines (list): The lines to run.
+
+    Return:
+        list. The lines of the script.
+    """
+    return [
+        '/bin/mkdir -p {0}'.format(LEASE_DIR),
+        'exec 9>>{0}'.format(LEASE_LOCK_FILE),
+        '/usr/bin/flock 9',
+        'owner={0}'.format(remote.quote(owner))] + lines
+
+
+class NodeLease(object):
+    """
+    A lease on a set of paths on one node.
+
+    Each leased path has a lease file in LEASE_DIR holding its owner and
+    the time the lease expires. Leases are taken and released under a
+    node wide flock, so taking a set of paths is all or nothing. A lease
+    held past its expiry, e.g. by a run which was killed, may be taken
+    over.
+    """
+
+    def __init__(self, node, paths, owner):
+        """
+        Args:
+            node (str): The node the paths are on.
+
+            paths (list): The paths to lease.
+
+            owner (str): Identifies the holder, must not contain
+                         whitespace.
+        """
+        self.node = node
+        self.paths = sorted(set(paths))
+        self.owner = owner
+        self.remote = RemoteCmdUtils()
+
+    @staticmethod
+    def get_lease_filename(path):
+        """
+        Function to return the name of the lease file of a path.
+
+        Args:
+            path (str): The leased path.
+
+        Return:
+            str. The name of the file in LEASE_DIR.
+        """
+        return re.sub(r'[^A-Za-z0-9._-]', '_', path.strip('/'))
+
+    def _get_lease_files(self):
+        """
+        Return the quoted paths of the lease files, space separated.
+        """
+        return ' '.join(self.remote.quote('{0}/{1}'.format(
+            LEASE_DIR, self.get_lease_filename(path)))
+                        for path in self.paths)
+
+    def _get_locked_script(self, lines):
+        """
+        Return a script running lines under the node wide lease lock.
+        """
+        return get_locked_script(self.remote, self.owner, lines)
+
+    def get_acquire_cmd(self, ttl):
+        """
+        Function to return the command which takes the lease.
+
+        Args:
+            ttl (int): Seconds until the lease expires.
+
+        Return:
+            str. The command, which returns 0 if every path was leased.
+            Otherwise it leases none of them, prints
+            "HELD <lease file> <owner>" for each path held by another
+            owner and returns 1.
+        """
+        return self.remote.get_script_cmd(self._get_locked_script([
+            'now=$(/bin/date +%s)',
+            'held=0',
+            'for lease in {0}; do'.format(self._get_lease_files()),
+            '    [ -f "$lease" ] || continue',
+            '    read holder expiry < "$lease"',
+            '    if [ "$holder" != "$owner" ] && '
+            '[ "${expiry:-0}" -gt "$now" ]; then',
+            '        echo "HELD $lease $holder"',
+            '        held=1',
+            '    fi',
+            'done',
+            '[ "$held" -eq 0 ] || exit 1',
+            'for lease in {0}; do'.format(self._get_lease_files()),
+            '    echo "$owner $((now + {0}))" > "$lease" || exit 1'.format(
+                int(ttl)),
+            'done']))
+
+    def get_release_cmd(self):
+        """
+        Function to return the command which releases the lease. Paths
+        leased by other owners since are left alone.
+
+        Return:
+            str. The command.
+        """
+        return self.remote.get_script_cmd(self._get_locked_script([
+            'for lease in {0}; do'.format(self._get_lease_files()),
+            '    [ -f "$lease" ] || continue',
+            '    read holder expiry < "$lease"',
+            '    [ "$holder" != "$owner" ] || /bin/rm -f "$lease"',
+            'done',
+            'exit 0']))
+
+    @staticmethod
+    def get_holders(stdout):
+        """
+        Function to return the holders reported by a failed acquire.
+
+        Args:
+            stdout (list): The output of the acquire command.
+
+        Return:
+            dict. The owner of each lease file held by another owner.
+        """
+        holders = {}
+        for line in stdout:
+            fields = line.split()
+            if len(fields) == 3 and fields[0] == 'HELD':
+                holders[fields[1]] = fields[2]
+        return holders
+
+
+class DependencyLease(object):
+    """
+    A hold on the packages the tests need on a node, shared by every
+    test and every process using the node.
+
+    Each holder has a hold file in DEPENDENCY_DIR/holders holding the
+    time its hold expires. The first holder finds the packages
+    unchecked and installs those missing, while the others wait for it.
+    The installed packages are recorded on the node. The holder which
+    releases the last hold removes the recorded packages before its
+    release command returns; holders arriving meanwhile wait for the
+    removal to end and then install the packages again. The state is
+    only changed under the node wide lease lock.
+    """
+
+    def __init__(self, node, owner):
+        """
+        Args:
+            node (str): The node the packages are on.
+
+            owner (str): Identifies the holder, must not contain
+                         whitespace.
+        """
+        self.node = node
+        self.owner = owner
+        self.remote = RemoteCmdUtils()
+
+    def _get_hold_file(self):
+        """
+        Return the quoted path of the holder's hold file.
+        """
+        return self.remote.quote('{0}/holders/{1}'.format(
+            DEPENDENCY_DIR, NodeLease.get_lease_filename(self.owner)))
+
+    @staticmethod
+    def _get_read_state_lines():
+        """
+        Return the script lines which set $state, $holder and $expiry
+        from the state file, empty if there is none.
+        """
+        return ['state=; holder=; expiry=',
+                '[ ! -f {0}/state ] || '
+                'read state holder expiry < {0}/state'.format(
+                    DEPENDENCY_DIR)]
+
+    @staticmethod
+    def _get_live_hold_lines():
+        """
+        Return the script lines which exit 0 if a hold which has not
+        expired by $now is found.
+        """
+        return ['for hold in {0}/holders/*; do'.format(DEPENDENCY_DIR),
+                '    [ -f "$hold" ] || continue',
+                '    read hold_expiry < "$hold"',
+                '    [ "${hold_expiry:-0}" -le "$now" ] || exit 0',
+                'done']
+
+    def get_acquire_cmd(self, ttl):
+        """
+        Function to return the command which takes the hold.
+
+        Args:
+            ttl (int): Seconds until the hold, and the installation it
+                       may be given, expire.
+
+        Return:
+            str. The command. It prints DEPENDENCIES_READY if the
+            packages are in place, DEPENDENCIES_INSTALL if the holder is
+            to check and install them, or DEPENDENCIES_WAIT if another
+            holder is doing so or the packages are being removed, in
+            which case it is run again later.
+        """
+        return self.remote.get_script_cmd(get_locked_script(
+            self.remote, self.owner, [
+                'now=$(/bin/date +%s)',
+                '/bin/mkdir -p {0}/holders'.format(DEPENDENCY_DIR),
+                'echo $((now + {0})) > {1}'.format(int(ttl),
+                                                   self._get_hold_file())] +
+            self._get_read_state_lines() + [
+                'if [ "$state" = ready ]; then',
+                '    echo {0}'.format(DEPENDENCIES_READY),
+                'elif [ -n "$state" ] && [ "$holder" != "$owner" ] && '
+                '[ "${expiry:-0}" -gt "$now" ]; then',
+                '    echo {0}'.format(DEPENDENCIES_WAIT),
+                'else',
+                '    echo "installing $owner $((now + {0}))" > '
+                '{1}/state'.format(int(ttl), DEPENDENCY_DIR),
+                '    echo {0}'.format(DEPENDENCIES_INSTALL),
+                'fi']))
+
+    def get_ready_cmd(self, installed_pkgs):
+        """
+        Function to return the command which records the packages the
+        holder installed and marks the packages as in place.
+
+        Args:
+            installed_pkgs (list): The packages the holder installed.
+
+        Return:
+            str. The command.
+        """
+        return self.remote.get_script_cmd(get_locked_script(
+            self.remote, self.owner, [
+                'echo {0} >> {1}/installed'.format(
+                    self.remote.quote(pkg), DEPENDENCY_DIR)
+                for pkg in installed_pkgs] + [
+                    'echo "ready $owner 0" > {0}/state'.format(
+                        DEPENDENCY_DIR)]))
+
+    def get_abort_cmd(self):
+        """
+        Function to return the command which gives up an installation
+        the holder was given, so another holder may take it over.
+
+        Return:
+            str. The command.
+        """
+        return self.remote.get_script_cmd(get_locked_script(
+            self.remote, self.owner,
+            self._get_read_state_lines() + [
+                '[ "$state" != installing ] || [ "$holder" != "$owner" ] || '
+                '/bin/rm -f {0}/state'.format(DEPENDENCY_DIR),
+                'exit 0']))
+
+    def get_release_cmd(self, remove_cmds, ttl):
+        """
+        Function to return the command which releases the hold.
+
+        If it was the last hold which had not expired, the command goes
+        on to remove the recorded packages which are still in place,
+        and only returns once they are removed.
+
+        Args:
+            remove_cmds (list): (package, command) pairs, the command
+                                which removes each package that may be
+                                recorded, in the order they are run.
+
+            ttl (int): Seconds the removal is given before an acquire
+                       may take the packages over again.
+
+        Return:
+            str. The command.
+        """
+        remove_lines = [
+            '! /bin/grep -qxF {0} {1}/installed || ( {2} ) < /dev/null'.format(
+                self.remote.quote(pkg), DEPENDENCY_DIR, cmd)
+            for pkg, cmd in remove_cmds]
+        return self.remote.get_script_cmd(get_locked_script(
+            self.remote, self.owner,
+            ['/bin/rm -f {0}'.format(self._get_hold_file()),
+             'now=$(/bin/date +%s)'] + self._get_live_hold_lines() +
+            self._get_read_state_lines() +
+            ['[ "$state" = ready ] || exit 0',
+             'echo "removing $owner $((now + {0}))" > {1}/state'.format(
+                 int(ttl), DEPENDENCY_DIR),
+             'exec 9>&-'] + remove_lines +
+            ['exec 9>>{0}'.format(LEASE_LOCK_FILE),
+             '/usr/bin/flock 9',
+             '/bin/rm -rf {0}'.format(DEPENDENCY_DIR)]))
+
+
+class NodeLeaseMixin(object):
+    """
+    Test helpers leasing the resources of a test on a node, and holding
+    the packages of a test set there.
+
+    The paths leased for an image are those of ImageStagingMixin, and
+    the packages are checked and installed with the test's rh_cmds.
+    """
+
+    # Seconds a node lease is held for before another run may take it
+    # over, see lease_test_node
+    node_lease_ttl = 4 * 3600
+
+    # Seconds a test waits for a node whose resources are free
+    node_lease_deadline = 3600
+
+    # Seconds between two attempts to lease a node
+    node_lease_poll_interval = 15
+
+    # Holds of each test set on the packages of a node, see
+    # ensure_node_dependencies. Keyed by (test set class, node), the value
+    # is the DependencyLease and the time it is to be renewed at.
+    dependency_holds = {}
+
+    # The vm-service instance directories on the nodes
+    instances_dir = None
+
+    # Name of the adaptor package
+    adaptor_pkg_name = None
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Description:
+            Runs after the last test of the test set
+        Actions:
+            Release the test set's holds on the packages of the nodes,
+            from a test set up for the purpose
+        Results:
+            The packages installed by ensure_node_dependencies are
+            removed from the nodes no other test set holds them on
+        """
+        if any(test_set is cls for test_set, _ in cls.dependency_holds):
+            test = cls('release_node_dependencies')
+            test.setUp()
+            try:
+                test.release_node_dependencies()
+            finally:
+                test.tearDown()
+        super(NodeLeaseMixin, cls).tearDownClass()
+
+    @timed_step
+    def lease_test_node(self, image_names, vm_service_names, nodes=None):
+        """
+        Description:
+            Pick the node the current test runs on, and lease the
+            resources it uses there: its images, both staged in /tmp
+            and provisioned in the libvirt image directory, and the
+            instance directories of its vm-services.
+
+            Each test starts looking at a different node, derived from
+            its id, and takes the first node on which none of the
+            resources is leased by another test. Tests run concurrently
+            are so spread across the managed nodes rather than all run
+            on the first one. If no node is free, the test waits for one
+            up to node_lease_deadline.
+
+            The lease is released when the test ends, and expires after
+            node_lease_ttl should the run be killed.
+
+        Args:
+            image_names (list): Names of the images the test stages.
+
+            vm_service_names (list): Names of the vm-services the test
+                                     creates instance directories for.
+
+            nodes (list): The nodes to choose from, defaults to every
+                          managed node.
+
+        Returns:
+            str. The node the resources are leased on.
+        """
+        if nodes is None:
+            nodes = self.get_managed_node_filenames()
+        paths = ['/tmp/{0}'.format(image_name)
+                 for image_name in image_names] + \
+            [self.get_provisioned_path(image_name)
+             for image_name in image_names] + \
+            ['{0}/{1}'.format(self.instances_dir,
+                              vm_name)
+             for vm_name in vm_service_names]
+        owner = '{0}:{1}'.format(socket.gethostname(), os.getpid())
+        first = (zlib.crc32(self.id().encode('utf-8')) & 0xffffffff) % \
+            len(nodes)
+        nodes = nodes[first:] + nodes[:first]
+
+        end_time = time.time() + self.node_lease_deadline
+        while True:
+            holders = {}
+            for node in nodes:
+                lease = NodeLease(node, paths, owner)
+                stdout, _, return_code = self.run_command(
+                    node, lease.get_acquire_cmd(self.node_lease_ttl),
+                    su_root=True)
+                if return_code == 0:
+                    self.addCleanup(self.run_command, node,
+                                    lease.get_release_cmd(), su_root=True)
+                    self.log("info", 'Leased {0} on {1}'.format(paths,
+                                                               node))
+                    return node
+                holders[node] = NodeLease.get_holders(stdout)
+            if time.time() + self.node_lease_poll_interval > end_time:
+                break
+            self.log("info", 'No node free for {0}, held: {1}'.format(
+                paths, holders))
+            time.sleep(self.node_lease_poll_interval)
+        self.fail('None of {0} was free for {1} within {2}s: {3}'.format(
+            nodes, paths, self.node_lease_deadline, holders))
+
+    @timed_step
+    def ensure_node_dependencies(self, node):
+        """
+        Description:
+            Make sure libvirt and the libvirt adaptor are installed on a
+            node and that libvirtd is running, for the rest of the test
+            set.
+
+            The packages are held on the node, see DependencyLease, by
+            every test set using them, whichever process it runs in. The
+            first test set to hold them checks the node, in a single
+            round trip, and installs the packages which are missing;
+            test sets run concurrently wait for it. The hold is kept
+            until the test set ends, see tearDownClass, and is renewed
+            before node_lease_ttl runs out. The last test set to release
+            its hold removes the packages it finds installed.
+
+            With fake_hypervisor set, the stand-in hypervisor of
+            fake_hypervisor is installed in place of libvirt.
+
+        Args:
+            node (str): The node to prepare.
+        """
+        key = (type(self), node)
+        if key in self.dependency_holds and \
+                time.time() < self.dependency_holds[key][1]:
+            return
+        lease = DependencyLease(node, '{0}:{1}:{2}.{3}'.format(
+            socket.gethostname(), os.getpid(), type(self).__module__,
+            type(self).__name__))
+        renew_time = time.time() + self.node_lease_ttl / 2
+        end_time = time.time() + self.node_lease_deadline
+        while True:
+            stdout, _, return_code = self.run_command(
+                node, lease.get_acquire_cmd(self.node_lease_ttl),
+                su_root=True)
+            self.assertEqual(0, return_code)
+            if DEPENDENCIES_WAIT not in stdout:
+                break
+            if time.time() + self.node_lease_poll_interval > end_time:
+                self.fail('The packages on {0} were not ready within '
+                          '{1}s'.format(node, self.node_lease_deadline))
+            self.log("info", 'Waiting for the packages on {0}'.format(node))
+            time.sleep(self.node_lease_poll_interval)
+        self.dependency_holds[key] = (lease, renew_time)
+        if DEPENDENCIES_READY in stdout:
+            return
+
+        # AN INSTALLATION WHICH FAILS IS GIVEN UP, SO THE NEXT TEST TO
+        # HOLD THE PACKAGES TAKES IT OVER
+        installed_pkgs = None
+        try:
+            installed_pkgs = self._install_node_dependencies(node)
+        finally:
+            if installed_pkgs is None:
+                self.run_command(node, lease.get_abort_cmd(), su_root=True)
+        _, _, return_code = self.run_command(
+            node, lease.get_ready_cmd(installed_pkgs), su_root=True)
+        self.assertEqual(0, return_code)
+        self.log("info", 'libvirt stack ready on {0}, installed: {1}'.format(
+            node, installed_pkgs))
+
+    def _install_node_dependencies(self, node):
+        """
+        Check the libvirt stack of a node in a single round trip,
+        install the packages which are missing, start libvirtd, and
+        return the packages installed.
+        """
+        adaptor_pkg = self.adaptor_pkg_name
+        if self.fake_hypervisor:
+            stack_cmds = [('fake', FakeHypervisor().get_check_cmd())]
+        else:
+            stack_cmds = [
+                ('libvirt', self.rh_cmds.check_pkg_installed(['libvirt'])),
+                ('libvirtd',
+                 self.rh_cmds.get_systemctl_status_cmd('libvirtd'))]
+        results = self.run_cmd_batch(node, [
+            ('adaptor', self.rh_cmds.check_pkg_installed([adaptor_pkg]))] +
+            stack_cmds)
+        adaptor_result = results[0]
+
+        installed_pkgs = []
+        if self.fake_hypervisor:
+            if results[1].rc != 0:
+                _, _, return_code = self.run_command(
+                    node, FakeHypervisor().get_install_cmd(), su_root=True)
+                self.assertEqual(0, return_code)
+                installed_pkgs.append(FAKE_HYPERVISOR_PKG)
+        else:
+            libvirt_result, libvirtd_result = results[1:]
+            if libvirt_result.rc != 0:
+                _, _, return_code = self.run_command(
+                    node, self.rh_cmds.get_yum_install_cmd(['libvirt']),
+                    su_root=True)
+                self.assertEqual(0, return_code)
+                installed_pkgs.append('libvirt')
+            if libvirt_result.rc != 0 or libvirtd_result.rc != 0:
+                _, _, return_code = self.run_command(
+                    node, self.rh_cmds.get_systemctl_start_cmd('libvirtd'),
+                    su_root=True)
+                self.assertEqual(0, return_code)
+        if adaptor_result.rc != 0:
+            self.install_rpm_on_node(node, adaptor_pkg)
+            installed_pkgs.append(adaptor_pkg)
+        return installed_pkgs
+
+    def release_node_dependencies(self):
+        """
+        Description:
+            Release the test set's holds on the packages of the nodes.
+            Where it was the last hold, the packages are removed before
+            the release returns, see DependencyLease.
+        """
+        adaptor_pkg = self.adaptor_pkg_name
+        remove_cmds = [
+            (FAKE_HYPERVISOR_PKG, FakeHypervisor().get_uninstall_cmd()),
+            (adaptor_pkg, self.rh_cmds.get_yum_remove_cmd([adaptor_pkg])),
+            ('libvirt', self.rh_cmds.get_yum_remove_cmd(['libvirt']))]
+        failed_nodes = []
+        for key in list(self.dependency_holds):
+            test_set, node = key
+            if test_set is not type(self):
+                continue
+            lease, _ = self.dependency_holds.pop(key)
+            _, _, return_code = self.run_command(
+                node, lease.get_release_cmd(remove_cmds, self.node_lease_ttl),
+                su_root=True)
+            if return_code != 0:
+                failed_nodes.append(node)
+        self.assertEqual([], failed_nodes)
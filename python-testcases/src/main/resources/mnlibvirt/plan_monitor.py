@@ -0,0 +1,274 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Polls a running LITP plan from a script on the MS, recording
+            when each task is seen to change state.
+"""
+
+import time
+
+from remote_cmd_utils import RemoteCmdUtils
+from step_timer import timed_step
+
+# Plan states printed by litp show_plan
+PLAN_SUCCESSFUL = 'Successful'
+PLAN_FAILED = 'Failed'
+PLAN_STOPPED = 'Stopped'
+PLAN_INVALID = 'Invalid'
+FINAL_PLAN_STATES = (PLAN_SUCCESSFUL, PLAN_FAILED, PLAN_STOPPED,
+                     PLAN_INVALID)
+
+# Task states printed by litp show_plan
+TASK_RUNNING = 'Running'
+TASK_STATES = ('Initial', TASK_RUNNING, 'Success', 'Failed', 'Stopped')
+
+# Longest pause between two looks at the plan, in seconds. Kept short
+# as the plan's end is only seen at the next look
+MAX_POLL_INTERVAL = 2
+
+
+class PlanMonitor(object):
+    """
+    Follows a plan through the output of a watch script run on the MS.
+
+    This is bounded polling, not an event feed. The script runs litp
+    show_plan every second, backing off to every MAX_POLL_INTERVAL
+    seconds while nothing changes, and prints a line for each task
+    state change it sees, stamped with the time on the MS. It returns
+    at the first look which finds the plan in a final state, so up to
+    MAX_POLL_INTERVAL seconds after the plan ended, or at its deadline.
+    """
+
+    def __init__(self):
+        """
+        Start with no tasks seen.
+        """
+        self.remote = RemoteCmdUtils()
+        self.task_order = []
+        self.task_states = {}
+        self.plan_state = None
+        self.last_time = None
+
+    def get_watch_script(self, deadline):
+        """
+        Function to return the script which watches the plan.
+
+        Each task state change is printed as
+        "<time> T <task state>\\t<item path>\\t<task description>", and
+        the plan state when the script returns as "<time> P <state>".
+
+        Args:
+            deadline (int): The maximum number of seconds to watch.
+
+        Return:
+            list. The lines of the script.
+        """
+        task_pattern = '|'.join(TASK_STATES)
+        return [
+            'work_dir=$(/bin/mktemp -d /tmp/plan_watch.XXXXXX)',
+            "trap '/bin/rm -rf \"$work_dir\"' EXIT",
+            ': > "$work_dir/seen"',
+            'end=$((SECONDS + {0}))'.format(int(deadline)),
+            'interval=1',
+            'while :; do',
+            '    /usr/bin/litp show_plan > "$work_dir/plan" 2>/dev/null',
+            '    now=$(/bin/date +%s.%N)',
+            "    /bin/awk -F '\\t+' '/^({0})\\t/ {{".format(task_pattern) +
+            ' state = $1; path = $2; getline;'
+            ' sub(/^[ \\t]+/, ""); print state "\\t" path "\\t" $0'
+            ' }\' "$work_dir/plan" > "$work_dir/tasks"',
+            '    if /bin/grep -vxF -f "$work_dir/seen" "$work_dir/tasks" '
+            '> "$work_dir/new"; then',
+            '        /bin/sed "s/^/$now T /" "$work_dir/new"',
+            '        /bin/cat "$work_dir/new" >> "$work_dir/seen"',
+            '        interval=1',
+            '    fi',
+            "    state=$(/bin/awk -F ': ' '/^Plan Status:/ {print $2}' "
+            '"$work_dir/plan")',
+            '    case "$state" in',
+            '        {0}) break ;;'.format('|'.join(FINAL_PLAN_STATES)),
+            '    esac',
+            '    [ "$SECONDS" -lt "$end" ] || break',
+            '    sleep "$interval"',
+            '    [ "$interval" -ge {0} ] || interval=$((interval * 2))'.format(
+                MAX_POLL_INTERVAL),
+            'done',
+            'echo "$(/bin/date +%s.%N) P $state"']
+
+    def get_watch_cmd(self, deadline):
+        """
+        Function to return the command which watches the plan, see
+        get_watch_script.
+
+        Args:
+            deadline (int): The maximum number of seconds to watch.
+
+        Return:
+            str. The command.
+        """
+        return self.remote.get_script_cmd(self.get_watch_script(deadline))
+
+    def update(self, stdout):
+        """
+        Record the output of a watch script.
+
+        Args:
+            stdout (list): The script's output lines.
+
+        Return:
+            str. The plan state the script returned with.
+        """
+        for line in stdout:
+            fields = line.split(' ', 2)
+            if len(fields) != 3:
+                continue
+            try:
+                seen_time = float(fields[0])
+            except ValueError:
+                continue
+            self.last_time = seen_time
+            if fields[1] == 'P':
+                self.plan_state = fields[2].strip() or None
+            elif fields[1] == 'T':
+                task_fields = fields[2].split('\t', 2)
+                if len(task_fields) != 3:
+                    continue
+                task = (task_fields[1], task_fields[2])
+                if task not in self.task_states:
+                    self.task_order.append(task)
+                    self.task_states[task] = {}
+                self.task_states[task].setdefault(task_fields[0], seen_time)
+        return self.plan_state
+
+    def is_finished(self):
+        """
+        Function to check whether the plan has reached a final state.
+
+        Return:
+            bool. True if the plan is no longer running.
+        """
+        return self.plan_state in FINAL_PLAN_STATES
+
+    def get_task_durations(self):
+        """
+        Function to return how long each task was seen to run.
+
+        A task's duration runs from the first time it was seen Running
+        to the first time it was seen in a later state. Tasks which
+        were never seen Running, or never seen to end, are left out.
+        The times are only as precise as the watch script's polling.
+
+        Return:
+            list. (item path, description, seconds) per task, in plan
+            order.
+        """
+        durations = []
+        for task in self.task_order:
+            states = self.task_states[task]
+            start_time = states.get(TASK_RUNNING)
+            end_times = [seen_time for state, seen_time in states.items()
+                         if state not in ('Initial', TASK_RUNNING)]
+            if start_time is not None and end_times:
+                durations.append((task[0], task[1],
+                                  min(end_times) - start_time))
+        return durations
+
+
+class PlanMonitorMixin(object):
+    """
+    Test helpers waiting for the running plan with a PlanMonitor.
+    """
+
+    # Longest single remote command used to watch a plan, in seconds
+    plan_watch_chunk = 600
+
+    # The plan state wait_for_plan_state expects of a completed plan
+    plan_complete_state = None
+
+    def setUp(self):
+        """
+        Description:
+            Start the test with no plan tasks timed.
+        """
+        super(PlanMonitorMixin, self).setUp()
+        self.plan_task_durations = []
+
+    @timed_step
+    def wait_for_plan_end(self, ms_node, timeout_mins):
+        """
+        Description:
+            Wait for the running plan to reach a final state by polling
+            it from a script on the MS, see PlanMonitor. The script
+            looks at the plan at most plan_monitor.MAX_POLL_INTERVAL
+            seconds apart, so the end of the plan is seen up to that
+            late, and runs for at most plan_watch_chunk seconds per
+            remote command.
+
+            The time each task was seen to run is logged, longest first,
+            and kept in self.plan_task_durations. With
+            fake_litp_snapshot set, the fake model's plan has already
+            ended and its tasks take their configured times.
+
+        Args:
+            ms_node (str): The MS node with the deployment tree.
+
+            timeout_mins (int): Minutes to wait for the plan to end.
+
+        Returns:
+            str. The final plan state, e.g. plan_monitor.PLAN_SUCCESSFUL,
+            or the state the plan was in at the timeout.
+        """
+        monitor = self.litp_model or PlanMonitor()
+        end_time = time.time() + timeout_mins * 60
+        while self.litp_model is None and not monitor.is_finished():
+            remaining = int(end_time - time.time())
+            if remaining <= 0:
+                break
+            stdout, _, _ = self.run_command(
+                ms_node,
+                monitor.get_watch_cmd(min(remaining, self.plan_watch_chunk)))
+            monitor.update(stdout)
+
+        self.plan_task_durations = monitor.get_task_durations()
+        for path, description, duration in sorted(
+                self.plan_task_durations, key=lambda task: -task[2]):
+            self.log("info", 'Plan task {0:.1f}s: {1} {2}'.format(
+                duration, path, description))
+        self.log("info", 'Plan ended in state "{0}"'.format(
+            monitor.plan_state))
+        return monitor.plan_state
+
+    def wait_for_plan_complete(self, ms_node, timeout_mins):
+        """
+        Description:
+            Wait for the running plan with wait_for_plan_end, then check
+            that it completed with wait_for_plan_state. The plan has
+            ended by then, so wait_for_plan_state returns at its first
+            look, and logs its usual diagnostics if the plan did not
+            complete. With fake_litp_snapshot set, the fake model's
+            plan state is checked instead.
+
+        Args:
+            ms_node (str): The MS node with the deployment tree.
+
+            timeout_mins (int): Minutes to wait for the plan to end.
+
+        Returns:
+            bool. True if the plan completed.
+        """
+        start_time = time.time()
+        plan_state = self.wait_for_plan_end(ms_node, timeout_mins)
+        if self.litp_model is not None:
+            return plan_state == PLAN_SUCCESSFUL
+        # A PLAN STILL RUNNING AFTER THE TIMEOUT IS GIVEN ONE LAST MINUTE
+        remaining_mins = max(
+            1, timeout_mins - int((time.time() - start_time) / 60))
+        return self.wait_for_plan_state(ms_node,
+                                        self.plan_complete_state,
+                                        remaining_mins)
@@ -0,0 +1,223 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Bash script framing for run_command, with per command
+            return codes, output and timing.
+"""
+
+import base64
+from collections import namedtuple
+
+# Marks the start of each command's results in the output of a script
+# built by RemoteCmdUtils
+RESULT_MARKER = '@@MNLIBVIRT_RESULT@@'
+
+
+class CmdResult(namedtuple('CmdResult',
+                           'name stdout stderr rc start_time end_time')):
+    """
+    The outcome of one command run as part of a remote script.
+
+    stdout and stderr are lists of lines, as returned by run_command;
+    start_time and end_time are epoch seconds taken on the node.
+    """
+    __slots__ = ()
+
+    @property
+    def duration(self):
+        """
+        Return the seconds the command took to run on the node.
+        """
+        return self.end_time - self.start_time
+
+
+class RemoteCmdUtils(object):
+    """
+    Wraps multi-line shell scripts so they can be run on a node through
+    a single run_command call.
+    """
+
+    @staticmethod
+    def quote(value):
+        """
+        Function to return a value quoted for use as a single shell word.
+
+        Args:
+            value (str): The value to quote.
+
+        Return:
+            str. The value in single quotes, with embedded single quotes
+            escaped.
+        """
+        return "'{0}'".format(str(value).replace("'", "'\\''"))
+
+    @staticmethod
+    def get_script_cmd(script_lines):
+        """
+        Function to return a command which runs a bash script on the
+        node.
+
+        The script is shipped base64 encoded so that it passes through
+        the su and ssh layers without any further quoting.
+
+        Args:
+            script_lines (list): The lines of the bash script.
+
+        Return:
+            str. The command which runs the script.
+        """
+        script = '\n'.join(script_lines) + '\n'
+        encoded = base64.b64encode(script.encode('utf-8')).decode('ascii')
+        return '/bin/echo {0} | /usr/bin/base64 -d | /bin/bash'.format(
+            encoded)
+
+    @staticmethod
+    def get_write_file_cmd(path, lines):
+        """
+        Function to return a command which writes lines to a file,
+        replacing any existing content.
+
+        The content is shipped base64 encoded, so it needs no quoting.
+
+        Args:
+            path (str): The file to write.
+
+            lines (list): The lines to write.
+
+        Return:
+            str. The command.
+        """
+        content = '\n'.join(lines) + '\n'
+        encoded = base64.b64encode(content.encode('utf-8')).decode('ascii')
+        return '/bin/echo {0} | /usr/bin/base64 -d > {1}'.format(encoded,
+                                                                path)
+
+    @staticmethod
+    def _get_capture_lines(index, cmd):
+        """
+        Return the script lines which run a command, capturing its
+        output, return code and timing in files under $out_dir. The
+        command reads from /dev/null, so it cannot consume the rest of
+        the script from the shell's stdin.
+        """
+        return ['    start=$(/bin/date +%s.%N)',
+                '    ( {0} ) < /dev/null > "$out_dir/{1}.out" '
+                '2> "$out_dir/{1}.err"'.format(cmd, index),
+                '    rc=$?',
+                '    echo "$rc $start $(/bin/date +%s.%N)" > '
+                '"$out_dir/{0}.rc"'.format(index)]
+
+    @staticmethod
+    def _get_report_lines(count):
+        """
+        Return the script lines which print the captured results of the
+        first count commands. Each command's results start with a
+        RESULT_MARKER line, followed by its stdout and stderr lines
+        prefixed with "O " and "E " respectively. The script exits 0,
+        as the outcome of each command is in its results.
+        """
+        return ['for i in $(/usr/bin/seq 0 {0}); do'.format(count - 1),
+                '    echo "{0} $i $(/bin/cat "$out_dir/$i.rc" '
+                '2>/dev/null)"'.format(RESULT_MARKER),
+                '    /bin/awk \'{print "O " $0}\' "$out_dir/$i.out" '
+                '2>/dev/null',
+                '    /bin/awk \'{print "E " $0}\' "$out_dir/$i.err" '
+                '2>/dev/null',
+                'done',
+                'exit 0']
+
+    def get_parallel_script(self, cmds):
+        """
+        Function to return a script which runs commands concurrently on
+        the node and reports each one's output, return code and timing.
+
+        Args:
+            cmds (list): The commands to run.
+
+        Return:
+            list. The lines of the script. Its output is parsed with
+            parse_script_output.
+        """
+        lines = ['out_dir=$(/bin/mktemp -d /tmp/mnlibvirt_cmds.XXXXXX)',
+                 "trap '/bin/rm -rf \"$out_dir\"' EXIT"]
+        for index, cmd in enumerate(cmds):
+            lines.append('(')
+            lines.extend(self._get_capture_lines(index, cmd))
+            lines.append(') &')
+        lines.append('wait')
+        lines.extend(self._get_report_lines(len(cmds)))
+        return lines
+
+    def get_sequential_script(self, cmds, stop_on_error=False):
+        """
+        Function to return a script which runs commands one after the
+        other on the node and reports each one's output, return code and
+        timing.
+
+        Args:
+            cmds (list): The commands to run, in order.
+
+            stop_on_error (bool): If True, the commands after the first
+                                  one to fail are not run. Otherwise
+                                  every command is run whatever the
+                                  outcome of those before it.
+
+        Return:
+            list. The lines of the script. Its output is parsed with
+            parse_script_output.
+        """
+        lines = ['out_dir=$(/bin/mktemp -d /tmp/mnlibvirt_cmds.XXXXXX)',
+                 "trap '/bin/rm -rf \"$out_dir\"' EXIT",
+                 'failed=0']
+        for index, cmd in enumerate(cmds):
+            if stop_on_error:
+                lines.append('if [ "$failed" -eq 0 ]; then')
+                lines.extend(self._get_capture_lines(index, cmd))
+                lines.append('    [ "$rc" -eq 0 ] || failed=1')
+                lines.append('fi')
+            else:
+                lines.extend(self._get_capture_lines(index, cmd))
+        lines.extend(self._get_report_lines(len(cmds)))
+        return lines
+
+    @staticmethod
+    def parse_script_output(names, stdout):
+        """
+        Function to split the output of a script built by this class
+        into the results of the individual commands.
+
+        Args:
+            names (list): A name for each command, in the order the
+                          commands were given.
+
+            stdout (list): The script's output lines.
+
+        Return:
+            list. A CmdResult per command, in the order given. A command
+            whose results are missing from the output, e.g. because it
+            was not run or the script was killed, is reported with a
+            return code of None.
+        """
+        results = {}
+        current = None
+        for line in stdout:
+            fields = line.split()
+            if fields and fields[0] == RESULT_MARKER:
+                current = None
+                if len(fields) == 5:
+                    current = int(fields[1])
+                    results[current] = ([], [], int(fields[2]),
+                                        float(fields[3]), float(fields[4]))
+            elif current is not None and line[:1] in ('O', 'E'):
+                stream = results[current][0 if line[0] == 'O' else 1]
+                stream.append(line[2:])
+        return [CmdResult(name, *results[cmd_index])
+                if cmd_index in results
+                else CmdResult(name, [], [], None, 0.0, 0.0)
+                for cmd_index, name in enumerate(names)]
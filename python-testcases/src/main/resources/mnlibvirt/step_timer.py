@@ -0,0 +1,174 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Breaks the time of a test down by the helpers it runs, with
+            the remote commands each one issues.
+"""
+
+import functools
+import time
+from contextlib import contextmanager
+
+
+def timed_step(method):
+    """
+    Decorator timing a test helper as a step of the test's step_timer.
+    Helpers called by the helper become steps nested in its step.
+
+    Args:
+        method (function): The helper method.
+
+    Return:
+        function. The timed method.
+    """
+    @functools.wraps(method)
+    def timed_method(self, *args, **kwargs):
+        timer = getattr(self, 'step_timer', None)
+        if timer is None:
+            return method(self, *args, **kwargs)
+        with timer.step(method.__name__):
+            return method(self, *args, **kwargs)
+    return timed_method
+
+
+class StepTimer(object):
+    """
+    Records the steps of a test as a tree, keyed by the names of the
+    steps from the test down.
+
+    Each step records the number of times it ran, the wall time spent
+    in it, children included, and the remote commands run directly in
+    it with the bytes they sent and received.
+    """
+
+    def __init__(self, test_name):
+        """
+        Args:
+            test_name (str): The name of the root step.
+        """
+        self.stack = [test_name]
+        self.steps = {}
+        self.start_times = [time.time()]
+
+    def _get_totals(self, path):
+        """
+        Return the totals of a step, created at zero.
+        """
+        if path not in self.steps:
+            self.steps[path] = {'calls': 0, 'seconds': 0.0, 'cmds': 0,
+                                'bytes': 0}
+        return self.steps[path]
+
+    @contextmanager
+    def step(self, name):
+        """
+        Time the code run in the context as a step nested in the
+        current one.
+
+        Args:
+            name (str): The name of the step.
+        """
+        self.stack.append(name)
+        self.start_times.append(time.time())
+        try:
+            yield
+        finally:
+            totals = self._get_totals(tuple(self.stack))
+            totals['calls'] += 1
+            totals['seconds'] += time.time() - self.start_times.pop()
+            self.stack.pop()
+
+    def count_cmd(self, bytes_sent, bytes_received):
+        """
+        Record a remote command against the current step.
+
+        Args:
+            bytes_sent (int): The length of the command.
+
+            bytes_received (int): The length of its output.
+        """
+        totals = self._get_totals(tuple(self.stack))
+        totals['cmds'] += 1
+        totals['bytes'] += bytes_sent + bytes_received
+
+    def stop(self):
+        """
+        End the root step. Steps still open are left out.
+        """
+        totals = self._get_totals(tuple(self.stack[:1]))
+        totals['calls'] = 1
+        totals['seconds'] = time.time() - self.start_times[0]
+
+    def _get_children(self, path):
+        """
+        Return the paths of the steps directly nested in a step.
+        """
+        return [other for other in self.steps
+                if len(other) == len(path) + 1 and other[:-1] == path]
+
+    def get_self_seconds(self, path):
+        """
+        Function to return the wall time of a step spent outside the
+        steps nested in it.
+
+        Args:
+            path (tuple): The names of the step and the steps it is
+                          nested in.
+
+        Return:
+            float. The seconds, never negative.
+        """
+        return max(0.0, self.steps[path]['seconds'] -
+                   sum(self.steps[child]['seconds']
+                       for child in self._get_children(path)))
+
+    def get_step_totals(self):
+        """
+        Function to return the calls and wall time of each step.
+
+        Return:
+            list. (step, calls, seconds) tuples, the step being the
+            names of the step and the steps it is nested in, joined by
+            ";".
+        """
+        return [(';'.join(path), self.steps[path]['calls'],
+                 self.steps[path]['seconds'])
+                for path in sorted(self.steps)]
+
+    def get_folded_lines(self):
+        """
+        Function to return the steps in the folded stack format read by
+        flame graph tools, weighted by their own wall time.
+
+        Return:
+            list. "<root>;<step>;<nested step> <milliseconds>" lines.
+        """
+        return ['{0} {1}'.format(';'.join(path),
+                                 int(round(self.get_self_seconds(path) *
+                                           1000)))
+                for path in sorted(self.steps)]
+
+    def format_summary(self):
+        """
+        Function to return a table of the steps, nested steps indented
+        under their parents.
+
+        Return:
+            list. The lines of the table.
+        """
+        lines = ['{0:<48} {1:>5} {2:>9} {3:>9} {4:>5} {5:>10}'.format(
+            'step', 'calls', 'total s', 'self s', 'cmds', 'bytes')]
+        for path in sorted(self.steps):
+            totals = self.steps[path]
+            lines.append(
+                '{0:<48} {1:>5} {2:>9.2f} {3:>9.2f} {4:>5} {5:>10}'.format(
+                    '  ' * (len(path) - 1) + path[-1], totals['calls'],
+                    totals['seconds'], self.get_self_seconds(path),
+                    totals['cmds'], totals['bytes']))
+        return lines
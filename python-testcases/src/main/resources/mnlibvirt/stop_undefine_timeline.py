@@ -0,0 +1,325 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Graceful and force-destroy phases of a stop-undefine run,
+            timed from the adaptor's log.
+"""
+
+import calendar
+import os
+import re
+import time
+
+from log_follower import LogFollower
+from step_timer import timed_step
+
+# Lines the adaptor logs when the graceful shutdown is given up and the
+# VM is destroyed
+FORCE_DESTROY_PATTERNS = ['calling force-stop',
+                          'Attempting to destroy Service']
+
+# Lines the adaptor logs once the VM has shut down, or has been undefined
+# after it did. The word boundaries keep "last_undefined_vm" out.
+GRACEFUL_END = re.compile(r'\b(?:shut down|undefined)\b')
+
+# Timestamps of the log lines, e.g. "2026-10-18 09:41:25,123" as written
+# by the logging module, or "Oct 18 09:41:25" as written by syslog
+ISO_TIME = re.compile(r'(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2}):(\d{2})'
+                      r'(?:[.,](\d+))?')
+SYSLOG_TIME = re.compile(r'^([A-Z][a-z]{2}) +(\d{1,2}) '
+                         r'(\d{2}):(\d{2}):(\d{2})')
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
+          'Oct', 'Nov', 'Dec']
+
+STOP_TIMEOUT = re.compile(r'--stop-timeout[= ](\d+)')
+
+
+def get_stop_timeout(verb):
+    """
+    Function to return the stop timeout given to an adaptor verb.
+
+    Args:
+        verb (str): The verb and its options, e.g.
+                    "stop-undefine --stop-timeout=33".
+
+    Return:
+        int. The seconds, None if the verb has no --stop-timeout.
+    """
+    match = STOP_TIMEOUT.search(verb)
+    return int(match.group(1)) if match else None
+
+
+def get_utc_offset(date_z):
+    """
+    Function to return the offset of a node's local time from UTC.
+
+    Args:
+        date_z (str): The output of "date +%z" on the node, e.g.
+                      "+0100".
+
+    Return:
+        int. The offset, in seconds.
+    """
+    sign = -1 if date_z.startswith('-') else 1
+    return sign * (int(date_z[1:3]) * 3600 + int(date_z[3:5]) * 60)
+
+
+def parse_log_time(line, utc_offset, year):
+    """
+    Function to return the time a log line was written at.
+
+    Args:
+        line (str): The log line.
+
+        utc_offset (int): The offset of the node's local time from UTC,
+                          in seconds.
+
+        year (int): The year, for syslog timestamps which have none.
+
+    Return:
+        float. Epoch seconds, None if the line has no timestamp.
+    """
+    match = ISO_TIME.search(line)
+    if match:
+        fields = [int(field) for field in match.groups()[:6]]
+        fraction = float('0.' + match.group(7)) if match.group(7) else 0.0
+    else:
+        match = SYSLOG_TIME.search(line)
+        if not match or match.group(1) not in MONTHS:
+            return None
+        fields = [year, MONTHS.index(match.group(1)) + 1] + \
+            [int(field) for field in match.groups()[1:]]
+        fraction = 0.0
+    return calendar.timegm(fields + [0, 0, 0]) - utc_offset + fraction
+
+
+class StopUndefineTimeline(object):
+    """
+    The phases of a stop-undefine run, in epoch seconds on the node.
+
+    The graceful shutdown starts with the run. force_destroy_time is the
+    first force-destroy line the adaptor logged during the run, None if
+    the VM was not force-destroyed; graceful_end_time the first line
+    logged once the VM shut down, None if there was none. The undefine
+    is complete when the run ends.
+    """
+
+    def __init__(self, verb, start_time, end_time, force_destroy_time=None,
+                 force_destroy_line=None, graceful_end_time=None):
+        """
+        Args:
+            verb (str): The verb run, with its options.
+
+            start_time (float): When the run started.
+
+            end_time (float): When the run ended.
+
+            force_destroy_time (float): When the VM was force-destroyed.
+
+            force_destroy_line (str): The log line it was logged in.
+
+            graceful_end_time (float): When the VM was logged as shut
+                                       down.
+        """
+        self.verb = verb
+        self.stop_timeout = get_stop_timeout(verb)
+        self.start_time = start_time
+        self.end_time = end_time
+        self.force_destroy_time = force_destroy_time
+        self.force_destroy_line = force_destroy_line
+        self.graceful_end_time = graceful_end_time
+
+    @classmethod
+    def from_log(cls, verb, start_time, end_time, log_lines, utc_offset):
+        """
+        Function to return the timeline of a run from the lines the
+        adaptor logged during it.
+
+        Args:
+            verb (str): The verb run, with its options.
+
+            start_time (float): When the run started, on the node.
+
+            end_time (float): When the run ended, on the node.
+
+            log_lines (list): The adaptor log lines written during it.
+
+            utc_offset (int): The offset of the node's local time from
+                              UTC, in seconds.
+
+        Return:
+            StopUndefineTimeline. The timeline.
+        """
+        year = time.gmtime(start_time).tm_year
+        force_destroy_line = None
+        graceful_end_line = None
+        for line in log_lines:
+            if force_destroy_line is None and \
+                    any(pattern in line for pattern in FORCE_DESTROY_PATTERNS):
+                force_destroy_line = line
+            elif graceful_end_line is None and GRACEFUL_END.search(line):
+                graceful_end_line = line
+        return cls(verb, start_time, end_time,
+                   parse_log_time(force_destroy_line, utc_offset, year)
+                   if force_destroy_line else None,
+                   force_destroy_line,
+                   parse_log_time(graceful_end_line, utc_offset, year)
+                   if graceful_end_line else None)
+
+    @property
+    def duration(self):
+        """
+        The seconds the run took.
+        """
+        return self.end_time - self.start_time
+
+    @property
+    def graceful_seconds(self):
+        """
+        The seconds the VM was given to shut down before it was
+        force-destroyed, or took to shut down if it was not. None if
+        neither was logged with a timestamp.
+        """
+        end_time = self.force_destroy_time or self.graceful_end_time
+        if end_time is None:
+            return None
+        return end_time - self.start_time
+
+    @property
+    def undefine_seconds(self):
+        """
+        The seconds from the force-destroy to the end of the run, None
+        if the VM was not force-destroyed.
+        """
+        if self.force_destroy_time is None:
+            return None
+        return self.end_time - self.force_destroy_time
+
+    def format_summary(self):
+        """
+        Function to return a one line summary of the timeline.
+
+        Return:
+            str. The summary.
+        """
+        summary = '"{0}" took {1:.1f}s'.format(self.verb, self.duration)
+        if self.graceful_seconds is not None:
+            summary += ', graceful shutdown {0:.1f}s'.format(
+                self.graceful_seconds)
+        if self.force_destroy_time is not None:
+            summary += ', undefined {0:.1f}s after the force-destroy'.format(
+                self.undefine_seconds)
+        return summary
+
+
+class StopUndefineTimelineMixin(object):
+    """
+    Test helpers timing the phases of a stop-undefine run against the
+    adaptor's log, and checking them against its --stop-timeout.
+    """
+
+    # Seconds by which a stop-undefine may miss its --stop-timeout, see
+    # assert_stop_undefine_timeline
+    stop_timeout_tolerance = int(
+        os.environ.get('MNLIBVIRT_STOP_TIMEOUT_TOLERANCE', '10'))
+
+    # The adaptor's log on the nodes
+    libvirt_log = None
+
+    @timed_step
+    def run_timed_stop_undefine(self, node, vm_service_name, verb):
+        """
+        Description:
+            Run stop-undefine or force-stop-undefine against a vm-service
+            with run_libvirt_service_cmd, and place its phases on the
+            node's clock: the graceful shutdown from the start of the
+            run, the force-destroy or shutdown from the adaptor log, and
+            the undefine up to the end of the run.
+
+            The node's clock is read with the log's size before the run,
+            and with the lines logged during it after, so the run costs
+            two round trips more than the verb.
+
+        Args:
+            node (str): The node the vm-service runs on.
+
+            vm_service_name (str): The name of the vm-service.
+
+            verb (str): The verb and its options, e.g.
+                        "stop-undefine --stop-timeout=33".
+
+        Returns:
+            StopUndefineTimeline. The phases of the run.
+        """
+        follower = LogFollower(node, [self.libvirt_log])
+        mark_result, start_result, offset_result = self.run_cmd_batch(
+            node, [('mark', follower.get_mark_cmd()),
+                   ('start', '/bin/date +%s.%N'),
+                   ('utc_offset', '/bin/date +%z')])
+        self.assert_cmd_results_ok([mark_result, start_result,
+                                    offset_result])
+        follower.mark(mark_result.stdout)
+
+        self.run_libvirt_service_cmd(node, vm_service_name, verb)
+
+        log_result, end_result = self.run_cmd_batch(node, [
+            ('log', follower.get_read_cmd(self.libvirt_log)),
+            ('end', '/bin/date +%s.%N')])
+        self.assert_cmd_results_ok([log_result, end_result])
+        timeline = StopUndefineTimeline.from_log(
+            verb, float(start_result.stdout[0]), float(end_result.stdout[0]),
+            log_result.stdout, get_utc_offset(offset_result.stdout[0]))
+        self.log("info", timeline.format_summary())
+        return timeline
+
+    def assert_stop_undefine_timeline(self, timeline, force_destroyed=None):
+        """
+        Description:
+            Assert that a stop-undefine kept to its --stop-timeout,
+            within stop_timeout_tolerance: a VM which shut down did so
+            before the timeout, a VM which did not was force-destroyed
+            when it elapsed, and the undefine followed promptly.
+
+        Args:
+            timeline (StopUndefineTimeline): The run, from
+                                             run_timed_stop_undefine.
+
+            force_destroyed (bool): Whether the VM is expected to have
+                                    been force-destroyed. Either is
+                                    accepted if None.
+        """
+        if force_destroyed is not None:
+            self.assertEqual(force_destroyed,
+                             timeline.force_destroy_line is not None,
+                             '"{0}" force-destroyed the VM: {1}'.format(
+                                 timeline.verb, timeline.force_destroy_line))
+        if timeline.force_destroy_line is None:
+            # WITHOUT A SHUTDOWN LINE IN THE LOG THE END OF THE GRACEFUL
+            # PHASE IS NOT KNOWN, SO IT IS NOT CHECKED
+            if timeline.stop_timeout is not None and \
+                    timeline.graceful_seconds is not None:
+                self.assertTrue(
+                    timeline.graceful_seconds <=
+                    timeline.stop_timeout + self.stop_timeout_tolerance,
+                    '"{0}" took {1:.1f}s to stop the VM'.format(
+                        timeline.verb, timeline.graceful_seconds))
+            return
+        self.assertNotEqual(None, timeline.force_destroy_time,
+                            'No timestamp in "{0}"'.format(
+                                timeline.force_destroy_line))
+        if timeline.stop_timeout is not None:
+            self.assertTrue(
+                abs(timeline.graceful_seconds - timeline.stop_timeout) <=
+                self.stop_timeout_tolerance,
+                '"{0}" force-destroyed the VM after {1:.1f}s'.format(
+                    timeline.verb, timeline.graceful_seconds))
+        self.assertTrue(
+            timeline.undefine_seconds <= self.stop_timeout_tolerance,
+            '"{0}" undefined the VM {1:.1f}s after destroying it'.format(
+                timeline.verb, timeline.undefine_seconds))
@@ -0,0 +1,74 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of adaptor_cmd_utils.
+"""
+
+import subprocess
+import time
+import unittest
+
+from nose.plugins.attrib import attr
+
+from adaptor_cmd_utils import AdaptorCmdUtils, DEADLINE_RETURN_CODE
+
+
+@attr('all', 'unit')
+class TestAdaptorCmdUtils(unittest.TestCase):
+
+    def setUp(self):
+        self.adaptor_cmds = AdaptorCmdUtils()
+
+    def test_adaptor_and_service_cmds(self):
+        self.assertEqual('/usr/share/litp_libvirt/vm_utils vm1 '
+                         'stop-undefine --stop-timeout 20',
+                         AdaptorCmdUtils.get_adaptor_cmd(
+                             'vm1', 'stop-undefine --stop-timeout 20'))
+        self.assertEqual('/usr/bin/timeout 60 /sbin/service vm1 start',
+                         AdaptorCmdUtils.get_service_cmd('vm1', 'start',
+                                                         timeout=60.5))
+
+    def test_deadline_cmd_passes_command_through(self):
+        process = subprocess.Popen(
+            ['/bin/bash', '-c', self.adaptor_cmds.get_deadline_cmd(
+                "echo 'a  b' && exit 3", 10)],
+            stdout=subprocess.PIPE)
+        stdout = process.communicate()[0].decode('utf-8')
+        self.assertEqual('a  b\n', stdout)
+        self.assertEqual(3, process.returncode)
+
+    def test_deadline_cmd_ends_command_on_node(self):
+        start_time = time.time()
+        return_code = subprocess.call(
+            ['/bin/bash', '-c', self.adaptor_cmds.get_deadline_cmd(
+                '/bin/sleep 30; /bin/sleep 30', 1)])
+        self.assertEqual(DEADLINE_RETURN_CODE, return_code)
+        self.assertTrue(time.time() - start_time < 10)
+
+    def test_diagnostic_cmds_kill_first(self):
+        names = [name for name, _ in self.adaptor_cmds.get_diagnostic_cmds(
+            'vm1', '/var/log/litp/litp_libvirt.log', log_lines=20)]
+        self.assertEqual(['killed processes', 'virsh list', 'virsh dominfo',
+                          'adaptor log'], names)
+        cmd = self.adaptor_cmds.get_kill_cmd('vm1')
+        self.assertTrue("'([v]m_utils|[s]ystemctl [a-z-]+|[s]ervice) "
+                        "vm1( |$)'" in cmd)
+
+    def test_console_wait_script(self):
+        script = self.adaptor_cmds.get_console_wait_script(
+            'vm1', 'vm1 login:', 600)
+        self.assertTrue('end=$((SECONDS + 600))' in script)
+        self.assertTrue("    /bin/grep -q -m 1 -F -- 'vm1 login:' < "
+                        '"$fifo"' in script)
+        self.assertEqual('exit {0}'.format(DEADLINE_RETURN_CODE),
+                         script[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
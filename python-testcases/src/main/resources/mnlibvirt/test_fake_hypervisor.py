@@ -0,0 +1,85 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of fake_hypervisor.
+"""
+
+import base64
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from nose.plugins.attrib import attr
+
+from fake_hypervisor import FakeHypervisor, FAKE_FILES, FAKE_MS_IMAGES
+from remote_cmd_utils import RemoteCmdUtils
+from vm_image_utils import VMImageUtils
+
+
+def run(cmd):
+    """
+    Run a command as run_command would on the node, returning its output
+    lines and return code.
+    """
+    process = subprocess.Popen(['/bin/bash', '-c', cmd],
+                               stdout=subprocess.PIPE)
+    stdout = process.communicate()[0].decode('utf-8')
+    return stdout.splitlines(), process.returncode
+
+
+@attr('all', 'unit')
+class TestFakeHypervisor(unittest.TestCase):
+
+    def setUp(self):
+        self.fake = FakeHypervisor()
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_image_profiles(self):
+        self.assertEqual(sorted(FAKE_MS_IMAGES),
+                         FakeHypervisor.get_ms_image_names())
+        self.assertEqual({'status': 503, 'boot_seconds': 2,
+                          'shutdown_seconds': 1},
+                         json.loads(FakeHypervisor.get_image_lines(
+                             'vm_test_image_neg-2-1.0.7.qcow2')[0]))
+        self.assertEqual({'status': 200, 'boot_seconds': 2,
+                          'shutdown_seconds': 1},
+                         json.loads(FakeHypervisor.get_image_lines(
+                             'vm_test_image-1-1.0.8.qcow2')[0]))
+
+    def test_checksum_matches_written_image(self):
+        image_name = 'vm_test_image_neg-1-1.0.7.qcow2'
+        path = os.path.join(self.tmp_dir, image_name)
+        self.assertEqual(0, run(RemoteCmdUtils.get_write_file_cmd(
+            path, FakeHypervisor.get_image_lines(image_name)))[1])
+        self.assertEqual([self.fake.get_image_checksum(image_name)],
+                         run(VMImageUtils.get_checksum_cmd(path))[0])
+
+    def test_check_cmd_fails_where_not_installed(self):
+        self.assertEqual(1, run(self.fake.get_check_cmd())[1])
+
+    def test_install_cmd_writes_every_file(self):
+        # THE SCRIPT IS SHIPPED BASE64 ENCODED
+        script = base64.b64decode(
+            self.fake.get_install_cmd().split()[1]).decode('utf-8')
+        for filename, path in FAKE_FILES.items():
+            with open(os.path.join(self.fake.files_dir,
+                                   filename)) as fake_file:
+                lines = fake_file.read().rstrip('\n').split('\n')
+            self.assertTrue(RemoteCmdUtils.get_write_file_cmd(path, lines)
+                            in script.splitlines(), filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
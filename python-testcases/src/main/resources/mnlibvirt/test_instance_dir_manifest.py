@@ -0,0 +1,70 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of instance_dir_manifest.
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+
+from instance_dir_manifest import InstanceDirManifest
+
+
+@attr('all', 'unit')
+class TestInstanceDirManifest(unittest.TestCase):
+
+    FIND_LINES = ['rhel.img\t1024\t1760780485.5',
+                  'config.json\t300\t1760780480.0',
+                  'user-data.live\t20\t1760780481.0',
+                  'last_undefined_vm/rhel.img-20261018\t1024\t1760780490.0',
+                  'last_undefined_vm/my-vm.live-20261018\t20\t1760780490.0',
+                  'other/ignored.txt\t1\t1760780490.0',
+                  '']
+
+    MD5_LINES = ['d41d8cd98f00b204e9800998ecf8427e  ./rhel.img',
+                 '0cc175b9c0f1b6a831c399e269772661  '
+                 './last_undefined_vm/rhel.img-20261018']
+
+    def test_archived_keyed_by_unsuffixed_name(self):
+        manifest = InstanceDirManifest.from_lines(self.FIND_LINES)
+        self.assertEqual(set(['rhel.img', 'my-vm.live']),
+                         set(manifest.archived))
+        self.assertEqual(set(['20261018']), manifest.archive_suffixes)
+        entry = manifest.archived['rhel.img']
+        self.assertEqual('rhel.img-20261018', entry.name)
+        self.assertEqual(1024, entry.size)
+        self.assertEqual(1760780490.0, entry.mtime)
+
+    def test_files_of_other_dirs_left_out(self):
+        manifest = InstanceDirManifest.from_lines(self.FIND_LINES)
+        self.assertEqual(set(['rhel.img', 'config.json', 'user-data.live']),
+                         set(manifest.files))
+        self.assertEqual(set(['user-data.live']), manifest.get_live_files())
+
+    def test_checksums(self):
+        manifest = InstanceDirManifest.from_lines(self.FIND_LINES,
+                                                  self.MD5_LINES)
+        self.assertEqual('d41d8cd98f00b204e9800998ecf8427e',
+                         manifest.files['rhel.img'].md5)
+        self.assertEqual('0cc175b9c0f1b6a831c399e269772661',
+                         manifest.archived['rhel.img'].md5)
+        self.assertEqual(None, manifest.files['config.json'].md5)
+        self.assertEqual(None, manifest.archived['my-vm.live'].md5)
+
+    def test_md5_cmd_matches_archived_copies(self):
+        cmd = InstanceDirManifest.get_md5_cmd('/var/lib/libvirt/instances/vm',
+                                              ['rhel.img'])
+        self.assertTrue(cmd.startswith('cd /var/lib/libvirt/instances/vm'))
+        self.assertTrue("-path './rhel.img' -o "
+                        "-path './last_undefined_vm/rhel.img-*'" in cmd)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of latency_stats.
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+
+from latency_stats import LatencyStats
+
+
+@attr('all', 'unit')
+class TestLatencyStats(unittest.TestCase):
+
+    def test_percentile_nearest_rank(self):
+        samples = [float(value) for value in range(1, 21)]
+        self.assertEqual(10.0, LatencyStats.get_percentile(samples, 50))
+        self.assertEqual(19.0, LatencyStats.get_percentile(samples, 95))
+        self.assertEqual(20.0, LatencyStats.get_percentile(samples, 99))
+        self.assertEqual(7.0, LatencyStats.get_percentile([7.0], 50))
+        self.assertEqual(None, LatencyStats.get_percentile([], 50))
+
+    def test_summary(self):
+        stats = LatencyStats(('image', 'verb'))
+        stats.add(('qcow2', 'start'), 2.0)
+        stats.add(('raw', 'start'), 1.0)
+        stats.add(('qcow2', 'start'), 4.0)
+        stats.add_failure(('raw', 'stop'))
+        summary = stats.get_summary()
+        self.assertEqual([('qcow2', 'start'), ('raw', 'start'),
+                          ('raw', 'stop')],
+                         [(group['image'], group['verb'])
+                          for group in summary])
+        self.assertEqual(2, summary[0]['count'])
+        self.assertEqual(3.0, summary[0]['mean'])
+        self.assertEqual(4.0, summary[0]['p99'])
+        self.assertEqual(None, summary[2]['p50'])
+        self.assertEqual([('raw', 'stop')], stats.get_failed_keys())
+        lines = stats.format_summary()
+        self.assertEqual(4, len(lines))
+        self.assertTrue(lines[0].startswith('image/verb'))
+        self.assertTrue(lines[3].split()[-1] == '-')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of litp_model_batch.
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+
+from litp_model_batch import CREATE, INHERIT, UPDATE, LitpModelBatch
+
+
+@attr('all', 'unit')
+class TestLitpModelBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.batch = LitpModelBatch()
+        self.batch.create('/software/services/vm1', 'vm-service',
+                          "service_name='vm1'")
+        self.batch.create('/software/services/vm1/vm_aliases/ms',
+                          'vm-alias')
+        self.batch.update('/software/services/vm1', "cpus='2'")
+        self.batch.inherit('/deployments/d1/clusters/c1/services/cs1/'
+                           'applications/vm1', '/software/services/vm1')
+
+    def test_changes_kept_in_order(self):
+        self.assertEqual([CREATE, CREATE, UPDATE, INHERIT],
+                         [change.action for change in self.batch.changes])
+        self.assertEqual(('vm-service', "service_name='vm1'"),
+                         self.batch.changes[0].args)
+
+    def test_named_cmds(self):
+        self.assertEqual(
+            [('create /software/services/vm1',
+              "/usr/bin/litp create -p /software/services/vm1 "
+              "-t vm-service -o service_name='vm1'"),
+             ('create /software/services/vm1/vm_aliases/ms',
+              '/usr/bin/litp create -p '
+              '/software/services/vm1/vm_aliases/ms -t vm-alias'),
+             ('update /software/services/vm1',
+              "/usr/bin/litp update -p /software/services/vm1 "
+              "-o cpus='2'"),
+             ('inherit /deployments/d1/clusters/c1/services/cs1/'
+              'applications/vm1',
+              '/usr/bin/litp inherit -p /deployments/d1/clusters/c1/'
+              'services/cs1/applications/vm1 -s /software/services/vm1')],
+            self.batch.get_named_cmds())
+
+    def test_created_urls_leave_out_updates(self):
+        self.assertEqual(['/software/services/vm1',
+                          '/software/services/vm1/vm_aliases/ms',
+                          '/deployments/d1/clusters/c1/services/cs1/'
+                          'applications/vm1'],
+                         self.batch.get_created_urls())
+
+    def test_top_level_urls(self):
+        self.assertEqual(['/software/services/vm1',
+                          '/deployments/d1/clusters/c1/services/cs1/'
+                          'applications/vm1'],
+                         LitpModelBatch.get_top_level_urls(
+                             self.batch.get_created_urls()))
+        # A SIBLING SHARING A PREFIX IS NOT UNDER THE OTHER URL
+        self.assertEqual(['/software/services/vm1',
+                          '/software/services/vm10'],
+                         LitpModelBatch.get_top_level_urls(
+                             ['/software/services/vm1',
+                              '/software/services/vm10']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of litp_model_cache.
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+
+from litp_model_cache import LitpModelCache
+
+EXPORT_LINES = [
+    '<?xml version="1.0" encoding="UTF-8"?>',
+    '<litp:software xmlns:litp="http://www.ericsson.com/litp" id="software">',
+    '  <litp:software-services-collection id="services">',
+    '    <litp:vm-service id="vm1">',
+    '      <cpus>2</cpus>',
+    '      <service_name>vm1</service_name>',
+    '      <litp:vm-service-vm_aliases-collection id="vm_aliases">',
+    '        <litp:vm-alias id="ms">',
+    '          <alias_names>ms1</alias_names>',
+    '        </litp:vm-alias>',
+    '      </litp:vm-service-vm_aliases-collection>',
+    '    </litp:vm-service>',
+    '    <litp:vm-service id="vm10">',
+    '      <service_name>vm10</service_name>',
+    '    </litp:vm-service>',
+    '  </litp:software-services-collection>',
+    '</litp:software>']
+
+
+@attr('all', 'unit')
+class TestLitpModelCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = LitpModelCache()
+        self.cache.load('/software/', EXPORT_LINES)
+
+    def test_covers(self):
+        self.assertTrue(self.cache.covers('/software'))
+        self.assertTrue(self.cache.covers('/software/services/vm1/'))
+        self.assertFalse(self.cache.covers('/softwares'))
+        self.assertFalse(self.cache.covers('/deployments'))
+        self.cache.clear()
+        self.assertFalse(self.cache.covers('/software'))
+
+    def test_find(self):
+        self.assertEqual(['/software/services/vm1',
+                          '/software/services/vm10'],
+                         self.cache.find('/software', 'vm-service'))
+        self.assertEqual(['/software/services/vm1/vm_aliases/ms'],
+                         self.cache.find('/software/services/vm1',
+                                         'vm-alias'))
+        # A SIBLING SHARING A PREFIX IS NOT UNDER THE PATH
+        self.assertEqual(['/software/services/vm1'],
+                         self.cache.find('/software/services/vm1',
+                                         'vm-service'))
+
+    def test_get_props(self):
+        self.assertEqual(('vm-service', {'cpus': '2',
+                                         'service_name': 'vm1'}),
+                         self.cache.get_props('/software/services/vm1/'))
+        self.assertEqual(('software-services-collection', {}),
+                         self.cache.get_props('/software/services'))
+        self.assertEqual(None, self.cache.get_props('/software/items'))
+
+    def test_complete_types(self):
+        self.assertTrue(LitpModelCache.is_complete_type('vm-service'))
+        self.assertFalse(LitpModelCache.is_complete_type(
+            'vm-service-inherit'))
+        self.assertFalse(LitpModelCache.is_complete_type(
+            'software-services-collection'))
+
+
+if __name__ == '__main__':
+    unittest.main()
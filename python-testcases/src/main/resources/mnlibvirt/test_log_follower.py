@@ -0,0 +1,111 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of log_follower.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from nose.plugins.attrib import attr
+
+from log_follower import LogFollower
+
+
+@attr('all', 'unit')
+class TestLogFollower(unittest.TestCase):
+
+    def setUp(self):
+        self.follower = LogFollower('node1', ['/var/log/messages',
+                                              '/var/log/adaptor.log'])
+        self.follower.mark(['100', '0'])
+
+    def test_mark(self):
+        self.assertEqual({'/var/log/messages': 100,
+                          '/var/log/adaptor.log': 0},
+                         self.follower.start_offsets)
+        self.assertEqual(self.follower.start_offsets, self.follower.offsets)
+
+    def test_update_with_match(self):
+        match = self.follower.update(
+            ['shut down', 'undefined'],
+            ['M 1 1 250 2026-10-18 09:41:25 VM test undefined'])
+        self.assertEqual(('/var/log/adaptor.log', 'undefined',
+                          '2026-10-18 09:41:25 VM test undefined'), match)
+        self.assertEqual(250, self.follower.offsets['/var/log/adaptor.log'])
+        self.assertEqual(100, self.follower.offsets['/var/log/messages'])
+
+    def test_update_without_match(self):
+        match = self.follower.update(['undefined'], ['O 180 40'])
+        self.assertEqual(None, match)
+        self.assertEqual({'/var/log/messages': 180,
+                          '/var/log/adaptor.log': 40},
+                         self.follower.offsets)
+        self.assertEqual(100,
+                         self.follower.start_offsets['/var/log/messages'])
+
+
+def run(cmd):
+    """
+    Run a command as run_command would on the node, returning its output
+    lines and return code.
+    """
+    process = subprocess.Popen(['/bin/bash', '-c', cmd],
+                               stdout=subprocess.PIPE)
+    stdout = process.communicate()[0].decode('utf-8')
+    return stdout.splitlines(), process.returncode
+
+
+@attr('all', 'unit')
+class TestLogFollowerCmds(unittest.TestCase):
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.log_dir, 'adaptor.log')
+        self.write('Attempting to destroy Service vm0\n')
+        self.follower = LogFollower('node1', [self.path])
+        self.follower.mark(run(self.follower.get_mark_cmd())[0])
+
+    def tearDown(self):
+        shutil.rmtree(self.log_dir)
+
+    def write(self, text, mode='a'):
+        """
+        Write text to the followed log.
+        """
+        with open(self.path, mode) as log:
+            log.write(text)
+
+    def test_scan_reads_only_new_lines(self):
+        cmd = self.follower.get_scan_cmd(self.path, 'destroy')
+        self.assertEqual(([], 1), run(cmd))
+        self.write('Attempting to destroy Service vm1\n')
+        self.assertEqual((['Attempting to destroy Service vm1'], 0),
+                         run(cmd))
+
+    def test_scan_of_last_lines(self):
+        self.write('Attempting to destroy Service vm1\nline 2\nline 3\n'
+                   'line 4\n')
+        self.assertEqual(([], 1), run(self.follower.get_scan_cmd(
+            self.path, 'destroy', last_lines=3)))
+
+    def test_shrunk_file_is_read_from_start(self):
+        # THE LOG IS ROTATED AND A SHORTER LINE WRITTEN TO THE NEW ONE
+        self.write('destroy vm1\n', mode='w')
+        self.assertEqual((['destroy vm1'], 0), run(
+            self.follower.get_scan_cmd(self.path, 'destroy')))
+        self.assertEqual((['destroy vm1'], 0), run(
+            self.follower.get_read_cmd(self.path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of node_lease.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from nose.plugins.attrib import attr
+
+import node_lease
+from node_lease import DependencyLease, NodeLease, DEPENDENCIES_INSTALL, \
+    DEPENDENCIES_READY, DEPENDENCIES_WAIT
+
+
+def run(cmd):
+    """
+    Run a command as run_command would on the node, returning its output
+    lines and return code.
+    """
+    process = subprocess.Popen(['/bin/bash', '-c', cmd],
+                               stdout=subprocess.PIPE)
+    stdout = process.communicate()[0].decode('utf-8')
+    return stdout.splitlines(), process.returncode
+
+
+class LeaseDirTestCase(unittest.TestCase):
+    """
+    Runs the lease scripts locally, against a lease directory of its own.
+    """
+
+    def setUp(self):
+        self.lease_dir = tempfile.mkdtemp()
+        self.saved = (node_lease.LEASE_DIR, node_lease.LEASE_LOCK_FILE,
+                      node_lease.DEPENDENCY_DIR)
+        node_lease.LEASE_DIR = self.lease_dir
+        node_lease.LEASE_LOCK_FILE = self.lease_dir + '/.lock'
+        node_lease.DEPENDENCY_DIR = self.lease_dir + '/.dependencies'
+
+    def tearDown(self):
+        node_lease.LEASE_DIR, node_lease.LEASE_LOCK_FILE, \
+            node_lease.DEPENDENCY_DIR = self.saved
+        shutil.rmtree(self.lease_dir)
+
+
+@attr('all', 'unit')
+class TestNodeLease(LeaseDirTestCase):
+
+    def test_lease_filename(self):
+        self.assertEqual('var_lib_libvirt_images_rhel_1.img',
+                         NodeLease.get_lease_filename(
+                             '/var/lib/libvirt/images/rhel 1.img'))
+
+    def test_overlapping_lease_is_refused_until_released(self):
+        first = NodeLease('node1', ['/tmp/a.img', '/tmp/b.img'], 'host:1')
+        second = NodeLease('node1', ['/tmp/b.img', '/tmp/c.img'], 'host:2')
+        self.assertEqual(0, run(first.get_acquire_cmd(60))[1])
+
+        stdout, return_code = run(second.get_acquire_cmd(60))
+        self.assertEqual(1, return_code)
+        self.assertEqual({self.lease_dir + '/tmp_b.img': 'host:1'},
+                         NodeLease.get_holders(stdout))
+        # NOTHING IS LEASED BY A REFUSED ACQUIRE
+        self.assertFalse(os.path.exists(self.lease_dir + '/tmp_c.img'))
+
+        self.assertEqual(0, run(first.get_release_cmd())[1])
+        self.assertEqual(0, run(second.get_acquire_cmd(60))[1])
+
+    def test_expired_lease_is_taken_over(self):
+        first = NodeLease('node1', ['/tmp/a.img'], 'host:1')
+        second = NodeLease('node1', ['/tmp/a.img'], 'host:2')
+        self.assertEqual(0, run(first.get_acquire_cmd(-1))[1])
+        self.assertEqual(0, run(second.get_acquire_cmd(60))[1])
+        # THE FORMER HOLDER LEAVES A LEASE TAKEN OVER ALONE
+        run(first.get_release_cmd())
+        self.assertEqual(1, run(first.get_acquire_cmd(60))[1])
+
+
+@attr('all', 'unit')
+class TestDependencyLease(LeaseDirTestCase):
+
+    def setUp(self):
+        super(TestDependencyLease, self).setUp()
+        self.removed = os.path.join(self.lease_dir, 'removed')
+        self.remove_cmds = [
+            (pkg, '/bin/echo {0} >> {1}'.format(pkg, self.removed))
+            for pkg in ('adaptor', 'libvirt')]
+
+    def get_removed(self):
+        """
+        Return the packages the remove commands were run for.
+        """
+        if not os.path.exists(self.removed):
+            return []
+        with open(self.removed) as removed:
+            return removed.read().split()
+
+    def test_first_holder_installs_while_others_wait(self):
+        first = DependencyLease('node1', 'host:1:Story6209')
+        second = DependencyLease('node1', 'host:2:Story7535')
+        self.assertEqual([DEPENDENCIES_INSTALL],
+                         run(first.get_acquire_cmd(60))[0])
+        self.assertEqual([DEPENDENCIES_WAIT],
+                         run(second.get_acquire_cmd(60))[0])
+        run(first.get_ready_cmd(['libvirt']))
+        self.assertEqual([DEPENDENCIES_READY],
+                         run(second.get_acquire_cmd(60))[0])
+
+    def test_aborted_install_is_taken_over(self):
+        first = DependencyLease('node1', 'host:1:Story6209')
+        second = DependencyLease('node1', 'host:2:Story7535')
+        run(first.get_acquire_cmd(60))
+        run(first.get_abort_cmd())
+        self.assertEqual([DEPENDENCIES_INSTALL],
+                         run(second.get_acquire_cmd(60))[0])
+
+    def test_last_release_removes_recorded_packages(self):
+        first = DependencyLease('node1', 'host:1:Story6209')
+        second = DependencyLease('node1', 'host:2:Story7535')
+        run(first.get_acquire_cmd(60))
+        run(first.get_ready_cmd(['libvirt']))
+        run(second.get_acquire_cmd(60))
+
+        self.assertEqual(0, run(first.get_release_cmd(self.remove_cmds,
+                                                      60))[1])
+        self.assertEqual([], self.get_removed())
+
+        # THE PACKAGES ARE REMOVED BY THE TIME THE RELEASE RETURNS
+        self.assertEqual(0, run(second.get_release_cmd(self.remove_cmds,
+                                                       60))[1])
+        self.assertEqual(['libvirt'], self.get_removed())
+        self.assertFalse(os.path.exists(node_lease.DEPENDENCY_DIR))
+        self.assertEqual([DEPENDENCIES_INSTALL],
+                         run(first.get_acquire_cmd(60))[0])
+
+    def test_expired_hold_does_not_keep_packages(self):
+        first = DependencyLease('node1', 'host:1:Story6209')
+        second = DependencyLease('node1', 'host:2:Story7535')
+        run(first.get_acquire_cmd(60))
+        run(first.get_ready_cmd(['adaptor', 'libvirt']))
+        run(second.get_acquire_cmd(-1))
+        run(first.get_release_cmd(self.remove_cmds, 60))
+        self.assertEqual(['adaptor', 'libvirt'], self.get_removed())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of plan_monitor.
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+
+from plan_monitor import PLAN_SUCCESSFUL, PlanMonitor
+
+
+@attr('all', 'unit')
+class TestPlanMonitor(unittest.TestCase):
+
+    def test_task_durations(self):
+        monitor = PlanMonitor()
+        state = monitor.update(
+            ['10.0 P Running',
+             '10.0 T Initial\t/ms/services/vm1\tCreate vm1',
+             '10.0 T Initial\t/ms/services/vm2\tCreate vm2',
+             '11.5 T Running\t/ms/services/vm1\tCreate vm1',
+             '12.0 T Running\t/ms/services/vm1\tCreate vm1'])
+        self.assertEqual('Running', state)
+        self.assertFalse(monitor.is_finished())
+        state = monitor.update(
+            ['not a watch line',
+             '14.0 T Success\t/ms/services/vm1\tCreate vm1',
+             '14.5 T Running\t/ms/services/vm2\tCreate vm2',
+             '15.0 P {0}'.format(PLAN_SUCCESSFUL)])
+        self.assertEqual(PLAN_SUCCESSFUL, state)
+        self.assertTrue(monitor.is_finished())
+        self.assertEqual(15.0, monitor.last_time)
+        # vm2 was never seen to end, so it has no duration
+        self.assertEqual([('/ms/services/vm1', 'Create vm1', 2.5)],
+                         monitor.get_task_durations())
+
+
+if __name__ == '__main__':
+    unittest.main()
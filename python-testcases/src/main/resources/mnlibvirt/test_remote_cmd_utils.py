@@ -0,0 +1,78 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of remote_cmd_utils.
+"""
+
+import base64
+import unittest
+
+from nose.plugins.attrib import attr
+
+from remote_cmd_utils import RESULT_MARKER, RemoteCmdUtils
+
+
+@attr('all', 'unit')
+class TestRemoteCmdUtils(unittest.TestCase):
+
+    def test_quote(self):
+        self.assertEqual("'it'\\''s'", RemoteCmdUtils.quote("it's"))
+
+    def test_script_cmd_ships_script_encoded(self):
+        cmd = RemoteCmdUtils.get_script_cmd(['echo "a b"', "echo 'c'"])
+        encoded = cmd.split()[1]
+        self.assertEqual('echo "a b"\necho \'c\'\n',
+                         base64.b64decode(encoded).decode('utf-8'))
+        self.assertTrue(cmd.endswith('| /usr/bin/base64 -d | /bin/bash'))
+
+
+@attr('all', 'unit')
+class TestParseScriptOutput(unittest.TestCase):
+
+    def test_results_split_by_marker(self):
+        stdout = ['{0} 0 0 100.5 101.0'.format(RESULT_MARKER),
+                  'O first line',
+                  'O ',
+                  'E warning',
+                  '{0} 1 3 100.5 102.5'.format(RESULT_MARKER),
+                  'E failed']
+        first, second = RemoteCmdUtils.parse_script_output(['a', 'b'],
+                                                           stdout)
+        self.assertEqual('a', first.name)
+        self.assertEqual(['first line', ''], first.stdout)
+        self.assertEqual(['warning'], first.stderr)
+        self.assertEqual(0, first.rc)
+        self.assertEqual(0.5, first.duration)
+        self.assertEqual([], second.stdout)
+        self.assertEqual(['failed'], second.stderr)
+        self.assertEqual(3, second.rc)
+        self.assertEqual(2.0, second.duration)
+
+    def test_missing_results(self):
+        stdout = ['{0} 1 0 100.0 101.0'.format(RESULT_MARKER),
+                  'O done']
+        first, second = RemoteCmdUtils.parse_script_output(['a', 'b'],
+                                                           stdout)
+        self.assertEqual(None, first.rc)
+        self.assertEqual([], first.stdout)
+        self.assertEqual(0.0, first.duration)
+        self.assertEqual(['done'], second.stdout)
+
+    def test_incomplete_marker_drops_following_lines(self):
+        # a command which was not run has no .rc file to report
+        stdout = ['{0} 0'.format(RESULT_MARKER),
+                  'O stray',
+                  'noise before any marker']
+        result, = RemoteCmdUtils.parse_script_output(['a'], stdout)
+        self.assertEqual(None, result.rc)
+        self.assertEqual([], result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of step_timer.
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+
+import step_timer
+from step_timer import StepTimer, timed_step
+
+
+class FakeClock(object):
+    """
+    Stands in for the time module, the clock only moving when told to.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class Helpers(object):
+
+    def __init__(self, timer, clock):
+        self.step_timer = timer
+        self.clock = clock
+
+    @timed_step
+    def provision(self):
+        self.clock.now += 1.0
+        self.boot()
+        return 'provisioned'
+
+    @timed_step
+    def boot(self):
+        self.clock.now += 2.0
+
+
+@attr('all', 'unit')
+class TestStepTimer(unittest.TestCase):
+
+    def setUp(self):
+        self.saved_time = step_timer.time
+        self.clock = FakeClock()
+        step_timer.time = self.clock
+        self.timer = StepTimer('test_01')
+
+    def tearDown(self):
+        step_timer.time = self.saved_time
+
+    def test_nested_steps(self):
+        helpers = Helpers(self.timer, self.clock)
+        self.assertEqual('provisioned', helpers.provision())
+        helpers.boot()
+        self.clock.now += 0.5
+        self.timer.stop()
+
+        self.assertEqual([('test_01', 1, 5.5),
+                          ('test_01;boot', 1, 2.0),
+                          ('test_01;provision', 1, 3.0),
+                          ('test_01;provision;boot', 1, 2.0)],
+                         self.timer.get_step_totals())
+        self.assertEqual(['test_01 500', 'test_01;boot 2000',
+                          'test_01;provision 1000',
+                          'test_01;provision;boot 2000'],
+                         self.timer.get_folded_lines())
+
+    def test_cmds_counted_against_current_step(self):
+        with self.timer.step('stage'):
+            self.timer.count_cmd(10, 20)
+            self.timer.count_cmd(5, 0)
+        self.timer.count_cmd(1, 1)
+        self.timer.stop()
+        self.assertEqual({'calls': 1, 'seconds': 0.0, 'cmds': 2,
+                          'bytes': 35},
+                         self.timer.steps[('test_01', 'stage')])
+        self.assertEqual(1, self.timer.steps[('test_01',)]['cmds'])
+        summary = self.timer.format_summary()
+        self.assertEqual(3, len(summary))
+        self.assertTrue(summary[2].startswith('  stage '))
+
+    def test_failed_step_is_still_timed(self):
+        def fail():
+            with self.timer.step('start'):
+                self.clock.now += 1.0
+                raise AssertionError('start failed')
+        self.assertRaises(AssertionError, fail)
+        self.assertEqual(['test_01'], self.timer.stack)
+        self.assertEqual(1.0, self.timer.steps[('test_01', 'start')][
+            'seconds'])
+
+    def test_untimed_without_timer(self):
+        helpers = Helpers(None, self.clock)
+        self.assertEqual('provisioned', helpers.provision())
+        self.assertEqual({}, self.timer.steps)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of stop_undefine_timeline.
+"""
+
+import calendar
+import unittest
+
+from nose.plugins.attrib import attr
+
+from stop_undefine_timeline import StopUndefineTimeline, get_stop_timeout, \
+    get_utc_offset, parse_log_time
+
+# 2026-10-18 09:41:25 UTC
+BASE_TIME = calendar.timegm((2026, 10, 18, 9, 41, 25, 0, 0, 0))
+
+
+@attr('all', 'unit')
+class TestTimestamps(unittest.TestCase):
+
+    def test_utc_offset(self):
+        self.assertEqual(3600, get_utc_offset('+0100'))
+        self.assertEqual(-(5 * 3600 + 30 * 60), get_utc_offset('-0530'))
+        self.assertEqual(0, get_utc_offset('+0000'))
+
+    def test_iso_time_with_comma_fraction(self):
+        line = '2026-10-18 10:41:25,250 INFO calling force-stop'
+        self.assertAlmostEqual(BASE_TIME + 0.25,
+                               parse_log_time(line, 3600, 2026))
+
+    def test_iso_time_with_dot_fraction(self):
+        line = 'x 2026-10-18T09:41:25.5 VM test shut down'
+        self.assertAlmostEqual(BASE_TIME + 0.5,
+                               parse_log_time(line, 0, 2026))
+
+    def test_syslog_time_takes_given_year(self):
+        line = 'Oct 18 04:11:25 node1 adaptor: VM test undefined'
+        self.assertEqual(BASE_TIME,
+                         parse_log_time(line, -(5 * 3600 + 30 * 60), 2026))
+
+    def test_syslog_single_digit_day(self):
+        line = 'Oct  8 09:41:25 node1 adaptor: VM test undefined'
+        self.assertEqual(BASE_TIME - 10 * 86400,
+                         parse_log_time(line, 0, 2026))
+
+    def test_line_without_time(self):
+        self.assertEqual(None, parse_log_time('no time here', 0, 2026))
+        self.assertEqual(None,
+                         parse_log_time('Foo 18 09:41:25 node1', 0, 2026))
+
+    def test_stop_timeout(self):
+        self.assertEqual(33,
+                         get_stop_timeout('stop-undefine --stop-timeout=33'))
+        self.assertEqual(5, get_stop_timeout('stop-undefine --stop-timeout 5'))
+        self.assertEqual(None, get_stop_timeout('stop-undefine'))
+
+
+@attr('all', 'unit')
+class TestStopUndefineTimeline(unittest.TestCase):
+
+    def test_force_destroy(self):
+        lines = ['2026-10-18 09:41:26,000 stopping VM',
+                 '2026-10-18 09:41:35,000 calling force-stop',
+                 '2026-10-18 09:41:36,000 Attempting to destroy Service',
+                 '2026-10-18 09:41:37,000 VM test undefined']
+        timeline = StopUndefineTimeline.from_log(
+            'stop-undefine --stop-timeout=10', BASE_TIME, BASE_TIME + 12,
+            lines, 0)
+        self.assertEqual(10, timeline.stop_timeout)
+        self.assertEqual(lines[1], timeline.force_destroy_line)
+        self.assertEqual(10, timeline.graceful_seconds)
+        self.assertEqual(2, timeline.undefine_seconds)
+        self.assertEqual(BASE_TIME + 12, timeline.end_time)
+        self.assertEqual(
+            '"stop-undefine --stop-timeout=10" took 12.0s, graceful '
+            'shutdown 10.0s, undefined 2.0s after the force-destroy',
+            timeline.format_summary())
+
+    def test_graceful_end(self):
+        lines = ['2026-10-18 09:41:26,000 moved to last_undefined_vm',
+                 '2026-10-18 09:41:28,000 VM test shut down',
+                 '2026-10-18 09:41:29,000 VM test undefined']
+        timeline = StopUndefineTimeline.from_log(
+            'stop-undefine', BASE_TIME, BASE_TIME + 5, lines, 0)
+        self.assertEqual(None, timeline.force_destroy_time)
+        self.assertEqual(3, timeline.graceful_seconds)
+        self.assertEqual(None, timeline.undefine_seconds)
+
+    def test_nothing_logged(self):
+        timeline = StopUndefineTimeline.from_log(
+            'stop-undefine', BASE_TIME, BASE_TIME + 1, [], 0)
+        self.assertEqual(None, timeline.graceful_seconds)
+        self.assertEqual('"stop-undefine" took 1.0s',
+                         timeline.format_summary())
+
+
+if __name__ == '__main__':
+    unittest.main()
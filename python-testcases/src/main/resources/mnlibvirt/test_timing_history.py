@@ -0,0 +1,73 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of timing_history.
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+
+from timing_history import MIN_BASELINE_RUNS, TimingHistory
+
+
+@attr('all', 'unit')
+class TestTimingHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.history = TimingHistory(':memory:')
+
+    def tearDown(self):
+        self.history.close()
+
+    def record_baseline(self, seconds):
+        for index, value in enumerate(seconds):
+            self.history.record('base{0}'.format(index), '1.0.0', 'KGB',
+                                'test_01', [('start', 2, value * 2),
+                                            ('stop', 1, 1.0)])
+
+    def test_median(self):
+        self.assertEqual(2.0, TimingHistory.get_median([3, 1, 2]))
+        self.assertEqual(2.5, TimingHistory.get_median([4, 1, 3, 2]))
+
+    def test_baseline_excludes_own_version(self):
+        self.record_baseline([1.0, 1.2])
+        self.history.record('new', '1.1.0', 'KGB', 'test_01',
+                            [('start', 1, 5.0)])
+        self.history.record('other', '1.1.0', 'KGB', 'test_01',
+                            [('start', 1, 9.0)])
+        self.assertEqual(sorted([1.0, 1.2]),
+                         sorted(self.history.get_baseline('new', 'test_01',
+                                                          'start')))
+
+    def test_regression_flagged(self):
+        self.record_baseline([1.0, 1.1, 0.9, 1.0, 1.05, 0.95])
+        self.history.record('new', '1.1.0', 'KGB', 'test_01',
+                            [('start', 1, 3.0), ('stop', 1, 1.0)])
+        regressions = self.history.find_regressions('new', 'test_01')
+        self.assertEqual(['start'], [reg['step'] for reg in regressions])
+        self.assertEqual(1.0, regressions[0]['baseline_median'])
+        self.assertEqual(6, regressions[0]['baseline_runs'])
+
+    def test_short_baseline_not_flagged(self):
+        self.record_baseline([1.0] * (MIN_BASELINE_RUNS - 1))
+        self.history.record('new', '1.1.0', 'KGB', 'test_01',
+                            [('start', 1, 3.0)])
+        self.assertEqual([], self.history.find_regressions('new', 'test_01'))
+
+    def test_flat_baseline_flagged_without_z_score(self):
+        self.record_baseline([1.0] * MIN_BASELINE_RUNS)
+        self.history.record('new', '1.1.0', 'KGB', 'test_01',
+                            [('start', 1, 1.5)])
+        regressions = self.history.find_regressions('new', 'test_01')
+        self.assertEqual(None, regressions[0]['z_score'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of vm_config.
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+
+from vm_config import STATUS_CHECK_OFF, VMConfig
+
+
+@attr('all', 'unit')
+class TestVMConfig(unittest.TestCase):
+
+    def test_round_trip_keeps_unknown_keys(self):
+        config = VMConfig.from_json(
+            '{"vm_data": {"image": "rhel.img", "ram": "256M"}, '
+            '"adaptor_data": {"disk_mounts": []}, "version": "1.0"}')
+        copied = VMConfig.from_lines(config.to_lines())
+        self.assertEqual(config.data, copied.data)
+        self.assertEqual('rhel.img', copied.image)
+        self.assertEqual('1.0', copied.data['version'])
+
+    def test_copy_is_independent(self):
+        config = VMConfig()
+        config.interfaces = {'eth0': {'host_device': 'br0'}}
+        copied = config.copy()
+        copied.image = 'other.img'
+        copied.interfaces['eth0']['host_device'] = 'br1'
+        self.assertEqual(None, config.image)
+        self.assertEqual('br0', config.interfaces['eth0']['host_device'])
+
+    def test_settings(self):
+        config = VMConfig()
+        self.assertEqual({}, config.internal_status_check)
+        config.set_internal_status_check(STATUS_CHECK_OFF)
+        config.set_timeouts(status_retry=2, start_timeout=60)
+        config.set_timeouts(status_timeout=5)
+        self.assertEqual({'active': 'off', 'ip_address': None},
+                         config.internal_status_check)
+        self.assertEqual(2, config.adaptor_data['status-retry'])
+        self.assertEqual(5, config.adaptor_data['status-timeout'])
+        self.assertEqual(60, config.adaptor_data['start-timeout'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Unit tests of vm_image_utils.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from nose.plugins.attrib import attr
+
+from vm_image_utils import VMImageUtils, PROVISION_COPY, PROVISION_HARDLINK
+
+
+def run(cmd):
+    """
+    Run a command as run_command would on the node, returning its output
+    lines and return code.
+    """
+    process = subprocess.Popen(['/bin/bash', '-c', cmd],
+                               stdout=subprocess.PIPE)
+    stdout = process.communicate()[0].decode('utf-8')
+    return stdout.splitlines(), process.returncode
+
+
+@attr('all', 'unit')
+class TestVMImageUtils(unittest.TestCase):
+
+    def setUp(self):
+        self.image_dir = tempfile.mkdtemp()
+        self.image_utils = VMImageUtils(self.image_dir)
+        self.partial = os.path.join(self.image_dir, 'rhel.img.partial')
+        with open(self.partial, 'w') as partial:
+            partial.write('image\n')
+        self.checksum = run(VMImageUtils.get_checksum_cmd(self.partial))[0][0]
+        self.cache_path = self.image_utils.get_cache_path('rhel.img',
+                                                          self.checksum)
+
+    def tearDown(self):
+        shutil.rmtree(self.image_dir)
+
+    def test_cache_path(self):
+        self.assertEqual('{0}/.mnlibvirt_image_cache/{1}-rhel.img'.format(
+            self.image_dir, self.checksum), self.cache_path)
+
+    def test_lookup_misses_until_image_is_committed(self):
+        lookup_cmd = self.image_utils.get_cache_lookup_cmd(self.cache_path)
+        self.assertEqual(1, run(lookup_cmd)[1])
+        self.assertTrue(os.path.isdir(self.image_utils.cache_dir))
+
+        self.assertEqual(0, run(VMImageUtils.get_cache_commit_cmd(
+            self.partial, self.cache_path, self.checksum))[1])
+        self.assertEqual(0, run(lookup_cmd)[1])
+        self.assertFalse(os.path.exists(self.partial))
+
+    def test_commit_drops_corrupt_image(self):
+        run(self.image_utils.get_cache_lookup_cmd(self.cache_path))
+        self.assertEqual(1, run(VMImageUtils.get_cache_commit_cmd(
+            self.partial, self.cache_path, '0' * 32))[1])
+        self.assertFalse(os.path.exists(self.partial))
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_provision_cmds(self):
+        copy_path = os.path.join(self.image_dir, 'copy.img')
+        link_path = os.path.join(self.image_dir, 'link.img')
+        self.assertEqual(0, run(self.image_utils.get_provision_cmd(
+            self.partial, copy_path, PROVISION_COPY))[1])
+        self.assertEqual(0, run(self.image_utils.get_provision_cmd(
+            self.partial, link_path, PROVISION_HARDLINK))[1])
+        self.assertFalse(os.path.samefile(self.partial, copy_path))
+        self.assertTrue(os.path.samefile(self.partial, link_path))
+        self.assertRaises(ValueError, self.image_utils.get_provision_cmd,
+                          self.partial, copy_path, 'snapshot')
+
+    def test_link_cmd_replaces_existing_file(self):
+        dest_path = os.path.join(self.image_dir, 'vm1.img')
+        with open(dest_path, 'w') as dest:
+            dest.write('old\n')
+        self.assertEqual(0, run(VMImageUtils.get_link_cmd(self.partial,
+                                                          dest_path))[1])
+        self.assertTrue(os.path.samefile(self.partial, dest_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,261 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Benchmark of how the libvirt adaptor scales with the number of
+            vm-services run concurrently on a node, to find the density
+            at which the adaptor or libvirtd becomes the bottleneck.
+"""
+
+import os
+
+from litp_generic_test import attr
+from libvirt_adaptor_base import LibvirtAdaptorTest
+from libvirt_utils import LibvirtUtils
+from host_sampler import HostSampler
+from latency_stats import LatencyStats
+import test_constants
+
+
+class DensityBenchmark(LibvirtAdaptorTest):
+    """
+    Start, boot, status and stop-undefine throughput and latency at an
+    increasing number of concurrent vm-services.
+    """
+
+    # THE TESTS ONLY SHARE NODES THROUGH lease_test_node, SO THEY MAY BE
+    # RUN IN SEPARATE PROCESSES
+    _multiprocess_can_split_ = True
+
+    # Numbers of concurrent vm-services, in the order they are run
+    density_levels = tuple(
+        int(level) for level in
+        os.environ.get('MNLIBVIRT_DENSITY_LEVELS', '1,2,4,8,16').split(','))
+
+    def setUp(self):
+        """
+        Description:
+            Runs before every single test
+        Actions:
+            Determine
+                management server,
+                primary node(the managed node leased for the test)
+            Stage the image on the node
+        Results:
+            Class variables that are required to execute tests
+        """
+        super(DensityBenchmark, self).setUp()
+        self.make_benchmark_report_dir()
+        self.libvirt = LibvirtUtils()
+        self.login_banner = 'localhost.localdomain.localdomain login:'
+        self.temp_image_name = self.get_test_name('rhel.img')
+        self.instances_data_dir = test_constants.LIBVIRT_INSTANCES_DIR
+        self.images_dir = test_constants.LIBVIRT_IMAGE_DIR
+        self.management_server = self.get_management_node_filename()
+        self.vm_names = [
+            self.get_test_name('testappdensity_{0}'.format(index))
+            for index in range(max(self.density_levels))]
+        self.primary_node = self.lease_test_node([self.temp_image_name],
+                                                 self.vm_names)
+        ms_dir_contents = self.get_ms_image_names(self.management_server)
+        self.stage_image(self.management_server, self.primary_node,
+                         ms_dir_contents[0], self.temp_image_name)
+
+    def tearDown(self):
+        """
+        Description:
+            Runs after every single test
+        Actions:
+            -
+        Results:
+            The super class prints out diagnostics and variables
+        """
+        super(DensityBenchmark, self).tearDown()
+
+    def get_instance_dir(self, vm_name):
+        """
+        Return the instance directory of a vm-service.
+        """
+        return '{0}/{1}/'.format(self.instances_data_dir, vm_name)
+
+    def prepare_vms(self, vm_names):
+        """
+        Provision a private image, the instance directory and the
+        config.json of each vm-service, the images and files of every
+        vm-service in a single round trip.
+        """
+        prepare_cmds = [('mkdir', '/bin/mkdir -p {0} {1}'.format(
+            self.images_dir, ' '.join(self.get_instance_dir(vm_name)
+                                      for vm_name in vm_names)))]
+        for vm_name in vm_names:
+            image_name = '{0}.img'.format(vm_name)
+            prepare_cmds.append(
+                ('provision {0}'.format(vm_name),
+                 self.get_provision_image_cmd(self.primary_node,
+                                              self.temp_image_name,
+                                              dest_name=image_name)))
+            config_file_dump = self.set_vm_config_image(
+                self.libvirt.compile_vm_config_file(), image_name)
+            prepare_cmds.append(
+                ('config {0}'.format(vm_name),
+                 self.remote_cmds.get_write_file_cmd(
+                     self.get_instance_dir(vm_name) + 'config.json',
+                     config_file_dump.split('\n'))))
+        self.assert_cmd_results_ok(
+            self.run_cmd_batch(self.primary_node, prepare_cmds))
+        for vm_name in vm_names:
+            self.create_instance_data_files_in_instance_dir(
+                self.primary_node, vm_name)
+
+    def run_phase(self, vm_names, phase):
+        """
+        Run a phase against every vm-service at once, and return a
+        CmdResult per vm-service. The "boot" phase waits for the login
+        banner, every other phase is an adaptor verb.
+        """
+        if phase == 'boot':
+            named_cmds = [
+                (phase, self.adaptor_cmds.get_console_wait_cmd(
+                    vm_name, self.login_banner, self.vm_boot_deadline))
+                for vm_name in vm_names]
+        else:
+            named_cmds = [
+                (phase.split()[0], self.adaptor_cmds.get_adaptor_cmd(
+                    vm_name, phase, self.adaptor_cmd_timeout))
+                for vm_name in vm_names]
+        return self.run_parallel_cmds(self.primary_node, named_cmds)
+
+    @staticmethod
+    def get_throughput(results):
+        """
+        Return the vm-services handled per second by a phase, from the
+        first start to the last end of its commands on the node, or
+        None if no command of the phase succeeded.
+        """
+        results = list(results)
+        done = [result for result in results if result.rc == 0]
+        if not done:
+            return None
+        wall = max(result.end_time for result in done) - \
+            min(result.start_time for result in results)
+        return len(done) / wall if wall > 0 else None
+
+    def run_level(self, vm_names, stats):
+        """
+        Take a number of vm-services through start, boot, status and
+        stop-undefine concurrently while sampling the node, and return
+        the level's throughputs and host load.
+        """
+        level = len(vm_names)
+        sampler = HostSampler(self.primary_node, '/tmp/mnlibvirt_density.{0}'
+                              .format(self.test_token))
+        self.run_command(self.primary_node, sampler.get_start_cmd(),
+                         su_root=True, default_asserts=True)
+        phase_results = {}
+        failed = set()
+        try:
+            for phase in ('start', 'boot', 'status',
+                          'stop-undefine --stop-timeout 20'):
+                # A VM-SERVICE WHICH FAILED A PHASE IS LEFT OUT OF THE
+                # LATER ONES
+                active = [vm_name for vm_name in vm_names
+                          if vm_name not in failed]
+                if not active:
+                    break
+                results = self.run_phase(active, phase)
+                phase_results[phase.split()[0]] = dict(zip(active, results))
+                for vm_name, result in zip(active, results):
+                    if result.rc == 0:
+                        stats.add((level, result.name), result.duration)
+                    else:
+                        stats.add_failure((level, result.name))
+                        failed.add(vm_name)
+        finally:
+            stdout, _, _ = self.run_command(self.primary_node,
+                                            sampler.get_stop_cmd(),
+                                            su_root=True)
+            sampler.update(stdout)
+            # LEAVE NOTHING DEFINED FOR THE NEXT LEVEL
+            self.run_cmd_batch(self.primary_node, [
+                (vm_name, '{0}; {1}'.format(
+                    self.libvirt.get_virsh_destroy_cmd(vm_name),
+                    self.libvirt.get_virsh_undefine_cmd(vm_name)))
+                for vm_name in vm_names])
+
+        for vm_name, boot in phase_results.get('boot', {}).items():
+            if boot.rc == 0:
+                stats.add((level, 'time-to-login'),
+                          boot.end_time -
+                          phase_results['start'][vm_name].start_time)
+        return {
+            'vms': level,
+            'start_per_second': self.get_throughput(
+                phase_results.get('start', {}).values()),
+            'stop_undefine_per_second': self.get_throughput(
+                phase_results.get('stop-undefine', {}).values()),
+            'failures': len(failed),
+            'host': sampler.get_summary()}
+
+    @attr('benchmark')
+    def test_01_p_vm_density_scaling(self):
+        """
+        Description:
+            Measure how start, boot, status and stop-undefine scale with
+            the number of vm-services run concurrently on a node.
+
+        Actions:
+             1. Make sure libvirt and the adaptor are installed.
+             2. Provision a private image, instance directory and
+                config.json for the largest of density_levels.
+             3. For each level, start that many vm-services at once,
+                wait for all of them to boot, check their status and
+                stop-undefine them, sampling the node's CPU, memory and
+                disk I/O throughout. Stop ramping at the first level
+                with a failure.
+             4. Write the throughput, latencies and host load per level
+                to a JSON report.
+
+        Results:
+            Every level runs without failures, and the report is
+            written.
+        """
+        # STEP 1
+        self.ensure_node_dependencies(self.primary_node)
+        stats = LatencyStats(('vms', 'phase'))
+        levels = []
+
+        try:
+            # STEP 2
+            self.prepare_vms(self.vm_names)
+
+            # STEP 3
+            for level in self.density_levels:
+                levels.append(self.run_level(self.vm_names[:level], stats))
+                self.log("info", 'Density {0}: {1}'.format(level,
+                                                           levels[-1]))
+                if levels[-1]['failures']:
+                    break
+        finally:
+            self.drop_provisioned_images(self.primary_node)
+            self.run_command(self.primary_node, '/bin/rm -rf {0}'.format(
+                ' '.join(self.get_instance_dir(vm_name)
+                         for vm_name in self.vm_names)), su_root=True)
+
+        # STEP 4
+        for line in stats.format_summary():
+            self.log("info", line)
+        self.write_benchmark_report('density', {
+            'node': self.primary_node,
+            'adaptor_version': self.get_pkg_version(
+                self.primary_node, test_constants.LIBVIRT_ADAPTOR_PKG_NAME),
+            'levels': levels,
+            'latencies': stats.get_summary()})
+        self.assertEqual([], [level['vms'] for level in levels
+                              if level['failures']],
+                         'vm-services failed at densities: {0}'.format(
+                             stats.get_failed_keys()))
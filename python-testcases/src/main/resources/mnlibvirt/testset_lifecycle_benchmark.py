@@ -0,0 +1,189 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Benchmark of the latency of the libvirt adaptor verbs, run
+            repeatedly against a RHEL6 and a RHEL7.4 vm-service, to catch
+            start and stop-undefine regressions in new adaptor drops.
+"""
+
+from litp_generic_test import attr
+from libvirt_adaptor_base import LibvirtAdaptorTest
+from libvirt_utils import LibvirtUtils
+from latency_stats import LatencyStats
+import test_constants
+
+
+class LifecycleBenchmark(LibvirtAdaptorTest):
+    """
+    Latency percentiles of the libvirt adaptor verbs.
+    """
+
+    # THE TESTS ONLY SHARE NODES THROUGH lease_test_node, SO THEY MAY BE
+    # RUN IN SEPARATE PROCESSES
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        """
+        Description:
+            Runs before every single test
+        Actions:
+            Determine
+                management server,
+                primary node(the managed node leased for the test)
+            Stage the RHEL6 and RHEL7.4 images on the node
+        Results:
+            Class variables that are required to execute tests
+        """
+        super(LifecycleBenchmark, self).setUp()
+        self.make_benchmark_report_dir()
+        self.libvirt = LibvirtUtils()
+        self.login_banner = 'localhost.localdomain.localdomain login:'
+        self.instances_data_dir = test_constants.LIBVIRT_INSTANCES_DIR
+        self.images_dir = test_constants.LIBVIRT_IMAGE_DIR
+        self.management_server = self.get_management_node_filename()
+        ms_dir_contents = self.get_ms_image_names(self.management_server)
+        # IMAGE TYPE: (IMAGE ON THE MS, IMAGE NAME ON THE NODE)
+        self.images = [
+            ('rhel6', ms_dir_contents[0], self.get_test_name('rhel.img')),
+            ('rhel7_4', 'vm_test_image-5-1.0.7.qcow2',
+             self.get_test_name('rhel7_4.img'))]
+        self.vm_names = dict(
+            (image_type, self.get_test_name('testappbench_' + image_type))
+            for image_type, _, _ in self.images)
+        self.primary_node = self.lease_test_node(
+            [image_name for _, _, image_name in self.images],
+            self.vm_names.values())
+        for _, ms_image_name, image_name in self.images:
+            self.stage_image(self.management_server, self.primary_node,
+                             ms_image_name, image_name)
+
+    def tearDown(self):
+        """
+        Description:
+            Runs after every single test
+        Actions:
+            -
+        Results:
+            The super class prints out diagnostics and variables
+        """
+        super(LifecycleBenchmark, self).tearDown()
+
+    def get_lifecycle_cmds(self, vm_name):
+        """
+        Return the (verb, command) pairs of one benchmark iteration. The
+        VM is taken through every verb and left undefined, so that the
+        next iteration starts from the same state.
+
+        "boot" is the wait for the login banner after a start.
+        """
+        cmds = []
+        for verb in ('start', 'boot', 'status', 'stop',
+                     'start', 'boot', 'stop-undefine --stop-timeout 20',
+                     'start', 'boot', 'force-stop-undefine'):
+            if verb == 'boot':
+                cmd = self.adaptor_cmds.get_console_wait_cmd(
+                    vm_name, self.login_banner, self.vm_boot_deadline)
+            else:
+                cmd = self.adaptor_cmds.get_adaptor_cmd(
+                    vm_name, verb, self.adaptor_cmd_timeout)
+            cmds.append((verb.split()[0], cmd))
+        return cmds
+
+    def reset_vm(self, vm_name):
+        """
+        Destroy and undefine a VM, whatever state it was left in.
+        """
+        self.run_cmd_batch(self.primary_node, [
+            ('destroy', self.libvirt.get_virsh_destroy_cmd(vm_name)),
+            ('undefine', self.libvirt.get_virsh_undefine_cmd(vm_name))])
+
+    @attr('benchmark')
+    def test_01_p_adaptor_verb_latency(self):
+        """
+        Description:
+            Measure the latency of each adaptor verb, and of the boot
+            after a start, for a RHEL6 and a RHEL7.4 image.
+
+        Actions:
+             1. Make sure libvirt and the adaptor are installed.
+             2. For each image type, provision the image and the
+                vm-service's instance directory.
+             3. Run benchmark_iterations iterations of start, boot,
+                status, stop, start, boot, stop-undefine, start, boot,
+                force-stop-undefine. An iteration is a single remote
+                command, each verb is timed on the node.
+             4. Write the p50/p95/p99 latency per image type and verb
+                to a JSON report.
+
+        Results:
+            Every verb succeeds in every iteration, and the report is
+            written.
+        """
+        # STEP 1
+        self.ensure_node_dependencies(self.primary_node)
+        stats = LatencyStats(('image', 'verb'))
+
+        try:
+            for image_type, _, image_name in self.images:
+                vm_name = self.vm_names[image_type]
+                app_data_dir = '{0}/{1}/'.format(self.instances_data_dir,
+                                                 vm_name)
+                # STEP 2
+                results = self.run_cmd_batch(self.primary_node, [
+                    ('mkdir', '/bin/mkdir -p {0} {1}'.format(
+                        self.images_dir, self.instances_data_dir)),
+                    ('provision', self.get_provision_image_cmd(
+                        self.primary_node, image_name))])
+                self.assert_cmd_results_ok(results)
+                self.create_dir_on_node(self.primary_node, app_data_dir,
+                                        su_root=True)
+                config_file_dump = self.set_vm_config_image(
+                    self.libvirt.compile_vm_config_file(), image_name)
+                self.create_file_on_node(self.primary_node,
+                                         app_data_dir + 'config.json',
+                                         config_file_dump.split('\n'),
+                                         su_root=True,
+                                         add_to_cleanup=False)
+                self.create_instance_data_files_in_instance_dir(
+                    self.primary_node, vm_name)
+
+                # STEP 3
+                lifecycle_cmds = self.get_lifecycle_cmds(vm_name)
+                for _ in range(self.benchmark_iterations):
+                    results = self.run_cmd_batch(self.primary_node,
+                                                 lifecycle_cmds,
+                                                 stop_on_error=True)
+                    for result in results:
+                        if result.rc == 0:
+                            stats.add((image_type, result.name),
+                                      result.duration)
+                        elif result.rc is not None:
+                            stats.add_failure((image_type, result.name))
+                            self.log("info", '{0} {1} failed: {2}'.format(
+                                vm_name, result.name, result.stderr))
+                    if any(result.rc != 0 for result in results):
+                        # LEAVE NOTHING DEFINED FOR THE NEXT ITERATION
+                        self.reset_vm(vm_name)
+        finally:
+            self.drop_provisioned_images(self.primary_node)
+            for vm_name in self.vm_names.values():
+                self.reset_vm(vm_name)
+
+        # STEP 4
+        for line in stats.format_summary():
+            self.log("info", line)
+        self.write_benchmark_report('lifecycle', {
+            'node': self.primary_node,
+            'adaptor_version': self.get_pkg_version(
+                self.primary_node, test_constants.LIBVIRT_ADAPTOR_PKG_NAME),
+            'iterations': self.benchmark_iterations,
+            'latencies': stats.get_summary()})
+        self.assertEqual([], stats.get_failed_keys(),
+                         'Adaptor verbs failed: {0}'.format(
+                             stats.get_failed_keys()))
@@ -0,0 +1,235 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Benchmark of the cost of the adaptor's internal status check,
+            for each HTTP response the check can receive and for a range
+            of status-retry and status-timeout settings.
+"""
+
+import os
+
+from litp_generic_test import attr
+from libvirt_adaptor_base import LibvirtAdaptorTest
+from libvirt_utils import LibvirtUtils
+from latency_stats import LatencyStats
+from vm_config import VMConfig
+import test_constants
+
+
+class StatusCheckBenchmark(LibvirtAdaptorTest):
+    """
+    Latency of the adaptor's status verb with the internal status check
+    on, against the images of Story7535.
+    """
+
+    # THE TESTS ONLY SHARE NODES THROUGH lease_test_node, SO THEY MAY BE
+    # RUN IN SEPARATE PROCESSES
+    _multiprocess_can_split_ = True
+
+    # (status-retry, status-timeout) pairs written to adaptor_data, as
+    # "<retry>:<timeout>,..." in MNLIBVIRT_STATUS_CHECK_SETTINGS
+    status_check_settings = tuple(
+        tuple(int(value) for value in setting.split(':'))
+        for setting in os.environ.get('MNLIBVIRT_STATUS_CHECK_SETTINGS',
+                                      '1:5,3:5,1:30,3:30').split(','))
+
+    def setUp(self):
+        """
+        Description:
+            Runs before every single test
+        Actions:
+            Determine
+                management server,
+                primary node(the managed node leased for the test)
+            Stage the images answering the status check on the node
+        Results:
+            Class variables that are required to execute tests
+        """
+        super(StatusCheckBenchmark, self).setUp()
+        self.make_benchmark_report_dir()
+        self.libvirt = LibvirtUtils()
+        self.login_banner = 'vm-service-host.localdomain login:'
+        self.instances_data_dir = test_constants.LIBVIRT_INSTANCES_DIR
+        self.images_dir = test_constants.LIBVIRT_IMAGE_DIR
+        self.management_server = self.get_management_node_filename()
+        # HTTP RESPONSE OF THE IMAGE: (IMAGE ON THE MS, IMAGE NAME ON THE
+        # NODE). A 400 IS NEITHER SUCCESS NOR FAILURE, SO THE CHECK RUNS
+        # INTO ITS TIMEOUT AS IN Story7535 test_04
+        self.images = [
+            ('200', 'vm_test_image-2-1.0.8.qcow2',
+             self.get_test_name('rhel.img')),
+            ('503', 'vm_test_image_neg-2-1.0.7.qcow2',
+             self.get_test_name('rhelinvalid503.img')),
+            ('400', 'vm_test_image_neg-1-1.0.7.qcow2',
+             self.get_test_name('rhelinvalid400.img'))]
+        self.vm_service_name = self.get_test_name('testappstatus')
+        self.primary_node = self.lease_test_node(
+            [image_name for _, _, image_name in self.images],
+            [self.vm_service_name])
+        for _, ms_image_name, image_name in self.images:
+            self.stage_image(self.management_server, self.primary_node,
+                             ms_image_name, image_name)
+
+    def tearDown(self):
+        """
+        Description:
+            Runs after every single test
+        Actions:
+            -
+        Results:
+            The super class prints out diagnostics and variables
+        """
+        super(StatusCheckBenchmark, self).tearDown()
+
+    def get_config_file_dump(self, image_name, interfaces_dict,
+                             check_ipaddress, check_active,
+                             setting=None):
+        """
+        Return the config.json of the vm-service, with the internal
+        status check switched on or off and, if given, a
+        (status-retry, status-timeout) setting.
+        """
+        vm_config = VMConfig.from_json(self.libvirt.compile_vm_config_file())
+        vm_config.interfaces = interfaces_dict
+        vm_config.image = image_name
+        if setting is not None:
+            vm_config.set_timeouts(status_retry=setting[0],
+                                   status_timeout=setting[1])
+        vm_config.set_internal_status_check(check_active, check_ipaddress)
+        return vm_config.to_json()
+
+    def reset_vm(self):
+        """
+        Destroy and undefine the vm-service, whatever state it was left
+        in.
+        """
+        self.run_cmd_batch(self.primary_node, [
+            ('destroy',
+             self.libvirt.get_virsh_destroy_cmd(self.vm_service_name)),
+            ('undefine',
+             self.libvirt.get_virsh_undefine_cmd(self.vm_service_name))])
+
+    @attr('benchmark')
+    def test_01_p_status_check_latency(self):
+        """
+        Description:
+            Measure how long the status verb takes with the internal
+            status check on when the VM answers 200, 503 or 400, for
+            each of status_check_settings.
+
+        Actions:
+             1. Make sure libvirt and the adaptor are installed.
+             2. Create the vm-service's instance directory with a static
+                address on the first bridge of the node.
+             3. For each image, provision it and start the vm-service
+                with the internal status check off, so that it boots
+                whatever the image answers.
+             4. For each setting, switch the internal status check on
+                with it and run the status verb benchmark_iterations
+                times. The config and every status run are a single
+                remote command, each status run is timed on the node.
+             5. Log a latency table per response and setting and write
+                it to a JSON report.
+
+        Results:
+            The status verb succeeds against the 200 image and fails
+            against the 503 and 400 images in every run, and the report
+            is written.
+        """
+        # STEP 1
+        self.ensure_node_dependencies(self.primary_node)
+        stats = LatencyStats(('response', 'retry', 'timeout'))
+        return_codes = {}
+        app_data_dir = '{0}/{1}/'.format(self.instances_data_dir,
+                                         self.vm_service_name)
+        config_path = app_data_dir + 'config.json'
+
+        # STEP 2
+        bridge_urls = self.get_bridge_urls()
+        bridges = self.get_bridge_details(bridge_urls)
+        # eth0 IS ON THE BRIDGE THE META-DATA DESCRIBES
+        first_bridge = self.get_cached_props(self.management_server,
+                                             bridge_urls[0], "device_name")
+        interfaces_dict = dict(
+            ("eth{0}".format(index),
+             {"host_device": bridge, "ipaddress": bridges[bridge]})
+            for index, bridge in enumerate(
+                [first_bridge] + sorted(set(bridges) - set([first_bridge]))))
+        check_ipaddress = interfaces_dict['eth0']['ipaddress']
+        self.create_dir_on_node(self.primary_node, app_data_dir,
+                                su_root=True)
+        self.create_instance_data_files_in_instance_dir(
+            self.primary_node, self.vm_service_name,
+            self.prepare_metadata_content(bridge_urls, check_ipaddress))
+
+        status_cmd = self.adaptor_cmds.get_adaptor_cmd(
+            self.vm_service_name, 'status', self.adaptor_cmd_timeout)
+        try:
+            for response, _, image_name in self.images:
+                # STEP 3
+                config_file_dump = self.get_config_file_dump(
+                    image_name, interfaces_dict, check_ipaddress, 'off')
+                self.assert_cmd_results_ok(self.run_cmd_batch(
+                    self.primary_node, [
+                        ('mkdir', '/bin/mkdir -p {0}'.format(
+                            self.images_dir)),
+                        ('provision', self.get_provision_image_cmd(
+                            self.primary_node, image_name)),
+                        ('config', self.remote_cmds.get_write_file_cmd(
+                            config_path, config_file_dump.split('\n'))),
+                        ('start', self.adaptor_cmds.get_adaptor_cmd(
+                            self.vm_service_name, 'start',
+                            self.adaptor_cmd_timeout)),
+                        ('boot', self.adaptor_cmds.get_console_wait_cmd(
+                            self.vm_service_name, self.login_banner,
+                            self.vm_boot_deadline))],
+                    stop_on_error=True))
+
+                # STEP 4
+                for setting in self.status_check_settings:
+                    config_file_dump = self.get_config_file_dump(
+                        image_name, interfaces_dict, check_ipaddress, 'on',
+                        setting)
+                    results = self.run_cmd_batch(
+                        self.primary_node,
+                        [('config', self.remote_cmds.get_write_file_cmd(
+                            config_path, config_file_dump.split('\n')))] +
+                        [('status', status_cmd)] *
+                        self.benchmark_iterations)
+                    self.assert_cmd_results_ok(results[:1])
+                    key = (response,) + tuple(setting)
+                    for result in results[1:]:
+                        stats.add(key, result.duration)
+                        return_codes.setdefault(key, []).append(result.rc)
+                self.reset_vm()
+                self.drop_provisioned_images(self.primary_node)
+        finally:
+            self.reset_vm()
+            self.drop_provisioned_images(self.primary_node)
+
+        # STEP 5
+        for line in stats.format_summary():
+            self.log("info", line)
+        summary = stats.get_summary()
+        for group in summary:
+            key = (group['response'], group['retry'], group['timeout'])
+            group['return_codes'] = sorted(set(return_codes[key]))
+        self.write_benchmark_report('status_check', {
+            'node': self.primary_node,
+            'adaptor_version': self.get_pkg_version(
+                self.primary_node, test_constants.LIBVIRT_ADAPTOR_PKG_NAME),
+            'iterations': self.benchmark_iterations,
+            'latencies': summary})
+        # ONLY THE 200 IMAGE IS EXPECTED TO PASS THE STATUS CHECK
+        unexpected = [(key, rcs) for key, rcs in sorted(return_codes.items())
+                      if any(rc is None or (rc == 0) != (key[0] == '200')
+                             for rc in rcs)]
+        self.assertEqual([], unexpected,
+                         'The status verb did not answer as the image '
+                         'should: {0}'.format(unexpected))
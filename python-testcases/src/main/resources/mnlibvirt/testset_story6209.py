@@ -13,19 +13,25 @@ program(s) have been supplied.
             Agile: LITPCDS-6209
 """
 
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from libvirt_adaptor_base import LibvirtAdaptorTest
+from step_timer import timed_step
 from redhat_cmd_utils import RHCmdUtils
 from libvirt_utils import LibvirtUtils
 import test_constants
 
 
-class Story6209(GenericTest):
+class Story6209(LibvirtAdaptorTest):
     """
     LITPCDS-6209:
     As a LITP Developer I want a libvirt adaptor so that I can manage a virtual
     machine on a peer node.
     """
 
+    # THE TESTS ONLY SHARE NODES THROUGH lease_test_node, SO THEY MAY BE
+    # RUN IN SEPARATE PROCESSES
+    _multiprocess_can_split_ = True
+
     def setUp(self):
         """
         Description:
@@ -33,8 +39,7 @@ class Story6209(GenericTest):
         Actions:
             Determine
                 management server,
-                primary vcs node(first node in array
-                                 returned from test framework)
+                primary node(the managed node leased for the test)
                 list of all managed nodes
         Results:
             Class variables that are required to execute tests
@@ -43,7 +48,8 @@ class Story6209(GenericTest):
         super(Story6209, self).setUp()
         self.rh_os = RHCmdUtils()
         self.libvirt = LibvirtUtils()
-        self.temp_image_name = "rhel.img"
+        self.temp_image_name = self.get_test_name("rhel.img")
+        self.login_banner = 'localhost.localdomain.localdomain login:'
         self.adaptor_pkg_name = test_constants.LIBVIRT_ADAPTOR_PKG_NAME
         self.libvirt_dir = test_constants.LIBVIRT_DIR
         self.temp_image_location = test_constants.VM_IMAGE_MS_DIR
@@ -51,19 +57,17 @@ class Story6209(GenericTest):
         self.images_dir = test_constants.LIBVIRT_IMAGE_DIR
         self.management_server = self.get_management_node_filename()
         self.list_managed_nodes = self.get_managed_node_filenames()
-        self.primary_node = self.list_managed_nodes[0]
-        # CHECK WHETHER THE IMG IS IN THE TMP DIR ON THE NODE - IF NOT COPY
-        dir_contents = \
-        self.list_dir_contents(self.primary_node,
-                               '/tmp')
-        if self.temp_image_name not in dir_contents:
-            ms_dir_contents = \
-            self.list_dir_contents(self.management_server,
-                                   self.temp_image_location)
-
-            self.wget_image_to_node(self.management_server, self.primary_node,
-                                    ms_dir_contents[0], '/tmp',
-                                    self.temp_image_name)
+        # RUN ON A NODE ON WHICH NO OTHER TEST USES THE IMAGE OR THE
+        # INSTANCE DIRECTORIES
+        self.primary_node = self.lease_test_node(
+            [self.temp_image_name],
+            [self.get_test_name('testapp6209_{0}'.format(index))
+             for index in range(4)],
+            self.list_managed_nodes)
+        # STAGE THE IMG IN THE TMP DIR ON THE NODE FROM THE IMAGE CACHE
+        ms_dir_contents = self.get_ms_image_names(self.management_server)
+        self.stage_image(self.management_server, self.primary_node,
+                         ms_dir_contents[0], self.temp_image_name)
 
     def tearDown(self):
         """
@@ -76,17 +80,15 @@ class Story6209(GenericTest):
         """
         super(Story6209, self).tearDown()
 
+    @timed_step
     def wait_for_vm_start(self, vm_service_name):
         """
         wait for virtual machine to completely start.
-        Check by connecting to the virtual machine using virsh console.
+        Check by streaming the virtual machine's serial console until the
+        login banner appears.
         """
-        expected_stdout = 'localhost.localdomain.localdomain login:'
-        self.wait_for_cmd(self.primary_node,
-                          "virsh console {0}".format(vm_service_name),
-                          -1,
-                          expected_stdout=expected_stdout,
-                          su_root=True)
+        self.wait_for_vm_boot(self.primary_node, vm_service_name,
+                              self.login_banner)
 
     @attr('all', 'revert')
     def test_01_p_deploy_1_vm(self):
@@ -114,72 +116,33 @@ class Story6209(GenericTest):
             The vm is deployed successfully and successfully cycles through
             the commands issued against it.
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp6209_0"
+        vm_service_name = self.get_test_name("testapp6209_0")
         this_app_data_dir = \
         self.instances_data_dir + '/{0}/'.format(vm_service_name)
 
         try:
-            # CHECK WHETHER LIBVIRT IS INSTALLED - IF NOT THEN
-            # INSTALL LIBVIRT ON THE NODE AND START THE SERVICE
-            installed_cmd = \
-            self.rh_os.check_pkg_installed(["libvirt-0.10.2-18.el6.x86_64"])
-            _, _, return_code = \
-            self.run_command(self.primary_node, installed_cmd, su_root=True)
-            if return_code != 0:
-                libvirt_install_cmd = \
-                self.rhc.get_yum_install_cmd(["libvirt"])
-                _, _, return_code = \
-                self.run_command(self.primary_node, libvirt_install_cmd,
-                                 su_root=True)
-                self.assertEqual(0, return_code)
-                installed_libvirt = True
-
-            start_libvirt_cmd = self.rh_os.get_systemctl_start_cmd('libvirtd')
-            _, _, return_code = \
-            self.run_command(self.primary_node,
-                             start_libvirt_cmd, su_root=True)
-            self.assertEqual(0, return_code)
-
+            # CHECK WHETHER LIBVIRT AND THE ADAPTOR ARE INSTALLED - IF NOT
+            # THEN INSTALL THEM ON THE NODE AND START THE SERVICE
             # STEP 1
-            installed_cmd = \
-            self.rh_os.check_pkg_installed([self.adaptor_pkg_name])
-            _, _, return_code = \
-            self.run_command(self.primary_node, installed_cmd, su_root=True)
-            if return_code != 0:
-                adaptor_installed = True
-                self.install_rpm_on_node(
-                    self.primary_node,
-                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
-            dir_contents = \
-            self.list_dir_contents(self.primary_node, self.libvirt_dir)
-            image_dir_name = self.images_dir.split('/')[-1]
-            if image_dir_name not in dir_contents:
-                self.create_dir_on_node(self.primary_node,
-                                        self.images_dir,
-                                        su_root=True)
-
-            self.cp_file_on_node(self.primary_node,
-                                 '/tmp/{0}'.format(self.temp_image_name),
-                                 test_constants.LIBVIRT_IMAGE_DIR +
-                                 '/{0}'.format(self.temp_image_name),
-                                 su_root=True)
-
-            # CREATE THE INSTANCE DIRECTORY AND THE TEST APPLICATION
-            # SUBDIRECTORY
-            instances_dir_name = self.instances_data_dir.split('/')[-1]
-            if instances_dir_name not in dir_contents:
-                self.create_dir_on_node(self.primary_node,
-                                        self.instances_data_dir,
-                                        su_root=True)
+            # CREATE THE IMAGE AND INSTANCE DIRECTORIES AND PROVISION THE
+            # IMAGE IN A SINGLE ROUND TRIP
+            results = self.run_cmd_batch(self.primary_node, [
+                ('mkdir', '/bin/mkdir -p {0} {1}'.format(
+                    self.images_dir, self.instances_data_dir)),
+                ('provision', self.get_provision_image_cmd(
+                    self.primary_node, self.temp_image_name))])
+            self.assert_cmd_results_ok(results)
+
+            # CREATE THE TEST APPLICATION SUBDIRECTORY
             self.create_dir_on_node(self.primary_node,
                                     this_app_data_dir,
                                     su_root=True)
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
+            config_file_dump = self.set_vm_config_image(
+                self.libvirt.compile_vm_config_file(), self.temp_image_name)
             self.create_file_on_node(self.primary_node, this_app_data_dir +
                                      '/config.json',
                                      config_file_dump.split('\n'),
@@ -220,21 +183,11 @@ class Story6209(GenericTest):
                                          'stop')
 
         finally:
-            self.remove_item(self.primary_node, self.images_dir +
-                             '/{0}'.format(self.temp_image_name),
-                             su_root=True)
+            self.drop_provisioned_images(self.primary_node)
             vm_undefine_cmd = \
             self.libvirt.get_virsh_undefine_cmd(vm_service_name)
             self.run_command(self.primary_node, vm_undefine_cmd, su_root=True)
 
-            if installed_libvirt:
-                cmd = self.rhc.get_yum_remove_cmd(["libvirt"])
-                self.run_command(self.primary_node, cmd, su_root=True)
-            if adaptor_installed:
-                self.remove_rpm_on_node(
-                    self.primary_node,
-                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
-
     @attr('all', 'revert')
     def test_02_p_deploy_3_vm(self):
         """
@@ -252,120 +205,63 @@ class Story6209(GenericTest):
              4. Issue the service <vm_name> start command for each service.
              5. Issue the service <vm_name> status command for each service.
              6. Issue the service <vm_name> stop command for each service.
+             Steps 4 to 6 are run against all the services concurrently.
 
         Results:
             The vm's are deployed successfully and successfully cycles through
             the commands issued against them.
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_names = ["testapp6209_1", "testapp6209_2", "testapp6209_3"]
+        vm_service_names = [self.get_test_name(vm_name) for vm_name in
+                            ("testapp6209_1", "testapp6209_2",
+                             "testapp6209_3")]
 
         try:
-            # CHECK WHETHER LIBVIRT IS INSTALLED - IF NOT THEN
-            # INSTALL LIBVIRT ON THE NODE AND START THE SERVICE
-            installed_cmd = \
-            self.rh_os.check_pkg_installed(["libvirt-0.10.2-18.el6.x86_64"])
-            _, _, return_code = \
-            self.run_command(self.primary_node, installed_cmd, su_root=True)
-            if return_code != 0:
-                libvirt_install_cmd = \
-                self.rhc.get_yum_install_cmd(["libvirt"])
-                _, _, return_code = \
-                self.run_command(self.primary_node, libvirt_install_cmd,
-                                 su_root=True)
-                self.assertEqual(0, return_code)
-                installed_libvirt = True
-
-            start_libvirt_cmd = self.rh_os.get_systemctl_start_cmd('libvirtd')
-            _, _, return_code = \
-            self.run_command(self.primary_node, start_libvirt_cmd,
-                             su_root=True)
-            self.assertEqual(0, return_code)
-
+            # CHECK WHETHER LIBVIRT AND THE ADAPTOR ARE INSTALLED - IF NOT
+            # THEN INSTALL THEM ON THE NODE AND START THE SERVICE
             # STEP 1
-            installed_cmd = \
-            self.rh_os.check_pkg_installed([self.adaptor_pkg_name])
-            _, _, return_code = \
-            self.run_command(self.primary_node, installed_cmd, su_root=True)
-            if return_code != 0:
-                adaptor_installed = True
-                self.install_rpm_on_node(
-                    self.primary_node,
-                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
-            dir_contents = \
-            self.list_dir_contents(self.primary_node, self.libvirt_dir)
-            image_dir_name = self.images_dir.split('/')[-1]
-            if image_dir_name not in dir_contents:
-                self.create_dir_on_node(self.primary_node,
-                                        self.images_dir,
-                                        su_root=True)
-
-            self.cp_file_on_node(self.primary_node,
-                                 '/tmp/{0}'.format(self.temp_image_name),
-                                 test_constants.LIBVIRT_IMAGE_DIR +
-                                 '/{0}'.format(self.temp_image_name),
-                                 su_root=True)
+            # CREATE THE IMAGE AND INSTANCE DIRECTORIES AND PROVISION THE
+            # IMAGE IN A SINGLE ROUND TRIP
+            results = self.run_cmd_batch(self.primary_node, [
+                ('mkdir', '/bin/mkdir -p {0} {1}'.format(
+                    self.images_dir, self.instances_data_dir)),
+                ('provision', self.get_provision_image_cmd(
+                    self.primary_node, self.temp_image_name))])
+            self.assert_cmd_results_ok(results)
 
-            # CREATE THE INSTANCE DIRECTORY AND THE TEST APPLICATION
-            # SUBDIRECTORY
-            instances_dir_name = self.instances_data_dir.split('/')[-1]
-            if instances_dir_name not in dir_contents:
-                self.create_dir_on_node(self.primary_node,
-                                        self.instances_data_dir,
-                                        su_root=True)
+            # STEP 3
+            # EVERY SERVICE'S TEST APPLICATION SUBDIRECTORY IS CREATED AND
+            # ITS config.json WRITTEN IN A SINGLE ROUND TRIP
             for vm_name in vm_service_names:
                 this_app_data_dir = \
                 self.instances_data_dir + '/{0}/'.format(vm_name)
-                self.create_dir_on_node(self.primary_node,
+                config_file_dump = self.set_vm_config_image(
+                    self.libvirt.compile_vm_config_file(),
+                    self.temp_image_name)
+                self.queue_node_cmd(self.primary_node, vm_name,
+                                    '/bin/mkdir -p {0} && {1}'.format(
                                         this_app_data_dir,
-                                        su_root=True)
-                # STEP 3
-                config_file_dump = self.libvirt.compile_vm_config_file()
-                self.create_file_on_node(self.primary_node, this_app_data_dir +
-                                         '/config.json',
-                                         config_file_dump.split('\n'),
-                                         su_root=True,
-                                         add_to_cleanup=False)
-
+                                        self.remote_cmds.get_write_file_cmd(
+                                            this_app_data_dir + 'config.json',
+                                            config_file_dump.split('\n'))))
+            self.assert_cmd_results_ok(
+                self.flush_node_cmds(self.primary_node))
+            for vm_name in vm_service_names:
                 self.create_instance_data_files_in_instance_dir(
                     self.primary_node,
                     vm_name)
 
-                # STEP 4
-                self.run_libvirt_service_cmd(self.primary_node,
-                                             vm_name, 'start')
-                self.wait_for_vm_start(vm_name)
-
-                # STEP 5
-                self.run_libvirt_service_cmd(
-                    self.primary_node, vm_name,
-                    'status')
-
-                # STEP 6
-                self.run_libvirt_service_cmd(
-                    self.primary_node, vm_name,
-                    'stop')
+            # STEPS 4, 5 AND 6 - RUN AGAINST ALL THE SERVICES CONCURRENTLY,
+            # EACH SERVICE'S RESULTS ARE CHECKED INDEPENDENTLY
+            self.run_vm_lifecycle_parallel(self.primary_node,
+                                           vm_service_names,
+                                           self.login_banner)
         finally:
-            self.remove_item(self.primary_node, self.images_dir +
-                             '/{0}'.format(self.temp_image_name),
-                             su_root=True)
+            self.drop_provisioned_images(self.primary_node)
             for vm_name in vm_service_names:
                 vm_undefine_cmd = \
                 self.libvirt.get_virsh_undefine_cmd(vm_name)
                 self.run_command(self.primary_node, vm_undefine_cmd,
                                  su_root=True)
-
-            if installed_libvirt:
-                cmd = self.rhc.get_yum_remove_cmd(["libvirt"])
-                self.run_command(self.primary_node, cmd, su_root=True)
-            if adaptor_installed:
-                self.remove_rpm_on_node(
-                    self.primary_node,
-                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
-            # REMOVE THE IMAGE FROM THE NODE
-            self.remove_item(self.primary_node,
-                             '/tmp/{0}'.format(self.temp_image_name),
-                             su_root=True)
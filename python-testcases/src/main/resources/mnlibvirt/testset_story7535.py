@@ -13,7 +13,10 @@ program(s) have been supplied.
             Agile: LITPCDS-7535
 """
 
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from libvirt_adaptor_base import LibvirtAdaptorTest
+from step_timer import timed_step
+from vm_config import VMConfig, STATUS_CHECK_ON, STATUS_CHECK_OFF
 from redhat_cmd_utils import RHCmdUtils
 from libvirt_utils import LibvirtUtils
 import test_constants
@@ -23,13 +26,17 @@ from vcs_utils import VCSUtils
 import os
 
 
-class Story7535(GenericTest):
+class Story7535(LibvirtAdaptorTest):
     """
     LITPCDS-7535:
     As a LITP User I want the libvirt adaptor to check the internal
     status of the VM so that application faults can be detected.
     """
 
+    # THE TESTS ONLY SHARE NODES THROUGH lease_test_node, SO THEY MAY BE
+    # RUN IN SEPARATE PROCESSES
+    _multiprocess_can_split_ = True
+
     def setUp(self):
         """
         Description:
@@ -37,8 +44,7 @@ class Story7535(GenericTest):
         Actions:
             Determine
                 management server,
-                primary vcs node(first node in array
-                                 returned from test framework)
+                primary node(the managed node leased for the test)
                 list of all managed nodes
         Results:
             Class variables that are required to execute tests
@@ -49,11 +55,14 @@ class Story7535(GenericTest):
         self.rh_os = RHCmdUtils()
         self.libvirt = LibvirtUtils()
         self.net_utils = NetworkingUtils()
-        self.temp_image = "rhel.img"
-        self.temp_invalid_image_503 = "rhelinvalid503.img"
-        self.temp_invalid_image_400 = "rhelinvalid400.img"
-        self.rhel7_4_image = "rhel7_4.img"
-        self.invalid_rhel7_4_image_400 = "rhel7_4invalid400.img"
+        self.temp_image = self.get_test_name("rhel.img")
+        self.temp_invalid_image_503 = \
+            self.get_test_name("rhelinvalid503.img")
+        self.temp_invalid_image_400 = \
+            self.get_test_name("rhelinvalid400.img")
+        self.rhel7_4_image = self.get_test_name("rhel7_4.img")
+        self.invalid_rhel7_4_image_400 = \
+            self.get_test_name("rhel7_4invalid400.img")
         self.json_utils = JSONUtils()
         self.adaptor_pkg_name = test_constants.LIBVIRT_ADAPTOR_PKG_NAME
         self.libvirt_dir = test_constants.LIBVIRT_DIR
@@ -62,40 +71,29 @@ class Story7535(GenericTest):
         self.images_dir = test_constants.LIBVIRT_IMAGE_DIR
         self.management_server = self.get_management_node_filename()
         self.list_managed_nodes = self.get_managed_node_filenames()
-        self.primary_node = self.list_managed_nodes[0]
         self.vcs = VCSUtils()
         # Location where the RPMs to be used are stored
         self.rpm_src_dir = \
             os.path.dirname(os.path.realpath(__file__)) + "/rpms"
 
-        # CHECK WHETHER THE IMG IS IN THE TMP DIR ON THE NODE - IF NOT COPY
-        dir_contents = \
-        self.list_dir_contents(self.primary_node,
-                               '/tmp')
-        if self.temp_image not in dir_contents:
-            self.wget_image_to_node(self.management_server, self.primary_node,
-                                    "vm_test_image-2-1.0.8.qcow2", '/tmp',
-                                    self.temp_image)
-
-        if self.temp_invalid_image_400 not in dir_contents:
-            self.wget_image_to_node(self.management_server, self.primary_node,
-                                    'vm_test_image_neg-1-1.0.7.qcow2', '/tmp',
-                                    self.temp_invalid_image_400)
-
-        if self.temp_invalid_image_503 not in dir_contents:
-            self.wget_image_to_node(self.management_server, self.primary_node,
-                                    'vm_test_image_neg-2-1.0.7.qcow2', '/tmp',
-                                    self.temp_invalid_image_503)
-
+        # STAGE THE IMGS IN THE TMP DIR ON THE NODE FROM THE IMAGE CACHE
         # TORF-271798: RHEL7.4 images
-        rhel7_4_img_dict = \
-            {self.rhel7_4_image: "vm_test_image-5-1.0.7.qcow2",
+        img_dict = \
+            {self.temp_image: "vm_test_image-2-1.0.8.qcow2",
+             self.temp_invalid_image_400: "vm_test_image_neg-1-1.0.7.qcow2",
+             self.temp_invalid_image_503: "vm_test_image_neg-2-1.0.7.qcow2",
+             self.rhel7_4_image: "vm_test_image-5-1.0.7.qcow2",
              self.invalid_rhel7_4_image_400: "vm_test_image_neg-3-1.0.6.qcow2"}
-        for img_name, img_url in rhel7_4_img_dict.items():
-            if img_name not in dir_contents:
-                self.wget_image_to_node(self.management_server,
-                                        self.primary_node,
-                                        img_url, '/tmp', img_name)
+        # RUN ON A NODE ON WHICH NO OTHER TEST USES THE IMAGES OR THE
+        # INSTANCE DIRECTORIES
+        self.primary_node = self.lease_test_node(
+            img_dict.keys(),
+            [self.get_test_name('testapp7535_{0}'.format(index))
+             for index in range(4)],
+            self.list_managed_nodes)
+        for img_name, img_url in img_dict.items():
+            self.stage_image(self.management_server, self.primary_node,
+                             img_url, img_name)
 
     def tearDown(self):
         """
@@ -125,199 +123,45 @@ class Story7535(GenericTest):
 
         return "/usr/bin/virsh destroy {0}".format(vm_name)
 
-    def chk_dependencies_installed(self):
-        """
-        CHECK WHETHER LIBVIRT IS INSTALLED - IF NOT THEN
-        INSTALL LIBVIRT ON THE NODE AND START THE SERVICE
-        """
-        installed_libvirt = False
-        adaptor_installed = False
-        # checking the status of libvirtd returns 1 if the service is
-        # unrecognised and 3 if the service is stopped
-        virsh_cmd = self.rh_os.get_systemctl_status_cmd('libvirtd')
-        _, _, return_code = \
-            self.run_command(self.primary_node, virsh_cmd, su_root=True)
-        if return_code != 0:
-            libvirt_install_cmd = \
-                self.rhc.get_yum_install_cmd(["libvirt"])
-            _, _, return_code = \
-                self.run_command(self.primary_node, libvirt_install_cmd,
-                                 su_root=True)
-
-            self.assertEqual(0, return_code)
-            installed_libvirt = True
-
-            start_libvirt_cmd = self.rh_os.get_systemctl_start_cmd('libvirtd')
-            _, _, return_code = \
-                self.run_command(self.primary_node,
-                                 start_libvirt_cmd, su_root=True)
-            self.assertEqual(0, return_code)
-
-        installed_cmd = \
-            self.rh_os.check_pkg_installed([self.adaptor_pkg_name])
-        _, _, return_code = \
-            self.run_command(self.primary_node, installed_cmd, su_root=True)
-        if return_code != 0:
-            adaptor_installed = True
-            self.install_rpm_on_node(self.primary_node,
-                                     test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
-
-        return installed_libvirt, adaptor_installed
-
+    @timed_step
     def copy_image_to_node(self, image_name, app_data_dir):
         """
-        Copy the image to the correct location on the node
+        Provision the image in the correct location on the node
 
         Create the instance directory and the test application subdirectory
         """
-        dir_contents = \
-            self.list_dir_contents(self.primary_node, self.libvirt_dir)
-        image_dir_name = self.images_dir.split('/')[-1]
-        if image_dir_name not in dir_contents:
-            self.create_dir_on_node(self.primary_node,
-                                    self.images_dir,
-                                    su_root=True)
-        self.cp_file_on_node(self.primary_node,
-                             '/tmp/{0}'.format(image_name),
-                             test_constants.LIBVIRT_IMAGE_DIR +
-                             '/{0}'.format(image_name),
-                             su_root=True)
-
-        instances_dir_name = self.instances_data_dir.split('/')[-1]
-        if instances_dir_name not in dir_contents:
-            self.create_dir_on_node(self.primary_node,
-                                    self.instances_data_dir,
-                                    su_root=True)
+        # THE IMAGE AND INSTANCE DIRS ARE CREATED AND THE IMAGE
+        # PROVISIONED IN A SINGLE ROUND TRIP
+        results = self.run_cmd_batch(self.primary_node, [
+            ('mkdir', '/bin/mkdir -p {0} {1}'.format(
+                self.images_dir, self.instances_data_dir)),
+            ('provision', self.get_provision_image_cmd(self.primary_node,
+                                                       image_name))])
+        self.assert_cmd_results_ok(results)
         self.create_dir_on_node(self.primary_node,
                                 app_data_dir,
                                 su_root=True)
 
-    def cleanup_after_test(self, vm_service_name,
-                           installed_libvirt, adaptor_installed):
+    @timed_step
+    def cleanup_after_test(self, vm_service_name):
         """
         Remove images
         undefine service in virsh
-        Uninstall libvirt and the adaptor if they were installed by
-        these test cases
-        """
-        self.remove_item(self.primary_node, self.images_dir +
-                         '/{0}'.format(self.temp_image),
-                         su_root=True)
-        self.remove_item(self.primary_node, self.images_dir +
-                         '/{0}'.format(self.temp_invalid_image_503),
-                         su_root=True)
-        self.remove_item(self.primary_node, self.images_dir +
-                         '/{0}'.format(self.temp_invalid_image_400),
-                         su_root=True)
-        self.remove_item(self.primary_node,
-                         '{0}/{1}'.format(self.images_dir, self.rhel7_4_image),
-                         su_root=True)
-        self.remove_item(self.primary_node,
-                         '{0}/{1}'.format(self.images_dir,
-                                          self.invalid_rhel7_4_image_400),
-                         su_root=True)
-        self.remove_item(self.primary_node,
-                         '/tmp/{0}'.format(self.temp_image),
-                         su_root=True)
-        self.remove_item(self.primary_node,
-                         '/tmp/{0}'.format(self.temp_invalid_image_503),
-                         su_root=True)
-        self.remove_item(self.primary_node,
-                         '/tmp/{0}'.format(self.temp_invalid_image_400),
-                         su_root=True)
-        self.remove_item(self.primary_node,
-                         '/tmp/{0}'.format(self.rhel7_4_image),
-                         su_root=True)
-        self.remove_item(self.primary_node, '/tmp/{0}'.
-                         format(self.invalid_rhel7_4_image_400),
-                         su_root=True)
-        vm_destroy_cmd = \
-            self.get_virsh_destroy_cmd(vm_service_name)
-        self.run_command(self.primary_node, vm_destroy_cmd, su_root=True)
-
-        vm_undefine_cmd = \
-            self.libvirt.get_virsh_undefine_cmd(vm_service_name)
-        self.run_command(self.primary_node, vm_undefine_cmd, su_root=True)
-
-        if installed_libvirt:
-            cmd = self.rhc.get_yum_remove_cmd(["libvirt"])
-            self.run_command(self.primary_node, cmd, su_root=True)
-        if adaptor_installed:
-            self.remove_rpm_on_node(self.primary_node,
-                                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
-
-    def get_bridge_urls(self):
         """
-        return a list of Bridge URLs from the managed node
-        """
-        node_url = \
-            self.get_node_url_from_filename(self.management_server,
-                                            self.primary_node)
-
-        bridge_urls = self.find(self.management_server,
-                                node_url, "bridge")
-        return bridge_urls
-
-    def get_bridge_details(self, bridge_urls):
-        """
-        return dictionary of bridged interfaces defined in the model
-        on the node and their IP address
-        """
-        self.assertNotEqual([], bridge_urls)
-        bridges = {}
-        for bridge_url in bridge_urls:
-            bridge_name = \
-                self.get_props_from_url(self.management_server, bridge_url,
-                                        "device_name")
-            net_name = \
-                self.get_props_from_url(self.management_server, bridge_url,
-                                        "network_name")
-            free_ipaddress = \
-                self.get_free_ip_by_net_name(self.management_server, net_name)
-            bridges[bridge_name] = free_ipaddress
-        return bridges
-
-    def prepare_metadata_content(self, bridge_urls, check_ipaddress):
-        """
-        prepare content of metadata file
-        """
-        network_name = \
-            self.get_props_from_url(self.management_server, bridge_urls[0],
-                                    "network_name")
-        bridge_name = \
-            self.get_props_from_url(self.management_server, bridge_urls[0],
-                                    "device_name")
-        ifconfig_cmd = \
-            self.net_utils.get_ifconfig_cmd(bridge_name)
-        stdout, _, _ = \
-            self.run_command(self.primary_node,
-                             ifconfig_cmd, su_root=True)
-        split_address = check_ipaddress.split('.')
-        broadcast = \
-            "{0}.{1}.{2}.255".format(split_address[0], split_address[1],
-                                     split_address[2])
-        gateway = \
-            "{0}.{1}.{2}.1".format(split_address[0], split_address[1],
-                                   split_address[2])
-        ifconfig_dict = self.net_utils.get_ifcfg_dict(stdout, bridge_name)
-        netmask = ifconfig_dict['MASK']
-        meta_data_content = \
-            ["instance-id: service_name",
-             "local-hostname: vm-service-host",
-             "network-interfaces: \"iface eth0 inet static",
-             "",
-             "address {0}".format(check_ipaddress),
-             "",
-             "network {0}".format(network_name),
-             "",
-             "netmask {0}".format(netmask),
-             "",
-             "broadcast {0}".format(broadcast),
-             "",
-             "gateway {0}".format(gateway),
-             "",
-             "\""]
-        return meta_data_content
+        # EVERY CLEANUP STEP IS RUN IN A SINGLE ROUND TRIP, THE STAGED
+        # IMAGES ARE REMOVED WHEN THE TEST ENDS
+        cleanup_cmds = [
+            ('destroy', self.get_virsh_destroy_cmd(vm_service_name)),
+            ('undefine',
+             self.libvirt.get_virsh_undefine_cmd(vm_service_name))]
+        drop_cmd = self.get_drop_provisioned_images_cmd(self.primary_node)
+        if drop_cmd:
+            cleanup_cmds.insert(0, ('remove provisioned images', drop_cmd))
+        results = self.run_cmd_batch(self.primary_node, cleanup_cmds)
+        # THE VM MAY NOT HAVE BEEN DEFINED, SO ONLY THE REMOVALS ARE
+        # EXPECTED TO SUCCEED
+        self.assert_cmd_results_ok([result for result in results
+                                    if result.name.startswith('remove')])
 
     def prepare_network_config_content(self, bridge_url, check_ipaddress):
         """
@@ -329,8 +173,8 @@ class Story7535(GenericTest):
             Structured network-config file content
         """
         bridge_name = \
-            self.get_props_from_url(self.management_server, bridge_url,
-                                    "device_name")
+            self.get_cached_props(self.management_server, bridge_url,
+                                  "device_name")
         ifconfig_cmd = \
             self.net_utils.get_ifconfig_cmd(bridge_name)
         ifconfig_output, _, _ = \
@@ -357,17 +201,16 @@ class Story7535(GenericTest):
              "version: 1"]
         return network_config_content
 
+    @timed_step
     def wait_for_vm_start(self, vm_service_name):
         """
         wait for virtual machine to completely start.
-        Check by connecting to the virtual machine using virsh console.
+        Check by streaming the virtual machine's serial console until the
+        login banner appears.
         """
         expected_stdout = 'vm-service-host.localdomain login:'
-        self.wait_for_cmd(self.primary_node,
-                          "virsh console {0}".format(vm_service_name),
-                          -1,
-                          expected_stdout=expected_stdout,
-                          su_root=True)
+        self.wait_for_vm_boot(self.primary_node, vm_service_name,
+                              expected_stdout)
 
     @attr('all', 'revert', 'story7535', 'story7535_tc01', 'torf271798')
     def test_01_p_vm_positive_check_on(self):
@@ -393,25 +236,22 @@ class Story7535(GenericTest):
             The vm is deployed successfully, successfully cycles through
             the commands issued against it
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp7535_0"
+        vm_service_name = self.get_test_name("testapp7535_0")
         this_app_data_dir = '{0}/{1}/'.format(self.instances_data_dir,
                                               vm_service_name)
 
         try:
             # STEP 1
-            installed_libvirt, adaptor_installed =\
-                self.chk_dependencies_installed()
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
             self.copy_image_to_node(self.temp_image,
                                     this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
-
-            loaded_file = self.json_utils.load_json(config_file_dump)
+            vm_config = VMConfig.from_json(
+                self.libvirt.compile_vm_config_file())
+            vm_config.image = self.temp_image
 
             bridge_urls = self.get_bridge_urls()
             bridges = self.get_bridge_details(bridge_urls)
@@ -422,22 +262,16 @@ class Story7535(GenericTest):
                 interfaces_dict["eth{0}".format(counter)] = \
                 {"host_device": bridge, "ipaddress": bridges[bridge]}
                 counter += 1
-            loaded_file["vm_data"]["interfaces"] = interfaces_dict
-            loaded_file["adaptor_data"]["status-retry"] = 600
-            loaded_file["adaptor_data"]["status-timeout"] = 600
-            loaded_file["adaptor_data"]["start-timeout"] = 600
-            loaded_file["adaptor_data"]["internal_status_check"] = {}
-            loaded_file["adaptor_data"]["internal_status_check"]["active"] = \
-            'on'
+            vm_config.interfaces = interfaces_dict
+            vm_config.set_timeouts(status_retry=600, status_timeout=600,
+                                   start_timeout=600)
             check_ipaddress = interfaces_dict['eth0']['ipaddress']
-            loaded_file["adaptor_data"]["internal_"
-                                        "status_check"]["ip_address"] = \
-                                        check_ipaddress
-            config_file_dump = self.json_utils.dump_json(loaded_file)
+            vm_config.set_internal_status_check(STATUS_CHECK_ON,
+                                                check_ipaddress)
 
             self.create_file_on_node(self.primary_node, this_app_data_dir +
                                      '/config.json',
-                                     config_file_dump.split('\n'),
+                                     vm_config.to_lines(),
                                      su_root=True,
                                      add_to_cleanup=False)
 
@@ -472,21 +306,16 @@ class Story7535(GenericTest):
             interfaces_dict["eth0"] = {"host_device": bridges.keys()[0],
                                        "ipaddress": bridges.values()[0],
                                        "mac_address": mac_add}
-            loaded_file["vm_data"]["interfaces"] = interfaces_dict
-            loaded_file["vm_data"]["image"] = self.rhel7_4_image
+            vm_config.interfaces = interfaces_dict
+            vm_config.image = self.rhel7_4_image
 
-            config_file_dump = self.json_utils.dump_json(loaded_file)
             self.create_file_on_node(self.primary_node, this_app_data_dir +
                                      '/config.json',
-                                     config_file_dump.split('\n'),
+                                     vm_config.to_lines(),
                                      su_root=True,
                                      add_to_cleanup=False)
 
-            self.cp_file_on_node(self.primary_node,
-                                 '/tmp/{0}'.format(self.rhel7_4_image),
-                                 test_constants.LIBVIRT_IMAGE_DIR +
-                                 '/{0}'.format(self.rhel7_4_image),
-                                 su_root=True)
+            self.provision_image(self.primary_node, self.rhel7_4_image)
 
             network_config_path = this_app_data_dir + '/network-config'
             network_config_content = self.prepare_network_config_content(
@@ -501,9 +330,7 @@ class Story7535(GenericTest):
                 self.run_libvirt_service_cmd(self.primary_node,
                                              vm_service_name, cmd)
         finally:
-            self.cleanup_after_test(vm_service_name,
-                                    installed_libvirt,
-                                    adaptor_installed)
+            self.cleanup_after_test(vm_service_name)
 
     @attr('all', 'revert', 'story7535', 'story7535_tc02')
     def test_02_n_vm_negative_check_on(self):
@@ -528,25 +355,21 @@ class Story7535(GenericTest):
             The vm is deployed successfully, successfully cycles through
             the commands issued against it
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp7535_1"
+        vm_service_name = self.get_test_name("testapp7535_1")
         this_app_data_dir = \
         self.instances_data_dir + '/{0}/'.format(vm_service_name)
 
         try:
             # STEP 1
-            installed_libvirt, adaptor_installed =\
-                self.chk_dependencies_installed()
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
             self.copy_image_to_node(self.temp_invalid_image_503,
                                     this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
-
-            loaded_file = self.json_utils.load_json(config_file_dump)
+            vm_config = VMConfig.from_json(
+                self.libvirt.compile_vm_config_file())
 
             bridge_urls = self.get_bridge_urls()
             bridges = self.get_bridge_details(bridge_urls)
@@ -557,23 +380,17 @@ class Story7535(GenericTest):
                 interfaces_dict["eth{0}".format(counter)] = \
                 {"host_device": bridge, "ipaddress": bridges[bridge]}
                 counter += 1
-            loaded_file["vm_data"]["interfaces"] = interfaces_dict
-            loaded_file["vm_data"]["image"] = self.temp_invalid_image_503
-            loaded_file["adaptor_data"]["status-retry"] = 600
-            loaded_file["adaptor_data"]["status-timeout"] = 600
-            loaded_file["adaptor_data"]["start-timeout"] = 600
-            loaded_file["adaptor_data"]["internal_status_check"] = {}
-            loaded_file["adaptor_data"]["internal_status_check"]["active"] = \
-            'on'
+            vm_config.interfaces = interfaces_dict
+            vm_config.image = self.temp_invalid_image_503
+            vm_config.set_timeouts(status_retry=600, status_timeout=600,
+                                   start_timeout=600)
             check_ipaddress = interfaces_dict['eth0']['ipaddress']
-            loaded_file["adaptor_data"]["internal_"
-                                        "status_check"]["ip_address"] = \
-                                        check_ipaddress
-            config_file_dump = self.json_utils.dump_json(loaded_file)
+            vm_config.set_internal_status_check(STATUS_CHECK_ON,
+                                                check_ipaddress)
 
             self.create_file_on_node(self.primary_node, this_app_data_dir +
                                      '/config.json',
-                                     config_file_dump.split('\n'),
+                                     vm_config.to_lines(),
                                      su_root=True,
                                      add_to_cleanup=False)
 
@@ -597,9 +414,7 @@ class Story7535(GenericTest):
             self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
                                          'stop')
         finally:
-            self.cleanup_after_test(vm_service_name,
-                                    installed_libvirt,
-                                    adaptor_installed)
+            self.cleanup_after_test(vm_service_name)
 
     @attr('all', 'revert', 'story7535', 'story7535_tc03')
     def test_03_n_vm_negative_check_off(self):
@@ -624,25 +439,21 @@ class Story7535(GenericTest):
             The vm is deployed successfully, successfully cycles through
             the commands issued against it
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp7535_2"
+        vm_service_name = self.get_test_name("testapp7535_2")
         this_app_data_dir = \
         self.instances_data_dir + '/{0}/'.format(vm_service_name)
 
         try:
             # STEP 1
-            installed_libvirt, adaptor_installed =\
-                self.chk_dependencies_installed()
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
             self.copy_image_to_node(self.temp_invalid_image_503,
                                     this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
-
-            loaded_file = self.json_utils.load_json(config_file_dump)
+            vm_config = VMConfig.from_json(
+                self.libvirt.compile_vm_config_file())
 
             bridge_urls = self.get_bridge_urls()
             bridges = self.get_bridge_details(bridge_urls)
@@ -653,20 +464,15 @@ class Story7535(GenericTest):
                 interfaces_dict["eth{0}".format(counter)] = \
                 {"host_device": bridge, "ipaddress": bridges[bridge]}
                 counter += 1
-            loaded_file["vm_data"]["interfaces"] = interfaces_dict
-            loaded_file["vm_data"]["image"] = self.temp_invalid_image_503
-            loaded_file["adaptor_data"]["internal_status_check"] = {}
-            loaded_file["adaptor_data"]["internal_status_check"]["active"] = \
-            'off'
+            vm_config.interfaces = interfaces_dict
+            vm_config.image = self.temp_invalid_image_503
             check_ipaddress = interfaces_dict['eth0']['ipaddress']
-            loaded_file["adaptor_data"]["internal_"
-                                        "status_check"]["ip_address"] = \
-                                        check_ipaddress
-            config_file_dump = self.json_utils.dump_json(loaded_file)
+            vm_config.set_internal_status_check(STATUS_CHECK_OFF,
+                                                check_ipaddress)
 
             self.create_file_on_node(self.primary_node, this_app_data_dir +
                                      '/config.json',
-                                     config_file_dump.split('\n'),
+                                     vm_config.to_lines(),
                                      su_root=True,
                                      add_to_cleanup=False)
 
@@ -691,9 +497,7 @@ class Story7535(GenericTest):
             self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
                                          'stop')
         finally:
-            self.cleanup_after_test(vm_service_name,
-                                    installed_libvirt,
-                                    adaptor_installed)
+            self.cleanup_after_test(vm_service_name)
 
     @attr('all', 'revert', 'story7535', 'story7535_tc04', 'torf271798')
     def test_04_n_vm_negative_check_timeout(self):
@@ -719,25 +523,21 @@ class Story7535(GenericTest):
             for success or 503 for failure so it should continue to
             poll for a response. So the start command should timeout.
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp7535_3"
+        vm_service_name = self.get_test_name("testapp7535_3")
         this_app_data_dir = '{0}/{1}/'.format(self.instances_data_dir,
                                               vm_service_name)
 
         try:
             # STEP 1
-            installed_libvirt, adaptor_installed =\
-                self.chk_dependencies_installed()
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
             self.copy_image_to_node(self.temp_invalid_image_400,
                                     this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
-
-            loaded_file = self.json_utils.load_json(config_file_dump)
+            vm_config = VMConfig.from_json(
+                self.libvirt.compile_vm_config_file())
 
             bridge_urls = self.get_bridge_urls()
             bridges = self.get_bridge_details(bridge_urls)
@@ -748,20 +548,15 @@ class Story7535(GenericTest):
                 interfaces_dict["eth{0}".format(counter)] = \
                 {"host_device": bridge, "ipaddress": bridges[bridge]}
                 counter += 1
-            loaded_file["vm_data"]["interfaces"] = interfaces_dict
-            loaded_file["vm_data"]["image"] = self.temp_invalid_image_400
-            loaded_file["adaptor_data"]["internal_status_check"] = {}
-            loaded_file["adaptor_data"]["internal_status_check"]["active"] = \
-            'on'
+            vm_config.interfaces = interfaces_dict
+            vm_config.image = self.temp_invalid_image_400
             check_ipaddress = interfaces_dict['eth0']['ipaddress']
-            loaded_file["adaptor_data"]["internal_"
-                                        "status_check"]["ip_address"] = \
-                                        check_ipaddress
-            config_file_dump = self.json_utils.dump_json(loaded_file)
+            vm_config.set_internal_status_check(STATUS_CHECK_ON,
+                                                check_ipaddress)
 
             self.create_file_on_node(self.primary_node, this_app_data_dir +
                                      '/config.json',
-                                     config_file_dump.split('\n'),
+                                     vm_config.to_lines(),
                                      su_root=True,
                                      add_to_cleanup=False)
 
@@ -798,20 +593,17 @@ class Story7535(GenericTest):
             interfaces_dict["eth0"] = {"host_device": bridges.keys()[0],
                                        "ipaddress": bridges.values()[0],
                                        "mac_address": mac_add}
-            loaded_file["vm_data"]["interfaces"] = interfaces_dict
-            loaded_file["vm_data"]["image"] = self.invalid_rhel7_4_image_400
+            vm_config.interfaces = interfaces_dict
+            vm_config.image = self.invalid_rhel7_4_image_400
 
-            config_file_dump = self.json_utils.dump_json(loaded_file)
             self.create_file_on_node(self.primary_node, '{0}config.json'.
                                      format(this_app_data_dir),
-                                     config_file_dump.split('\n'),
+                                     vm_config.to_lines(),
                                      su_root=True,
                                      add_to_cleanup=False)
 
-            self.cp_file_on_node(self.primary_node, '/tmp/{0}'.format(
-                self.invalid_rhel7_4_image_400), '{0}/{1}'.format(
-                    test_constants.LIBVIRT_IMAGE_DIR,
-                    self.invalid_rhel7_4_image_400), su_root=True)
+            self.provision_image(self.primary_node,
+                                 self.invalid_rhel7_4_image_400)
 
             network_config_path = \
                 '{0}network-config'.format(this_app_data_dir)
@@ -835,6 +627,4 @@ class Story7535(GenericTest):
                                          'stop')
 
         finally:
-            self.cleanup_after_test(vm_service_name,
-                                    installed_libvirt,
-                                    adaptor_installed)
+            self.cleanup_after_test(vm_service_name)
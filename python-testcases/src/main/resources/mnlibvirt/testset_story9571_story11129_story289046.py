@@ -13,19 +13,40 @@ program(s) have been supplied.
             Agile: LITPCDS-9571
 """
 
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from libvirt_adaptor_base import LibvirtAdaptorTest
+from step_timer import timed_step
+from instance_dir_manifest import LIVE_SUFFIX
 from redhat_cmd_utils import RHCmdUtils
 from libvirt_utils import LibvirtUtils
 import test_constants
+import os
 
 
-class Story9571(GenericTest):
+class Story9571(LibvirtAdaptorTest):
     """
     LITPCDS-9571:
     As a LITP User I want a means of undefining a VM so I have a
     comprehensive means of cleaning up a faulted VM.
     """
 
+    # THE TESTS ONLY SHARE NODES THROUGH lease_test_node, SO THEY MAY BE
+    # RUN IN SEPARATE PROCESSES
+    _multiprocess_can_split_ = True
+
+    # WHETHER THE ARCHIVED IMAGE IS CHECKED TO BE BYTE-IDENTICAL TO THE
+    # IMAGE THE VM RAN FROM, BY md5sum. HASHING MULTI-GB IMAGES TAKES
+    # TIME, SO IT IS ONLY DONE ON REQUEST
+    verify_archived_image = os.environ.get('MNLIBVIRT_VERIFY_ARCHIVE') == '1'
+
+    # SECONDS STOP-UNDEFINE IS ALLOWED TO STOP AND UNDEFINE THE VM, ON
+    # TOP OF ITS --stop-timeout
+    stop_undefine_overhead = 30
+
+    # SECONDS STOP-UNDEFINE IS ALLOWED PER GB OF IMAGE IT ARCHIVES
+    archive_secs_per_gb = float(
+        os.environ.get('MNLIBVIRT_ARCHIVE_SECS_PER_GB', '30'))
+
     def setUp(self):
         """
         Description:
@@ -33,8 +54,7 @@ class Story9571(GenericTest):
         Actions:
             Determine
                 management server,
-                primary vcs node(first node in array
-                                 returned from test framework)
+                primary node(the managed node leased for the test)
                 list of all managed nodes
         Results:
             Class variables that are required to execute tests
@@ -43,9 +63,9 @@ class Story9571(GenericTest):
         super(Story9571, self).setUp()
         self.rh_os = RHCmdUtils()
         self.libvirt = LibvirtUtils()
-        self.temp_image = "rhel.img"
-        self.temp_image_1 = "rhel_1.img"
-        self.rhel7_4_image = "rhel7_4.img"
+        self.temp_image = self.get_test_name("rhel.img")
+        self.temp_image_1 = self.get_test_name("rhel_1.img")
+        self.rhel7_4_image = self.get_test_name("rhel7_4.img")
         self.adaptor_pkg_name = test_constants.LIBVIRT_ADAPTOR_PKG_NAME
         self.libvirt_dir = test_constants.LIBVIRT_DIR
         self.temp_image_location = test_constants.VM_IMAGE_MS_DIR
@@ -53,27 +73,27 @@ class Story9571(GenericTest):
         self.images_dir = test_constants.LIBVIRT_IMAGE_DIR
         self.management_server = self.get_management_node_filename()
         self.list_managed_nodes = self.get_managed_node_filenames()
-        self.primary_node = self.list_managed_nodes[0]
+        # RUN ON A NODE ON WHICH NO OTHER TEST USES THE IMAGES OR THE
+        # INSTANCE DIRECTORY
+        self.primary_node = self.lease_test_node(
+            [self.temp_image, self.temp_image_1, self.rhel7_4_image],
+            [self.get_test_name('testapp9571_0')], self.list_managed_nodes)
         self.libvirt_config_dir = test_constants.LIBVIRT_CONFIG_DIR
         self.cpu_tag_xml = "<cpu mode='host-passthrough'>"
-
-        # CHECK WHETHER THE IMG IS IN THE TMP DIR ON THE NODE - IF NOT COPY
-        dir_contents = \
-            self.list_dir_contents(self.primary_node,
-                                   '/tmp')
-        if self.temp_image not in dir_contents:
-            ms_dir_contents = \
-                self.list_dir_contents(self.management_server,
-                                       self.temp_image_location)
-
-            self.wget_image_to_node(self.management_server, self.primary_node,
-                                    ms_dir_contents[0], '/tmp',
-                                    self.temp_image)
+        # THE IMAGE THE VM RUNS FROM, BY INSTANCE DIR, AS FOUND BY
+        # check_vm_dir_cont
+        self.live_images = {}
+        # md5sum OF THE IMAGE THE VM RAN FROM, BY IMAGE NAME, TAKEN BY
+        # stop_undefine_vm IF verify_archived_image IS SET
+        self.live_image_md5s = {}
+
+        # STAGE THE IMGS IN THE TMP DIR ON THE NODE FROM THE IMAGE CACHE
+        ms_dir_contents = self.get_ms_image_names(self.management_server)
+        self.stage_image(self.management_server, self.primary_node,
+                         ms_dir_contents[0], self.temp_image)
         # TORF-271798: RHEL7.4 image
-        if self.rhel7_4_image not in dir_contents:
-            self.wget_image_to_node(self.management_server, self.primary_node,
-                                    "vm_test_image-5-1.0.7.qcow2", '/tmp',
-                                    self.rhel7_4_image)
+        self.stage_image(self.management_server, self.primary_node,
+                         "vm_test_image-5-1.0.7.qcow2", self.rhel7_4_image)
 
     def tearDown(self):
         """
@@ -86,121 +106,116 @@ class Story9571(GenericTest):
         """
         super(Story9571, self).tearDown()
 
-    def chk_dependencies_installed(self):
-        """
-        check whether libvirt is installed - if not then
-        install libvirt on the node and start the service.
-        """
-        installed_libvirt = \
-            self.check_pkgs_installed(self.primary_node,
-                                      ["libvirt-0.10.2-18.el6.x86_64"])
-        if not installed_libvirt:
-            self.install_rpm_on_node(self.primary_node, ['libvirt'])
-            installed_libvirt = True
-        self.start_service(self.primary_node, 'libvirtd')
-        adaptor_installed = \
-            self.check_pkgs_installed(
-                self.primary_node,
-                [test_constants.LIBVIRT_ADAPTOR_PKG_NAME])
-        if not adaptor_installed:
-            self.install_rpm_on_node(
-                self.primary_node,
-                [test_constants.LIBVIRT_ADAPTOR_PKG_NAME])
-            adaptor_installed = True
-
-        return installed_libvirt, adaptor_installed
-
+    @timed_step
     def copy_image_to_node(self, image_name, app_data_dir):
         """
-        Copy the image to the correct location on the node
+        Provision the image in the correct location on the node
         Create the instance directory and the test application subdirectory
         """
 
-        dir_contents = \
-            self.list_dir_contents(self.primary_node, self.libvirt_dir)
-        image_dir_name = self.images_dir.split('/')[-1]
-        if image_dir_name not in dir_contents:
-            self.create_dir_on_node(self.primary_node,
-                                    self.images_dir,
-                                    su_root=True)
-        self.cp_file_on_node(self.primary_node,
-                             '/tmp/{0}'.format(image_name),
-                             test_constants.LIBVIRT_IMAGE_DIR +
-                             '/{0}'.format(image_name),
-                             su_root=True)
-
-        instances_dir_name = self.instances_data_dir.split('/')[-1]
-        if instances_dir_name not in dir_contents:
-            self.create_dir_on_node(self.primary_node,
-                                    self.instances_data_dir,
-                                    su_root=True)
-        self.create_dir_on_node(self.primary_node,
-                                app_data_dir,
-                                su_root=True)
-
+        # THE IMAGE, INSTANCE AND APPLICATION DIRS ARE CREATED AND THE
+        # IMAGE PROVISIONED IN A SINGLE ROUND TRIP
+        self.queue_node_cmd(self.primary_node, 'mkdir',
+                            '/bin/mkdir -p {0} {1} {2}'.format(
+                                self.images_dir, self.instances_data_dir,
+                                app_data_dir))
+        self.queue_node_cmd(self.primary_node, 'provision',
+                            self.get_provision_image_cmd(self.primary_node,
+                                                         image_name))
+        self.assert_cmd_results_ok(self.flush_node_cmds(self.primary_node))
+
+    @timed_step
     def wait_for_vm_start(self, vm_service_name):
         """
         wait for virtual machine to completely start.
-        Check by connecting to the virtual machine using virsh console.
+        Check by streaming the virtual machine's serial console until the
+        login banner appears.
         """
         expected_stdout = 'localhost.localdomain.localdomain login:'
-        self.wait_for_cmd(self.primary_node,
-                          "virsh console {0}".format(vm_service_name),
-                          -1,
-                          expected_stdout=expected_stdout,
-                          su_root=True)
+        self.wait_for_vm_boot(self.primary_node, vm_service_name,
+                              expected_stdout)
 
     def check_vm_dir_cont(self, this_app_data_dir):
         """
         Check contents of vm service directory
         Return .live files and vm images
         """
+        # LIST THE DIR AND READ THE IMAGE NAME FROM config.json IN ONE GO
+        manifest = self.get_instance_dir_manifest(self.primary_node,
+                                                  this_app_data_dir)
+
         # List to contain files to be copied after stop-undefine
-        filesfound = []
-
-        dirlist_before = self.list_dir_contents(self.primary_node,
-                                                this_app_data_dir,
-                                                su_root=True)
-        # Get image name from config.json
-        config_json = self.get_file_contents(self.primary_node,
-                                             this_app_data_dir +
-                                             'config.json',
-                                             su_root=True)
-
-        config_json_dict = eval(config_json[0])
-        config_image = config_json_dict["vm_data"]["image"]
-
-        for livefile in dirlist_before:
-            if livefile.endswith('.live'):
-                filesfound.append(livefile)
-        filesfound.append(config_image)
+        filesfound = sorted(manifest.get_live_files())
+        filesfound.append(manifest.config.image)
+        self.live_images[this_app_data_dir] = manifest.config.image
         return filesfound
 
-    def compare_vm_dir_cont(self, filesfound, this_app_data_dir):
+    def stop_undefine_vm(self, vm_service_name, verb, this_app_data_dir):
+        """
+        Run stop-undefine or force-stop-undefine on the vm service
+        Check the stop timeout was kept
+        Return the timeline of the run, archiving included
+        If verify_archived_image is set, stop the vm service first and
+        take the md5sum of its image in the vm service directory, which
+        no longer changes once the VM is stopped
+        """
+        self.live_image_md5s = {}
+        if self.verify_archived_image:
+            image = self.live_images[this_app_data_dir]
+            self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
+                                         'stop')
+            manifest = self.get_instance_dir_manifest(
+                self.primary_node, this_app_data_dir,
+                checksum_files=[image], read_config=False)
+            self.live_image_md5s[image] = manifest.files[image].md5
+        timeline = self.run_timed_stop_undefine(self.primary_node,
+                                                vm_service_name, verb)
+        self.assert_stop_undefine_timeline(timeline)
+        return timeline
+
+    def compare_vm_dir_cont(self, filesfound, this_app_data_dir, timeline):
         """
         Check contents of dir /last_undefined_vm of the vm service
         Check if correct files are stored in /last_undefined_vm
         after vm service is stopped
+        Check the stop-undefine run took no longer than its stop timeout
+        and the time allowed for the size of the archived image
         """
-        # List to contain files to be copied after stop-undefine
-        newfiles = []
-
-        # List of files that were copied after stop-undefine
-        dirlist_after = self.list_dir_contents(self.primary_node,
-                                               this_app_data_dir +
-                                               'last_undefined_vm',
-                                               su_root=True)
-        self.assertTrue(dirlist_after, "Directory  not found")
-
-        # Add timestamp to files found to compare to files after stop
-        for foundfile in filesfound:
-            newfiles.append(foundfile + '-' +
-                            dirlist_after[0].split("-")[-1])
-        # Put files in correct order
-        newfiles[-2], newfiles[-1] = newfiles[-1], newfiles[-2]
-        self.assertEqual(dirlist_after, newfiles,
+        manifest = self.get_instance_dir_manifest(
+            self.primary_node, this_app_data_dir,
+            checksum_files=list(self.live_image_md5s), read_config=False)
+        self.assertTrue(manifest.archived, "Directory  not found")
+
+        # ALL THE FILES CARRY THE TIMESTAMP OF A SINGLE STOP-UNDEFINE
+        self.assertEqual(1, len(manifest.archive_suffixes),
+                         'Files of more than one stop-undefine found: '
+                         '{0}'.format(sorted(manifest.archive_suffixes)))
+        self.assertEqual(set(filesfound), set(manifest.archived),
                          'Correct files not copied')
 
+        for image, live_md5 in self.live_image_md5s.items():
+            if image in manifest.archived:
+                self.assertEqual(live_md5, manifest.archived[image].md5,
+                                 'Archived image {0} differs from the '
+                                 'image the VM ran from'.format(image))
+
+        # ONLY THE IMAGE IS LARGE ENOUGH TO TAKE MEASURABLE TIME TO ARCHIVE
+        archived_gb = sum(entry.size for name, entry
+                          in manifest.archived.items()
+                          if not name.endswith(LIVE_SUFFIX)) / 1024.0 ** 3
+        allowed_seconds = (self.stop_undefine_overhead +
+                           (timeline.stop_timeout or 0) +
+                           archived_gb * self.archive_secs_per_gb)
+        self.log("info", '{0} archived {1:.2f} GB in {2:.1f}s, {3:.1f}s '
+                 'per GB'.format(timeline.verb, archived_gb,
+                                 timeline.duration,
+                                 timeline.duration / max(archived_gb, 0.001)))
+        self.assertTrue(timeline.duration <= allowed_seconds,
+                        '{0} took {1:.1f}s to archive {2:.2f} GB, more '
+                        'than the {3:.1f}s allowed'.format(
+                            timeline.verb, timeline.duration, archived_gb,
+                            allowed_seconds))
+
     def confirm_files_in_vm_dir_cont(self, vm_files, dir_content):
         """
         Assert that all files in a given list are present in vm dir content
@@ -275,9 +290,7 @@ class Story9571(GenericTest):
             The following line exists <cpu mode='host-passthrough'>
             in each vm.xml on hardware env and doesn't exist in virtual env.
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp9571_0"
+        vm_service_name = self.get_test_name("testapp9571_0")
         this_app_data_dir = \
             self.instances_data_dir + '/{0}/'.format(vm_service_name)
 
@@ -285,20 +298,20 @@ class Story9571(GenericTest):
                                "ram": "256M",
                                "interfaces": {},
                                "hd": [],
-                               "image": "rhel_1.img"}}
+                               "image": self.temp_image_1}}
 
         try:
-            # CHECK WHETHER LIBVIRT IS INSTALLED - IF NOT THEN
-            # INSTALL LIBVIRT ON THE NODE AND START THE SERVICE
+            # CHECK WHETHER LIBVIRT AND THE ADAPTOR ARE INSTALLED - IF NOT
+            # THEN INSTALL THEM ON THE NODE AND START THE SERVICE
             # STEP 1
-            installed_libvirt, adaptor_installed = \
-                self.chk_dependencies_installed()
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
             self.copy_image_to_node(self.temp_image, this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
+            config_file_dump = self.set_vm_config_image(
+                self.libvirt.compile_vm_config_file(), self.temp_image)
             self.create_file_on_node(self.primary_node,
                                      this_app_data_dir + '/config.json',
                                      config_file_dump.split('\n'),
@@ -322,10 +335,11 @@ class Story9571(GenericTest):
                                          'status')
 
             # STEP 6
-            self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
-                                         'stop-undefine --stop-timeout 20')
+            timeline = self.stop_undefine_vm(vm_service_name,
+                                             'stop-undefine --stop-timeout 20',
+                                             this_app_data_dir)
 
-            self.compare_vm_dir_cont(filesfound, this_app_data_dir)
+            self.compare_vm_dir_cont(filesfound, this_app_data_dir, timeline)
 
             # STEP 7
             # Remove dir last_undefined_vm
@@ -345,24 +359,19 @@ class Story9571(GenericTest):
                                          'status')
 
             # STEP 10
-            self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
-                                         'stop-undefine --stop-timeout 20')
+            timeline = self.stop_undefine_vm(vm_service_name,
+                                             'stop-undefine --stop-timeout 20',
+                                             this_app_data_dir)
             # Step 11
-            self.compare_vm_dir_cont(filesfound, this_app_data_dir)
+            self.compare_vm_dir_cont(filesfound, this_app_data_dir, timeline)
             # Step 12
             ms_dir_contents = \
-                self.list_dir_contents(self.management_server,
-                                       self.temp_image_location)
-
-            self.wget_image_to_node(self.management_server, self.primary_node,
-                                    ms_dir_contents[2], '/tmp',
-                                    self.temp_image_1)
-
-            self.cp_file_on_node(self.primary_node,
-                                 '/tmp/{0}'.format(self.temp_image_1),
-                                 test_constants.LIBVIRT_IMAGE_DIR +
-                                 '/{0}'.format(self.temp_image_1),
-                                 su_root=True)
+                self.get_ms_image_names(self.management_server)
+
+            self.stage_image(self.management_server, self.primary_node,
+                             ms_dir_contents[2], self.temp_image_1)
+
+            self.provision_image(self.primary_node, self.temp_image_1)
             # Remove old config.json, to be replaced with new config.json
             # containing new image
             self.remove_item(self.primary_node, this_app_data_dir +
@@ -386,22 +395,15 @@ class Story9571(GenericTest):
             self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
                                          'stop-undefine --stop-timeout 20')
             # STEP 15
-            dir_contents = \
-                self.list_dir_contents(self.primary_node,
-                                       this_app_data_dir + 'last_undefined_vm',
-                                       su_root=True)
+            manifest = self.get_instance_dir_manifest(self.primary_node,
+                                                      this_app_data_dir,
+                                                      read_config=False)
             # Check dir /last_undefined_vm contains new image
-            self.assertTrue(self.is_text_in_list(self.temp_image_1,
-                                                 dir_contents),
+            self.assertTrue(self.temp_image_1 in manifest.archived,
                             "Updated image not present")
 
             # TORF-271798 TC_17: un-define a RHEL7.4 based vm service
-            self.cp_file_on_node(self.primary_node,
-                                 '/tmp/{0}'.format(self.rhel7_4_image),
-                                 '{0}/{1}'.format(
-                                     test_constants.LIBVIRT_IMAGE_DIR,
-                                     self.rhel7_4_image),
-                                 su_root=True)
+            self.provision_image(self.primary_node, self.rhel7_4_image)
 
             # modify config.json file to contain rhel7.4 image
             config_json_path = '{0}/config.json'.format(this_app_data_dir)
@@ -418,8 +420,8 @@ class Story9571(GenericTest):
             self.log("info", "Step 16: checking vm configuration has"
                              " <cpu mode='host-passthrough'>"
                              " in case of physical environment")
-            path_to_xml = "{0}/testapp9571_0.xml".format(
-                self.libvirt_config_dir)
+            path_to_xml = "{0}/{1}.xml".format(
+                self.libvirt_config_dir, vm_service_name)
             xmlfile = self.get_file_contents(self.primary_node,
                                              path_to_xml,
                                              tail=None, su_root=True,
@@ -465,29 +467,18 @@ class Story9571(GenericTest):
             filesfound = self.check_vm_dir_cont(this_app_data_dir)
             self.confirm_files_in_vm_dir_cont(config_files, filesfound)
 
-            self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
-                                         'stop-undefine --stop-timeout 20')
+            timeline = self.stop_undefine_vm(vm_service_name,
+                                             'stop-undefine --stop-timeout 20',
+                                             this_app_data_dir)
 
-            self.compare_vm_dir_cont(filesfound, this_app_data_dir)
+            self.compare_vm_dir_cont(filesfound, this_app_data_dir, timeline)
 
         finally:
-            self.remove_item(self.primary_node, self.images_dir +
-                             '/{0}'.format(self.temp_image),
-                             su_root=True)
-            self.remove_item(self.primary_node, self.images_dir +
-                             '/{0}'.format(self.rhel7_4_image),
-                             su_root=True)
+            self.drop_provisioned_images(self.primary_node)
             vm_undefine_cmd = \
                 self.libvirt.get_virsh_undefine_cmd(vm_service_name)
             self.run_command(self.primary_node, vm_undefine_cmd, su_root=True)
 
-            if installed_libvirt:
-                self.remove_rpm_on_node(self.primary_node, ["libvirt"])
-            if adaptor_installed:
-                self.remove_rpm_on_node(
-                    self.primary_node,
-                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
-
     @attr('all', 'revert', 'story9571', 'story9571_tc02', 'torf271798_tc04',
           'torf271798_tc17')
     def test_02_p_vm_force_stop_undefine_when_vm_started(self):
@@ -517,24 +508,22 @@ class Story9571(GenericTest):
              Checks that network-config v1 and meta-data files remain in the
              instance directory when undefining a vm
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp9571_0"
+        vm_service_name = self.get_test_name("testapp9571_0")
         this_app_data_dir = '{0}/{1}/'.format(self.instances_data_dir,
                                               vm_service_name)
 
         try:
-            # CHECK WHETHER LIBVIRT IS INSTALLED - IF NOT THEN
-            # INSTALL LIBVIRT ON THE NODE AND START THE SERVICE
+            # CHECK WHETHER LIBVIRT AND THE ADAPTOR ARE INSTALLED - IF NOT
+            # THEN INSTALL THEM ON THE NODE AND START THE SERVICE
             # STEP 1
-            installed_libvirt, adaptor_installed = \
-                self.chk_dependencies_installed()
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
             self.copy_image_to_node(self.temp_image, this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
+            config_file_dump = self.set_vm_config_image(
+                self.libvirt.compile_vm_config_file(), self.temp_image)
             self.create_file_on_node(self.primary_node,
                                      this_app_data_dir + '/config.json',
                                      config_file_dump.split('\n'),
@@ -557,22 +546,18 @@ class Story9571(GenericTest):
                                          'status')
 
             # STEP 6
-            self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
-                                         'force-stop-undefine')
+            timeline = self.stop_undefine_vm(vm_service_name,
+                                             'force-stop-undefine',
+                                             this_app_data_dir)
             # run twice to make sure dir last_undefined_vm
             #  is not overwritten
             self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
                                          'force-stop-undefine')
 
-            self.compare_vm_dir_cont(filesfound, this_app_data_dir)
+            self.compare_vm_dir_cont(filesfound, this_app_data_dir, timeline)
 
             # TORF-271798 TC_17: un-define a RHEL7.4 based vm service
-            self.cp_file_on_node(self.primary_node,
-                                 '/tmp/{0}'.format(self.rhel7_4_image),
-                                 '{0}/{1}'.format(
-                                     test_constants.LIBVIRT_IMAGE_DIR,
-                                     self.rhel7_4_image),
-                                 su_root=True)
+            self.provision_image(self.primary_node, self.rhel7_4_image)
 
             # modify config.json file to contain rhel7.4 image
             config_json_path = '{0}config.json'.format(this_app_data_dir)
@@ -590,29 +575,17 @@ class Story9571(GenericTest):
 
             filesfound = self.check_vm_dir_cont(this_app_data_dir)
             self.confirm_files_in_vm_dir_cont(config_files, filesfound)
-            self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
-                                         'force-stop-undefine')
-            self.compare_vm_dir_cont(filesfound, this_app_data_dir)
+            timeline = self.stop_undefine_vm(vm_service_name,
+                                             'force-stop-undefine',
+                                             this_app_data_dir)
+            self.compare_vm_dir_cont(filesfound, this_app_data_dir, timeline)
 
         finally:
-            self.remove_item(self.primary_node, self.images_dir +
-                             '/{0}'.format(self.temp_image),
-                             su_root=True)
-            self.remove_item(self.primary_node,
-                             '{0}/{1}'.format(self.images_dir,
-                                              self.rhel7_4_image),
-                             su_root=True)
+            self.drop_provisioned_images(self.primary_node)
             vm_undefine_cmd = \
                 self.libvirt.get_virsh_undefine_cmd(vm_service_name)
             self.run_command(self.primary_node, vm_undefine_cmd, su_root=True)
 
-            if installed_libvirt:
-                self.remove_rpm_on_node(self.primary_node, ["libvirt"])
-            if adaptor_installed:
-                self.remove_rpm_on_node(
-                    self.primary_node,
-                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
-
     @attr('all', 'revert', 'story9571', 'story9571_tc03')
     def test_03_p_vm_stop_undefine_when_vm_stopped(self):
         """
@@ -634,24 +607,22 @@ class Story9571(GenericTest):
             The vm is deployed successfully and successfully cycles through
             the commands issued against it.
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp9571_0"
+        vm_service_name = self.get_test_name("testapp9571_0")
         this_app_data_dir = \
             self.instances_data_dir + '/{0}/'.format(vm_service_name)
 
         try:
-            # CHECK WHETHER LIBVIRT IS INSTALLED - IF NOT THEN
-            # INSTALL LIBVIRT ON THE NODE AND START THE SERVICE
+            # CHECK WHETHER LIBVIRT AND THE ADAPTOR ARE INSTALLED - IF NOT
+            # THEN INSTALL THEM ON THE NODE AND START THE SERVICE
             # STEP 1
-            installed_libvirt, adaptor_installed = \
-                self.chk_dependencies_installed()
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
             self.copy_image_to_node(self.temp_image, this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
+            config_file_dump = self.set_vm_config_image(
+                self.libvirt.compile_vm_config_file(), self.temp_image)
             self.create_file_on_node(self.primary_node,
                                      this_app_data_dir + '/config.json',
                                      config_file_dump.split('\n'),
@@ -679,20 +650,11 @@ class Story9571(GenericTest):
                                          'stop-undefine')
 
         finally:
-            self.remove_item(self.primary_node, self.images_dir +
-                             '/{0}'.format(self.temp_image),
-                             su_root=True)
+            self.drop_provisioned_images(self.primary_node)
             vm_undefine_cmd = \
                 self.libvirt.get_virsh_undefine_cmd(vm_service_name)
             self.run_command(self.primary_node, vm_undefine_cmd, su_root=True)
 
-            if installed_libvirt:
-                self.remove_rpm_on_node(self.primary_node, ["libvirt"])
-            if adaptor_installed:
-                self.remove_rpm_on_node(
-                    self.primary_node,
-                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
-
     @attr('all', 'revert', 'story9571', 'story9571_tc04')
     def test_04_p_vm_force_stop_undefine_when_vm_stopped(self):
         """
@@ -715,24 +677,22 @@ class Story9571(GenericTest):
             The vm is deployed successfully and successfully cycles through
             the commands issued against it.
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp9571_0"
+        vm_service_name = self.get_test_name("testapp9571_0")
         this_app_data_dir = \
             self.instances_data_dir + '/{0}/'.format(vm_service_name)
 
         try:
-            # CHECK WHETHER LIBVIRT IS INSTALLED - IF NOT THEN
-            # INSTALL LIBVIRT ON THE NODE AND START THE SERVICE
+            # CHECK WHETHER LIBVIRT AND THE ADAPTOR ARE INSTALLED - IF NOT
+            # THEN INSTALL THEM ON THE NODE AND START THE SERVICE
             # STEP 1
-            installed_libvirt, adaptor_installed = \
-                self.chk_dependencies_installed()
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
             self.copy_image_to_node(self.temp_image, this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
+            config_file_dump = self.set_vm_config_image(
+                self.libvirt.compile_vm_config_file(), self.temp_image)
             self.create_file_on_node(self.primary_node,
                                      this_app_data_dir + '/config.json',
                                      config_file_dump.split('\n'),
@@ -760,19 +720,10 @@ class Story9571(GenericTest):
                                          'force-stop-undefine')
 
         finally:
-            self.remove_item(self.primary_node, self.images_dir +
-                             '/{0}'.format(self.temp_image),
-                             su_root=True)
+            self.drop_provisioned_images(self.primary_node)
             vm_undefine_cmd = \
                 self.libvirt.get_virsh_undefine_cmd(vm_service_name)
             self.run_command(self.primary_node, vm_undefine_cmd, su_root=True)
-            if installed_libvirt:
-                self.remove_rpm_on_node(self.primary_node, ["libvirt"])
-
-            if adaptor_installed:
-                self.remove_rpm_on_node(
-                    self.primary_node,
-                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
 
     @attr('all', 'revert', 'story9571', 'story9571_tc05')
     def test_05_p_vm_force_stop_undefine_after_vm_stopped_undefine(self):
@@ -796,24 +747,22 @@ class Story9571(GenericTest):
             The vm is deployed successfully and successfully cycles through
             the commands issued against it.
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp9571_0"
+        vm_service_name = self.get_test_name("testapp9571_0")
         this_app_data_dir = \
             self.instances_data_dir + '/{0}/'.format(vm_service_name)
 
         try:
-            # CHECK WHETHER LIBVIRT IS INSTALLED - IF NOT THEN
-            # INSTALL LIBVIRT ON THE NODE AND START THE SERVICE
+            # CHECK WHETHER LIBVIRT AND THE ADAPTOR ARE INSTALLED - IF NOT
+            # THEN INSTALL THEM ON THE NODE AND START THE SERVICE
             # STEP 1
-            installed_libvirt, adaptor_installed = \
-                self.chk_dependencies_installed()
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
             self.copy_image_to_node(self.temp_image, this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
+            config_file_dump = self.set_vm_config_image(
+                self.libvirt.compile_vm_config_file(), self.temp_image)
             self.create_file_on_node(self.primary_node,
                                      this_app_data_dir + '/config.json',
                                      config_file_dump.split('\n'),
@@ -841,16 +790,8 @@ class Story9571(GenericTest):
                                          'force-stop-undefine')
 
         finally:
-            self.remove_item(self.primary_node, self.images_dir +
-                             '/{0}'.format(self.temp_image),
-                             su_root=True)
+            self.drop_provisioned_images(self.primary_node)
             vm_undefine_cmd = \
                 self.libvirt.get_virsh_undefine_cmd(vm_service_name)
             self.run_command(self.primary_node, vm_undefine_cmd, su_root=True)
 
-            if installed_libvirt:
-                self.remove_rpm_on_node(self.primary_node, ["libvirt"])
-            if adaptor_installed:
-                self.remove_rpm_on_node(
-                    self.primary_node,
-                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
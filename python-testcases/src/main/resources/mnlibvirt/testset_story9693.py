@@ -14,16 +14,21 @@ program(s) have been supplied.
             Agile: LITPCDS-9693
 """
 
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from libvirt_adaptor_base import LibvirtAdaptorTest
+from step_timer import timed_step
+from vm_config import VMConfig, STATUS_CHECK_ON
+from litp_model_batch import LitpModelBatch
 from redhat_cmd_utils import RHCmdUtils
 from libvirt_utils import LibvirtUtils
 from vcs_utils import VCSUtils
 import test_constants
 from json_utils import JSONUtils
 from networking_utils import NetworkingUtils
+import os
 
 
-class Story9693(GenericTest):
+class Story9693(LibvirtAdaptorTest):
     """
     LITPCDS-9693:
     As an application designer I want a means of destroying a VM
@@ -31,6 +36,10 @@ class Story9693(GenericTest):
     recover from a failure
     """
 
+    # test_06 RUNS TWO PLANS OF UP TO AN HOUR EACH
+    test_deadline = int(os.environ.get('MNLIBVIRT_TEST_DEADLINE',
+                                       3 * 3600))
+
     def setUp(self):
         """
         Description:
@@ -51,32 +60,32 @@ class Story9693(GenericTest):
         self.vcs = VCSUtils()
         self.json_utils = JSONUtils()
         self.net_utils = NetworkingUtils()
-        self.temp_image_name = "rhel.img"
+        self.temp_image_name = self.get_test_name("rhel.img")
         self.cs_name = "CS_VM2"
         self.libvirt_dir = test_constants.LIBVIRT_DIR
         self.instances_data_dir = test_constants.LIBVIRT_INSTANCES_DIR
         self.images_dir = test_constants.LIBVIRT_IMAGE_DIR
         self.management_server = self.get_management_node_filename()
-        self.primary_node = self.get_managed_node_filenames()[0]
+        # THE CLUSTERED SERVICES ARE DEPLOYED ON THE FIRST NODE, WAIT FOR
+        # ANY OTHER TEST USING THE IMAGE OR THE INSTANCE DIRECTORIES THERE
+        self.primary_node = self.lease_test_node(
+            [self.temp_image_name],
+            [self.get_test_name('testapp9693_0'),
+             self.get_test_name('testapp9693_1')],
+            self.get_managed_node_filenames()[:1])
         self.primary_node_url = self.get_node_url_from_filename(
             self.management_server, self.primary_node)
 
-        # CHECK WHETHER THE IMG IS IN THE TMP DIR ON THE NODE - IF NOT COPY
-        dir_contents = self.list_dir_contents(self.primary_node, '/tmp')
         self.ms_hostname = self.get_node_att(self.management_server,
                                              "hostname")
         sfs_filenames = self.get_sfs_node_filenames()
         self.sfs_hostname = self.get_node_att(sfs_filenames[0],
                                               "hostname")
         self.sfs_ip = self.get_node_att(sfs_filenames[0], "ipv4")
-        if self.temp_image_name not in dir_contents:
-            ms_dir_contents = \
-                self.list_dir_contents(self.management_server,
-                                       test_constants.VM_IMAGE_MS_DIR)
-            self.wget_image_to_node(self.management_server,
-                                    self.primary_node,
-                                    ms_dir_contents[0], '/tmp',
-                                    self.temp_image_name)
+        # STAGE THE IMG IN THE TMP DIR ON THE NODE FROM THE IMAGE CACHE
+        ms_dir_contents = self.get_ms_image_names(self.management_server)
+        self.stage_image(self.management_server, self.primary_node,
+                         ms_dir_contents[0], self.temp_image_name)
 
         #Executes cli to find the SFS service,virtual server and sfs pool
         self.pool_url = self.find(self.management_server,
@@ -98,188 +107,65 @@ class Story9693(GenericTest):
         """
         super(Story9693, self).tearDown()
 
+    @timed_step
     def wait_for_vm_start(self, vm_service_name, node,
                           vm_hostname='vm-service-host.localdomain'):
         """
         wait for virtual machine to completely start.
-        Check by connecting to the virtual machine using virsh console.
+        Check by streaming the virtual machine's serial console until the
+        login banner appears.
         """
         expected_stdout = '{0} login:'.format(vm_hostname)
-        self.wait_for_cmd(node,
-                          "virsh console {0}".format(vm_service_name),
-                          -1,
-                          expected_stdout=expected_stdout,
-                          su_root=True)
-
-    def get_bridge_urls(self):
-        """
-        return a list of Bridge URLs from the managed node
-        """
-        node_url = \
-            self.get_node_url_from_filename(self.management_server,
-                                            self.primary_node)
-
-        bridge_urls = self.find(self.management_server,
-                                node_url, "bridge")
-        return bridge_urls
+        self.wait_for_vm_boot(node, vm_service_name, expected_stdout)
 
-    def get_bridge_details(self, bridge_urls):
-        """
-        return dictionary of bridged interfaces defined in the model
-        on the node and their IP address
+    def queue_image_to_node(self, image_name, app_data_dir):
         """
-        self.assertNotEqual([], bridge_urls)
-        bridges = {}
-        for bridge_url in bridge_urls:
-            bridge_name = \
-                self.get_props_from_url(self.management_server, bridge_url,
-                                        "device_name")
-            net_name = \
-                self.get_props_from_url(self.management_server, bridge_url,
-                                        "network_name")
-            free_ipaddress = \
-                self.get_free_ip_by_net_name(self.management_server, net_name)
-            bridges[bridge_name] = free_ipaddress
-        return bridges
-
-    def prepare_metadata_content(self, bridge_urls, check_ipaddress):
+        Queue the commands which provision the image in the correct
+        location on the node, and create the instance directory and the
+        test application subdirectory, for the next flush_node_cmds
         """
-        prepare content of metadata file
-        """
-        network_name = \
-            self.get_props_from_url(self.management_server, bridge_urls[0],
-                                    "network_name")
-        bridge_name = \
-            self.get_props_from_url(self.management_server, bridge_urls[0],
-                                    "device_name")
-        ifconfig_cmd = \
-            self.net_utils.get_ifconfig_cmd(bridge_name)
-        stdout, _, _ = \
-            self.run_command(self.primary_node,
-                             ifconfig_cmd, su_root=True)
-        split_address = check_ipaddress.split('.')
-        broadcast = \
-            "{0}.{1}.{2}.255".format(split_address[0], split_address[1],
-                                     split_address[2])
-        gateway = \
-            "{0}.{1}.{2}.1".format(split_address[0], split_address[1],
-                                   split_address[2])
-        ifconfig_dict = self.net_utils.get_ifcfg_dict(stdout, bridge_name)
-        netmask = ifconfig_dict['MASK']
-        meta_data_content = \
-            ["instance-id: service_name",
-             "local-hostname: vm-service-host",
-             "network-interfaces: \"iface eth0 inet static",
-             "",
-             "address {0}".format(check_ipaddress),
-             "",
-             "network {0}".format(network_name),
-             "",
-             "netmask {0}".format(netmask),
-             "",
-             "broadcast {0}".format(broadcast),
-             "",
-             "gateway {0}".format(gateway),
-             "",
-             "\""]
-        return meta_data_content
-
+        self.queue_node_cmd(self.primary_node, 'mkdir',
+                            '/bin/mkdir -p {0} {1} {2}'.format(
+                                self.images_dir, self.instances_data_dir,
+                                app_data_dir))
+        self.queue_node_cmd(self.primary_node, 'provision',
+                            self.get_provision_image_cmd(self.primary_node,
+                                                         image_name))
+
+    @timed_step
     def copy_image_to_node(self, image_name, app_data_dir):
         """
-        Copy the image to the correct location on the node
+        Provision the image in the correct location on the node
 
         Create the instance directory and the test application
         subdirectory
         """
-        dir_contents = \
-            self.list_dir_contents(self.primary_node, self.libvirt_dir)
-        image_dir_name = self.images_dir.split('/')[-1]
-        if image_dir_name not in dir_contents:
-            self.create_dir_on_node(self.primary_node,
-                                    self.images_dir,
-                                    su_root=True)
-        self.cp_file_on_node(self.primary_node,
-                             '/tmp/{0}'.format(image_name),
-                             test_constants.LIBVIRT_IMAGE_DIR +
-                             '/{0}'.format(image_name),
-                             su_root=True)
-
-        instances_dir_name = self.instances_data_dir.split('/')[-1]
-        if instances_dir_name not in dir_contents:
-            self.create_dir_on_node(self.primary_node,
-                                    self.instances_data_dir,
-                                    su_root=True)
-        self.create_dir_on_node(self.primary_node,
-                                app_data_dir,
-                                su_root=True)
-
-    def chk_dependencies_installed(self):
-        """
-        CHECK WHETHER LIBVIRT IS INSTALLED - IF NOT THEN
-        INSTALL LIBVIRT ON THE NODE AND START THE SERVICE
-        """
-        installed_libvirt = False
-        adaptor_installed = False
-        # checking the status of libvirtd returns 1 if the service is
-        # unrecognised and 3 if the service is stopped
-        virsh_cmd = self.rhc.get_systemctl_status_cmd('libvirtd')
-        _, _, return_code = \
-            self.run_command(self.primary_node, virsh_cmd, su_root=True)
-        if return_code != 0:
-            libvirt_install_cmd = \
-                self.rhc.get_yum_install_cmd(["libvirt"])
-            _, _, return_code = \
-                self.run_command(self.primary_node, libvirt_install_cmd,
-                                 su_root=True)
-
-            self.assertEqual(0, return_code)
-            installed_libvirt = True
-
-            start_libvirt_cmd = self.rhc.get_systemctl_start_cmd('libvirtd')
-            _, _, return_code = \
-                self.run_command(self.primary_node,
-                                 start_libvirt_cmd, su_root=True)
-            self.assertEqual(0, return_code)
+        # THE IMAGE, INSTANCE AND APPLICATION DIRS ARE CREATED AND THE
+        # IMAGE PROVISIONED IN A SINGLE ROUND TRIP
+        self.queue_image_to_node(image_name, app_data_dir)
+        self.assert_cmd_results_ok(self.flush_node_cmds(self.primary_node))
 
-        installed_cmd = self.rhc.check_pkg_installed(
-            [test_constants.LIBVIRT_ADAPTOR_PKG_NAME])
-        _, _, return_code = \
-            self.run_command(self.primary_node, installed_cmd, su_root=True)
-        if return_code != 0:
-            adaptor_installed = True
-            self.install_rpm_on_node(self.primary_node,
-                                     test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
-
-        return installed_libvirt, adaptor_installed
-
-    def cleanup_after_test(self, vm_service_name,
-                           installed_libvirt, adaptor_installed):
+    @timed_step
+    def cleanup_after_test(self, vm_service_name):
         """
         Remove images
         undefine service in virsh
-        Uninstall libvirt and the adaptor if they were installed by
-        these test cases
         """
-        self.remove_item(self.primary_node, self.images_dir +
-                         '/{0}'.format(self.temp_image_name),
-                         su_root=True)
-        self.remove_item(self.primary_node,
-                         '/tmp/{0}'.format(self.temp_image_name),
-                         su_root=True)
-        vm_destroy_cmd = \
-            self.libvirt.get_virsh_destroy_cmd(vm_service_name)
-        self.run_command(self.primary_node, vm_destroy_cmd, su_root=True)
-
-        vm_undefine_cmd = \
-            self.libvirt.get_virsh_undefine_cmd(vm_service_name)
-        self.run_command(self.primary_node, vm_undefine_cmd, su_root=True)
-
-        if installed_libvirt:
-            cmd = self.rhc.get_yum_remove_cmd(["libvirt"])
-            self.run_command(self.primary_node, cmd, su_root=True)
-        if adaptor_installed:
-            self.remove_rpm_on_node(self.primary_node,
-                                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
+        # EVERY CLEANUP STEP IS RUN IN A SINGLE ROUND TRIP, THE STAGED
+        # IMAGE IS REMOVED WHEN THE TEST ENDS
+        cleanup_cmds = [
+            ('destroy',
+             self.libvirt.get_virsh_destroy_cmd(vm_service_name)),
+            ('undefine',
+             self.libvirt.get_virsh_undefine_cmd(vm_service_name))]
+        drop_cmd = self.get_drop_provisioned_images_cmd(self.primary_node)
+        if drop_cmd:
+            cleanup_cmds.insert(0, ('remove provisioned images', drop_cmd))
+        results = self.run_cmd_batch(self.primary_node, cleanup_cmds)
+        # THE VM MAY NOT HAVE BEEN DEFINED, SO ONLY THE REMOVALS ARE
+        # EXPECTED TO SUCCEED
+        self.assert_cmd_results_ok([result for result in results
+                                    if result.name.startswith('remove')])
 
     def generate_ip_address(self, config):
         """
@@ -361,19 +247,19 @@ class Story9693(GenericTest):
             self.management_server)
         self.assertTrue(mgmt_network_name)
 
-        mgmt_network_bridge_urls = self.find(
+        mgmt_network_bridge_urls = self.find_cached(
             self.management_server,
-            self.primary_node_url,
+            self.primary_node_url + "/network_interfaces",
             "bridge")
         for bridge in mgmt_network_bridge_urls:
-            if self.get_props_from_url(self.management_server,
-                                       bridge,
-                                       'network_name') == mgmt_network_name:
-                mgmt_network_device_name = self.get_props_from_url(
+            if self.get_cached_props(self.management_server,
+                                     bridge,
+                                     'network_name') == mgmt_network_name:
+                mgmt_network_device_name = self.get_cached_props(
                     self.management_server,
                     bridge,
                     'device_name')
-                mgmt_network_ip_addr = self.get_props_from_url(
+                mgmt_network_ip_addr = self.get_cached_props(
                     self.management_server,
                     bridge,
                     'ipaddress')
@@ -412,19 +298,19 @@ class Story9693(GenericTest):
             self.management_server)
         self.assertTrue(dhcp_network_name)
 
-        dhcp_network_bridge_urls = self.find(
+        dhcp_network_bridge_urls = self.find_cached(
             self.management_server,
-            self.primary_node_url,
+            self.primary_node_url + "/network_interfaces",
             "bridge")
         for bridge in dhcp_network_bridge_urls:
-            if self.get_props_from_url(self.management_server,
-                                       bridge,
-                                       'network_name') == dhcp_network_name:
-                dhcp_network_device_name = self.get_props_from_url(
+            if self.get_cached_props(self.management_server,
+                                     bridge,
+                                     'network_name') == dhcp_network_name:
+                dhcp_network_device_name = self.get_cached_props(
                     self.management_server,
                     bridge,
                     'device_name')
-                dhcp_network_ip_addr = self.get_props_from_url(
+                dhcp_network_ip_addr = self.get_cached_props(
                     self.management_server,
                     bridge,
                     'ipaddress')
@@ -449,10 +335,11 @@ class Story9693(GenericTest):
             dhcp network name or None if not found.
         """
         # GET NETWORKS
-        networks = self.find(ms_node, "/infrastructure", "network")
+        networks = self.find_cached(ms_node, "/infrastructure/networking",
+                                    "network")
 
         for network_url in networks:
-            props = self.get_props_from_url(ms_node, network_url)
+            props = self.get_cached_props(ms_node, network_url)
             if 'dhcp' in props["name"]:
                 return props["name"]
 
@@ -485,6 +372,7 @@ class Story9693(GenericTest):
         return [node_vnames[node_num - 1]
                 for node_num in conf['nodes_per_cs'][service]]
 
+    @timed_step
     def generate_execute_cs_cli(self, conf, vcs_cluster_url, cs_name):
         """
         This function will generate and execute the CLI to create the
@@ -521,51 +409,50 @@ class Story9693(GenericTest):
         node_vnames = [url.split('/')[-1] for url in node_urls]
         node_vnames_ordered = self.order_nodes(node_vnames, conf, cs_name)
 
+        # Queue every item and apply them to the model in one go
+        model_batch = LitpModelBatch()
+
         # Create clustered-service in the model
         cs_options = cli_data['cs']['options'] + \
                      " node_list='{0}'".format(",".join(node_vnames_ordered))
-        self.execute_cli_create_cmd(self.management_server,
-                                    cli_data['cs']['url'],
-                                    cli_data['cs']['class_type'],
-                                    cs_options)
+        model_batch.create(cli_data['cs']['url'],
+                           cli_data['cs']['class_type'],
+                           cs_options)
 
         # Create lsb apps in the model
-        self.execute_cli_create_cmd(self.management_server,
-                                    cli_data['apps']['url'],
-                                    cli_data['apps']['class_type'],
-                                    cli_data['apps']['options'])
+        model_batch.create(cli_data['apps']['url'],
+                           cli_data['apps']['class_type'],
+                           cli_data['apps']['options'])
 
         # Create all IPs associated with the lsb-app
         for ip_data in cli_data['ips']:
-            self.execute_cli_create_cmd(self.management_server,
-                                        ip_data['url'],
-                                        ip_data['class_type'],
-                                        ip_data['options'])
+            model_batch.create(ip_data['url'],
+                               ip_data['class_type'],
+                               ip_data['options'])
 
         # Create all packages associated with lsb-app
         for pkg_data in cli_data['pkgs']:
-            self.execute_cli_create_cmd(self.management_server,
-                                        pkg_data['url'],
-                                        pkg_data['class_type'],
-                                        pkg_data['options'])
+            model_batch.create(pkg_data['url'],
+                               pkg_data['class_type'],
+                               pkg_data['options'])
 
         # Create the HA service config item
         if 'ha_service_config' in cli_data.keys():
-            self.execute_cli_create_cmd(self.management_server,
-                                cli_data['ha_service_config']['url'],
-                                cli_data['ha_service_config']['class_type'],
-                                cli_data['ha_service_config']['options'])
+            model_batch.create(cli_data['ha_service_config']['url'],
+                               cli_data['ha_service_config']['class_type'],
+                               cli_data['ha_service_config']['options'])
 
         # Create pkgs under the lsb-app
         for pkg_link_data in cli_data['pkg_links']:
-            self.execute_cli_inherit_cmd(self.management_server,
-                                         pkg_link_data['child_url'],
-                                         pkg_link_data['parent_url'])
+            model_batch.inherit(pkg_link_data['child_url'],
+                                pkg_link_data['parent_url'])
+
+        model_batch.inherit(cli_data['apps']['app_url_in_cluster'],
+                            cli_data['apps']['url'])
 
-        self.execute_cli_inherit_cmd(self.management_server,
-                                     cli_data['apps']['app_url_in_cluster'],
-                                     cli_data['apps']['url'])
+        self.apply_model_batch(self.management_server, model_batch)
 
+    @timed_step
     def generate_execute_vm_cli(self, conf, vcs_cluster_url, cs_name,
                                 ipaddresses):
         """
@@ -604,47 +491,47 @@ class Story9693(GenericTest):
             self.sfs_ip,
             replace_map=replace_map)
 
+        # Queue every item and apply them to the model in one go
+        model_batch = LitpModelBatch()
+
         for host in cli_data['vm_hosts']:
             # Create VM hosts in the model
-            self.execute_cli_create_cmd(self.management_server,
-                                        host['url'],
-                                        host['class_type'],
-                                        host['options'])
+            model_batch.create(host['url'],
+                               host['class_type'],
+                               host['options'])
 
         for interface in cli_data['vm_interfaces']:
             # Create VM interfaces in the model
-            self.execute_cli_create_cmd(self.management_server,
-                                        interface['url'],
-                                        interface['class_type'],
-                                        interface['options'])
+            model_batch.create(interface['url'],
+                               interface['class_type'],
+                               interface['options'])
 
         for interface in cli_data['vm_interfaces_ips']:
             # Update inherited VM interfaces in the model
-            self.execute_cli_update_cmd(self.management_server,
-                                        interface['url'],
-                                        interface['options'])
+            model_batch.update(interface['url'],
+                               interface['options'])
 
         for repo in cli_data['vm_repos']:
             # Create VM repos in the model
-            self.execute_cli_create_cmd(self.management_server,
-                                        repo['url'],
-                                        repo['class_type'],
-                                        repo['options'])
+            model_batch.create(repo['url'],
+                               repo['class_type'],
+                               repo['options'])
 
         for mount in cli_data['vm_nfs_mounts']:
             # Create VM NFS Mounts in the model
-            self.execute_cli_create_cmd(self.management_server,
-                                        mount['url'],
-                                        mount['class_type'],
-                                        mount['options'])
+            model_batch.create(mount['url'],
+                               mount['class_type'],
+                               mount['options'])
 
         for key in cli_data['vm_ssh_keys']:
             # Create VM SSH Keys in the model
-            self.execute_cli_create_cmd(self.management_server,
-                                        key['url'],
-                                        key['class_type'],
-                                        key['options'])
+            model_batch.create(key['url'],
+                               key['class_type'],
+                               key['options'])
+
+        self.apply_model_batch(self.management_server, model_batch)
 
+    @timed_step
     def generate_execute_vm_cli_vmimage(self, conf, vm_image):
         """
         This function will generate and execute the CLI for VM image
@@ -669,6 +556,7 @@ class Story9693(GenericTest):
                                     cli_data['vm_images']['class_type'],
                                     cli_data['vm_images']['options'])
 
+    @timed_step
     def generate_execute_create_sfs_mount(self, mount_indexes):
         """
         This function executes cli to create shares on the SFS
@@ -747,6 +635,7 @@ class Story9693(GenericTest):
         """
         self.generate_execute_create_sfs_mount(range(1, 6))
 
+    @timed_step
     def create_cs_vm2(self):
         """
         Description:
@@ -835,68 +724,31 @@ class Story9693(GenericTest):
             The vm is deployed successfully and successfully cycles
             through the commands issued against it.
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp9693_0"
+        vm_service_name = self.get_test_name("testapp9693_0")
         this_app_data_dir = self.instances_data_dir + \
                             '/{0}/'.format(vm_service_name)
         try:
-            # CHECK WHETHER LIBVIRT IS INSTALLED - IF NOT THEN
-            # INSTALL LIBVIRT ON THE NODE AND START THE SERVICE
-            installed_libvirt = \
-                self.check_pkgs_installed(self.primary_node,
-                                          ["libvirt-0.10.2-18.el6.x86_64"])
-
-            if not installed_libvirt:
-                self.install_rpm_on_node(self.primary_node, ['libvirt'])
-                installed_libvirt = True
-
-            self.start_service(self.primary_node, 'libvirtd')
-
+            # CHECK WHETHER LIBVIRT AND THE ADAPTOR ARE INSTALLED - IF NOT
+            # THEN INSTALL THEM ON THE NODE AND START THE SERVICE
             # STEP 1
-            adaptor_installed = \
-                self.check_pkgs_installed(
-                    self.primary_node,
-                    [test_constants.LIBVIRT_ADAPTOR_PKG_NAME])
-            if not adaptor_installed:
-                self.install_rpm_on_node(
-                    self.primary_node,
-                    [test_constants.LIBVIRT_ADAPTOR_PKG_NAME])
-                adaptor_installed = True
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
-            dir_contents = \
-                self.list_dir_contents(self.primary_node, self.libvirt_dir)
-            image_dir_name = self.images_dir.split('/')[-1]
-            if image_dir_name not in dir_contents:
-                self.create_dir_on_node(self.primary_node,
-                                        self.images_dir,
-                                        su_root=True)
-
-            self.cp_file_on_node(
-                self.primary_node,
-                '/tmp/{0}'.format(self.temp_image_name),
-                test_constants.LIBVIRT_IMAGE_DIR + \
-                '/{0}'.format(self.temp_image_name),
-                su_root=True)
-
-            # CREATE THE INSTANCE DIRECTORY AND THE TEST APPLICATION
-            # SUBDIRECTORY
-            instances_dir_name = self.instances_data_dir.split('/')[-1]
-            if instances_dir_name not in dir_contents:
-                self.create_dir_on_node(self.primary_node,
-                                        self.instances_data_dir,
-                                        su_root=True)
-
-            self.create_dir_on_node(self.primary_node,
-                                    this_app_data_dir, su_root=True)
+            # CREATE THE IMAGE, INSTANCE AND TEST APPLICATION DIRECTORIES
+            # AND PROVISION THE IMAGE
+            self.queue_image_to_node(self.temp_image_name,
+                                     this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
-            self.create_file_on_node(self.primary_node,
-                                     this_app_data_dir + '/config.json',
-                                     config_file_dump.split('\n'),
-                                     su_root=True)
+            # STEPS 2 AND 3 ARE RUN IN A SINGLE ROUND TRIP
+            config_file_dump = self.set_vm_config_image(
+                self.libvirt.compile_vm_config_file(), self.temp_image_name)
+            self.queue_node_cmd(self.primary_node, 'config',
+                                self.remote_cmds.get_write_file_cmd(
+                                    this_app_data_dir + 'config.json',
+                                    config_file_dump.split('\n')))
+            self.assert_cmd_results_ok(
+                self.flush_node_cmds(self.primary_node))
 
             self.create_instance_data_files_in_instance_dir(self.primary_node,
                                                             vm_service_name)
@@ -915,19 +767,10 @@ class Story9693(GenericTest):
             self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
                                          'stop-undefine --stop-timeout=33')
         finally:
-            self.remove_item(
-                self.primary_node,
-                self.images_dir + '/{0}'.format(self.temp_image_name),
-                su_root=True)
+            self.drop_provisioned_images(self.primary_node)
             vm_undefine_cmd = \
                 self.libvirt.get_virsh_undefine_cmd(vm_service_name)
             self.run_command(self.primary_node, vm_undefine_cmd, su_root=True)
-            if installed_libvirt:
-                self.remove_rpm_on_node(self.primary_node, ["libvirt"])
-            if adaptor_installed:
-                self.remove_rpm_on_node(
-                    self.primary_node,
-                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
 
     @attr('all', 'revert')
     def test_04_p_stop_undefine_no_timeout(self):
@@ -953,69 +796,32 @@ class Story9693(GenericTest):
             The vm's are deployed successfully and successfully cycles
             through the commands issued against them.
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp9693_1"
+        vm_service_name = self.get_test_name("testapp9693_1")
         this_app_data_dir = self.instances_data_dir + \
                             '/{0}/'.format(vm_service_name)
 
         try:
-            # CHECK WHETHER LIBVIRT IS INSTALLED - IF NOT THEN
-            # INSTALL LIBVIRT ON THE NODE AND START THE SERVICE
-            installed_libvirt = \
-                self.check_pkgs_installed(self.primary_node,
-                                          ["libvirt-0.10.2-18.el6.x86_64"])
-
-            if not installed_libvirt:
-                self.install_rpm_on_node(self.primary_node, ['libvirt'])
-                installed_libvirt = True
-
-            self.start_service(self.primary_node, 'libvirtd')
-
+            # CHECK WHETHER LIBVIRT AND THE ADAPTOR ARE INSTALLED - IF NOT
+            # THEN INSTALL THEM ON THE NODE AND START THE SERVICE
             # STEP 1
-            adaptor_installed = \
-                self.check_pkgs_installed(
-                    self.primary_node,
-                    [test_constants.LIBVIRT_ADAPTOR_PKG_NAME])
-            if not adaptor_installed:
-                self.install_rpm_on_node(
-                    self.primary_node,
-                    [test_constants.LIBVIRT_ADAPTOR_PKG_NAME])
-                adaptor_installed = True
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
-            dir_contents = \
-                self.list_dir_contents(self.primary_node, self.libvirt_dir)
-            image_dir_name = self.images_dir.split('/')[-1]
-            if image_dir_name not in dir_contents:
-                self.create_dir_on_node(self.primary_node,
-                                        self.images_dir,
-                                        su_root=True)
-
-            self.cp_file_on_node(
-                self.primary_node,
-                '/tmp/{0}'.format(self.temp_image_name),
-                test_constants.LIBVIRT_IMAGE_DIR + \
-                '/{0}'.format(self.temp_image_name),
-                su_root=True)
-
-            # CREATE THE INSTANCE DIRECTORY AND THE TEST APPLICATION
-            # SUBDIRECTORY
-            instances_dir_name = self.instances_data_dir.split('/')[-1]
-            if instances_dir_name not in dir_contents:
-                self.create_dir_on_node(self.primary_node,
-                                        self.instances_data_dir,
-                                        su_root=True)
-
-            self.create_dir_on_node(self.primary_node,
-                                    this_app_data_dir, su_root=True)
+            # CREATE THE IMAGE, INSTANCE AND TEST APPLICATION DIRECTORIES
+            # AND PROVISION THE IMAGE
+            self.queue_image_to_node(self.temp_image_name,
+                                     this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
-            self.create_file_on_node(self.primary_node,
-                                     this_app_data_dir + '/config.json',
-                                     config_file_dump.split('\n'),
-                                     su_root=True)
+            # STEPS 2 AND 3 ARE RUN IN A SINGLE ROUND TRIP
+            config_file_dump = self.set_vm_config_image(
+                self.libvirt.compile_vm_config_file(), self.temp_image_name)
+            self.queue_node_cmd(self.primary_node, 'config',
+                                self.remote_cmds.get_write_file_cmd(
+                                    this_app_data_dir + 'config.json',
+                                    config_file_dump.split('\n')))
+            self.assert_cmd_results_ok(
+                self.flush_node_cmds(self.primary_node))
 
             self.create_instance_data_files_in_instance_dir(self.primary_node,
                                                             vm_service_name)
@@ -1034,19 +840,10 @@ class Story9693(GenericTest):
             self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
                                          'stop-undefine')
         finally:
-            self.remove_item(
-                self.primary_node,
-                self.images_dir + '/{0}'.format(self.temp_image_name),
-                su_root=True)
+            self.drop_provisioned_images(self.primary_node)
             vm_undefine_cmd = \
                 self.libvirt.get_virsh_undefine_cmd(vm_service_name)
             self.run_command(self.primary_node, vm_undefine_cmd, su_root=True)
-            if installed_libvirt:
-                self.remove_rpm_on_node(self.primary_node, ["libvirt"])
-            if adaptor_installed:
-                self.remove_rpm_on_node(
-                    self.primary_node,
-                    test_constants.LIBVIRT_ADAPTOR_PKG_NAME)
 
     @attr('all', 'revert')
     def test_05_n_stop_undefine_stop_timeout_elapses(self):
@@ -1069,31 +866,28 @@ class Story9693(GenericTest):
              7. Issue the service <vm_name> stop-undefine
                 --stop-timeout=33 command.
              8. Check LIBVIRT LOGS to see if force-stop-undefine was
-                called.
+                called, 33 seconds after the stop-undefine started, and
+                the VM undefined promptly after.
         Results:
             VM is forcefully destroyed and undefined if stop-undefine
             timesout.
         """
-        installed_libvirt = False
-        adaptor_installed = False
-        vm_service_name = "testapp9693_0"
-        error_grep_returnc = 2
+        vm_service_name = self.get_test_name("testapp9693_0")
         this_app_data_dir = \
             self.instances_data_dir + '/{0}/'.format(vm_service_name)
 
         try:
             # STEP 1
-            installed_libvirt, adaptor_installed = \
-                self.chk_dependencies_installed()
+            self.ensure_node_dependencies(self.primary_node)
 
             # STEP 2
             self.copy_image_to_node(self.temp_image_name,
                                     this_app_data_dir)
 
             # STEP 3
-            config_file_dump = self.libvirt.compile_vm_config_file()
-
-            loaded_file = self.json_utils.load_json(config_file_dump)
+            vm_config = VMConfig.from_json(
+                self.libvirt.compile_vm_config_file())
+            vm_config.image = self.temp_image_name
 
             bridge_urls = self.get_bridge_urls()
             bridges = self.get_bridge_details(bridge_urls)
@@ -1104,22 +898,16 @@ class Story9693(GenericTest):
                 interfaces_dict["eth{0}".format(counter)] = \
                     {"host_device": bridge, "ipaddress": bridges[bridge]}
                 counter += 1
-            loaded_file["vm_data"]["interfaces"] = interfaces_dict
-            loaded_file["adaptor_data"]["status-retry"] = 600
-            loaded_file["adaptor_data"]["status-timeout"] = 600
-            loaded_file["adaptor_data"]["start-timeout"] = 600
-            loaded_file["adaptor_data"]["internal_status_check"] = {}
-            loaded_file["adaptor_data"]["internal_status_check"]["active"] = \
-                'on'
+            vm_config.interfaces = interfaces_dict
+            vm_config.set_timeouts(status_retry=600, status_timeout=600,
+                                   start_timeout=600)
             check_ipaddress = interfaces_dict['eth0']['ipaddress']
-            loaded_file["adaptor_data"]["internal_"
-                                        "status_check"]["ip_address"] = \
-                check_ipaddress
-            config_file_dump = self.json_utils.dump_json(loaded_file)
+            vm_config.set_internal_status_check(STATUS_CHECK_ON,
+                                                check_ipaddress)
 
             self.create_file_on_node(self.primary_node, this_app_data_dir +
                                      '/config.json',
-                                     config_file_dump.split('\n'),
+                                     vm_config.to_lines(),
                                      su_root=True)
 
             meta_data_content = self.prepare_metadata_content(bridge_urls,
@@ -1150,24 +938,15 @@ class Story9693(GenericTest):
             self.assertEqual([], stderr)
 
             # STEP 7
-            self.run_libvirt_service_cmd(self.primary_node, vm_service_name,
-                                         'stop-undefine --stop-timeout=33')
-
-            # STEP 8 CHECK force-stop-undefine was called
-            grep_cmd = \
-                self.rhc.get_grep_file_cmd(test_constants.LITP_LIBVIRT_LOG,
-                                           "calling force-stop")
-
-            stdout, stderr, returnc = self.run_command(self.primary_node,
-                                                       grep_cmd)
+            timeline = self.run_timed_stop_undefine(
+                self.primary_node, vm_service_name,
+                'stop-undefine --stop-timeout=33')
 
-            self.assertNotEqual(error_grep_returnc, returnc)
-            self.assertEqual([], stderr)
-            self.assertNotEqual([], stdout)
+            # STEP 8 CHECK force-stop-undefine was called, once the stop
+            # timeout had elapsed
+            self.assert_stop_undefine_timeline(timeline, force_destroyed=True)
         finally:
-            self.cleanup_after_test(vm_service_name,
-                                    installed_libvirt,
-                                    adaptor_installed)
+            self.cleanup_after_test(vm_service_name)
 
     @attr('all', 'revert')
     def test_06_n_cleanup_command_without_stop_undefine(self):
@@ -1217,12 +996,16 @@ class Story9693(GenericTest):
         # CREATE AND EXECUTE PLAN AND EXPECT IT TO SUCCEED
         self.execute_cli_createplan_cmd(self.management_server)
         self.execute_cli_runplan_cmd(self.management_server)
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self.wait_for_plan_complete(
             self.management_server,
-            test_constants.PLAN_COMPLETE,
             plan_timeout_mins
         ))
 
+        # FOLLOW THE VCS ENGINE AND LIBVIRT ADAPTOR LOGS FROM HERE ON
+        log_follower = self.start_log_follower(
+            secondary_node, [test_constants.VCS_ENG_A_LOG_FILE,
+                             test_constants.LITP_LIBVIRT_LOG])
+
         # RUN STOP COMMAND AGAINST test-vm-service-1. EXPECTING VCS TO CALL
         # CLEANUP COMMAND AS THE RESOURCE BECOME OFFLINE ON ITS OWN
         stop_cmd = self.rhc.get_systemctl_stop_cmd(vm_service_name)
@@ -1232,25 +1015,19 @@ class Story9693(GenericTest):
 
         # CUSTOM CLEANUP SCRIPT IS RUNNING AN INFINITE LOOP.
         # CHECK CLEANUP COMMAND TIMESOUT
-        self.wait_for_log_msg(secondary_node,
-                              'resource became OFFLINE unexpectedly,' + \
-                              ' on its own.',
-                              test_constants.VCS_ENG_A_LOG_FILE, 600)
+        self.wait_for_log_patterns(log_follower,
+                                   ['resource became OFFLINE unexpectedly,'
+                                    ' on its own.'], 600)
 
-        self.wait_for_log_msg(secondary_node,
-                              'clean procedure did not complete within ' + \
-                              'the expected time.',
-                              test_constants.VCS_ENG_A_LOG_FILE, 600)
+        self.wait_for_log_patterns(log_follower,
+                                   ['clean procedure did not complete '
+                                    'within the expected time.'], 600)
 
         # CHECK VCS IS NOT CALLING DESTROY SERVICE
-        grep_cmd = \
-            self.rhc.get_grep_file_cmd(test_constants.LITP_LIBVIRT_LOG,
+        self.assert_log_pattern_absent(log_follower,
+                                       test_constants.LITP_LIBVIRT_LOG,
                                        'Attempting to destroy Service',
-                                       file_access_cmd='tail -n 3')
-        stdout, stderr, returnc = self.run_command(secondary_node, grep_cmd)
-        self.assertEqual(1, returnc)
-        self.assertEqual([], stderr)
-        self.assertEqual([], stdout)
+                                       last_lines=3)
 
         self.log("info", "Update VCS Clustered Service clean command "
                          "directly on the node via VCS commands")
@@ -1286,9 +1063,8 @@ class Story9693(GenericTest):
         # CREATE AND EXECUTE PLAN AND EXPECT IT TO SUCCEED
         self.execute_cli_createplan_cmd(self.management_server)
         self.execute_cli_runplan_cmd(self.management_server)
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self.wait_for_plan_complete(
             self.management_server,
-            test_constants.PLAN_COMPLETE,
             plan_timeout_mins
         ))
 
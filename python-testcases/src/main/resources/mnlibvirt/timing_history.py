@@ -0,0 +1,295 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   SQLite history of test step times per adaptor version,
+            used to flag slowdowns in a new adaptor drop, and the
+            helpers timing the tests into it.
+"""
+
+import os
+import sqlite3
+import time
+import uuid
+
+from step_timer import StepTimer
+
+# Most recent runs of other adaptor versions a step is compared against
+BASELINE_RUNS = 20
+
+# Fewest baseline runs a step needs before it can be flagged
+MIN_BASELINE_RUNS = 5
+
+# Robust z-score above which a step is flagged as slower
+Z_THRESHOLD = 3.5
+
+# Fraction of the baseline median a step must also be slower by, so
+# that steps with a very stable baseline are not flagged for noise
+MIN_SLOWDOWN = 0.2
+
+# Shortest step time, in seconds, worth flagging
+MIN_SECONDS = 0.5
+
+# Identifies this run in the timing history and the benchmark reports,
+# shared by every test set in the process
+RUN_ID = os.environ.get('MNLIBVIRT_RUN_ID') or uuid.uuid4().hex
+
+SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS runs ('
+    'run_id TEXT PRIMARY KEY, adaptor_version TEXT, suite TEXT, '
+    'started REAL)',
+    'CREATE TABLE IF NOT EXISTS step_times ('
+    'run_id TEXT, test TEXT, step TEXT, calls INTEGER, seconds REAL)',
+    'CREATE INDEX IF NOT EXISTS step_times_key ON step_times '
+    '(test, step)']
+
+
+class TimingHistory(object):
+    """
+    The step times of past runs, one row per test, step and run.
+
+    A step's time in a run is its mean time per call, so that runs
+    calling a step a different number of times compare.
+    """
+
+    def __init__(self, db_path):
+        """
+        Args:
+            db_path (str): The SQLite database, created if missing.
+        """
+        self.db_path = db_path
+        # test processes running in parallel share the database
+        self.conn = sqlite3.connect(db_path, timeout=60)
+        for statement in SCHEMA:
+            self.conn.execute(statement)
+        self.conn.commit()
+
+    def close(self):
+        """
+        Close the database.
+        """
+        self.conn.close()
+
+    def record(self, run_id, adaptor_version, suite, test, steps):
+        """
+        Add the step times of a test to the history.
+
+        Args:
+            run_id (str): Identifies the run, shared by its tests.
+
+            adaptor_version (str): The adaptor version tested.
+
+            suite (str): The suite run, e.g. KGB or CDB.
+
+            test (str): The name of the test.
+
+            steps (list): (step, calls, seconds) tuples, seconds being
+                          the total over every call.
+        """
+        self.conn.execute(
+            'INSERT OR IGNORE INTO runs VALUES (?, ?, ?, ?)',
+            (run_id, adaptor_version, suite, time.time()))
+        self.conn.executemany(
+            'INSERT INTO step_times VALUES (?, ?, ?, ?, ?)',
+            [(run_id, test, step, calls, seconds)
+             for step, calls, seconds in steps if calls])
+        self.conn.commit()
+
+    def get_baseline(self, run_id, test, step):
+        """
+        Function to return the times of a step in the most recent runs
+        of other adaptor versions than the one of a run.
+
+        Args:
+            run_id (str): The run compared.
+
+            test (str): The name of the test.
+
+            step (str): The step.
+
+        Return:
+            list. The mean seconds per call of the step, most recent
+            run first.
+        """
+        rows = self.conn.execute(
+            'SELECT SUM(s.seconds) / SUM(s.calls) FROM step_times s '
+            'JOIN runs r ON r.run_id = s.run_id '
+            'WHERE s.test = ? AND s.step = ? AND r.adaptor_version != '
+            '(SELECT adaptor_version FROM runs WHERE run_id = ?) '
+            'GROUP BY s.run_id ORDER BY MAX(r.started) DESC LIMIT ?',
+            (test, step, run_id, BASELINE_RUNS)).fetchall()
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def get_median(values):
+        """
+        Function to return the median of values.
+
+        Args:
+            values (list): The values, not empty.
+
+        Return:
+            float. The median.
+        """
+        ordered = sorted(values)
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return float(ordered[middle])
+        return (ordered[middle - 1] + ordered[middle]) / 2.0
+
+    def find_regressions(self, run_id, test):
+        """
+        Function to return the steps of a test which were significantly
+        slower in a run than with earlier adaptor versions.
+
+        A step is slower if its robust z-score against the baseline,
+        from the median and the median absolute deviation, is above
+        Z_THRESHOLD, and it is also MIN_SLOWDOWN slower than the median
+        and takes at least MIN_SECONDS.
+
+        Args:
+            run_id (str): The run.
+
+            test (str): The name of the test.
+
+        Return:
+            list. A dict per slower step, with the step, its seconds
+            per call, the baseline median, the number of baseline runs
+            and the z-score, None if the baseline does not vary.
+        """
+        rows = self.conn.execute(
+            'SELECT step, SUM(seconds) / SUM(calls) FROM step_times '
+            'WHERE run_id = ? AND test = ? GROUP BY step ORDER BY step',
+            (run_id, test)).fetchall()
+        regressions = []
+        for step, seconds in rows:
+            baseline = self.get_baseline(run_id, test, step)
+            if len(baseline) < MIN_BASELINE_RUNS or seconds < MIN_SECONDS:
+                continue
+            median = self.get_median(baseline)
+            if seconds < median * (1 + MIN_SLOWDOWN):
+                continue
+            deviation = self.get_median([abs(value - median)
+                                         for value in baseline])
+            z_score = None
+            if deviation > 0:
+                z_score = (seconds - median) / (1.4826 * deviation)
+                if z_score < Z_THRESHOLD:
+                    continue
+            regressions.append({'step': step, 'seconds': seconds,
+                                'baseline_median': median,
+                                'baseline_runs': len(baseline),
+                                'z_score': z_score})
+        return regressions
+
+
+class StepTimesMixin(object):
+    """
+    Test helpers timing each test by its steps, see step_timer, and
+    adding the step times to the timing history.
+    """
+
+    # Times the helpers run by the current test, see step_timer
+    step_timer = None
+
+    # SQLite database the step times of every test are added to. No
+    # history is kept if unset.
+    timing_history_path = os.environ.get('MNLIBVIRT_TIMING_HISTORY')
+
+    # The suite the run belongs to in the timing history, e.g. KGB
+    timing_history_suite = os.environ.get('MNLIBVIRT_RUN_SUITE', '')
+
+    # Name of the adaptor package, whose version the times are kept for
+    adaptor_pkg_name = None
+
+    # Adaptor version installed on each node, keyed by node. Shared by
+    # every test set in the process.
+    adaptor_versions = {}
+
+    def setUp(self):
+        """
+        Description:
+            Start the test's step timer.
+        """
+        super(StepTimesMixin, self).setUp()
+        self.step_timer = StepTimer('.'.join(self.id().split('.')[-2:]))
+
+    def tearDown(self):
+        """
+        Description:
+            Log the time spent in each step of the test.
+        """
+        self.log_step_times()
+        super(StepTimesMixin, self).tearDown()
+
+    def log_step_times(self):
+        """
+        Description:
+            End the test's step timer and log the time, remote commands
+            and bytes of each step, followed by the steps as folded
+            stacks for a flame graph. With timing_history_path set, the
+            step times are added to the timing history and the steps
+            slower than with earlier adaptor versions are logged.
+        """
+        if self.step_timer is None:
+            return
+        adaptor_version = self._get_adaptor_version() \
+            if self.timing_history_path else None
+        self.step_timer.stop()
+        for line in self.step_timer.format_summary():
+            self.log("info", line)
+        for line in self.step_timer.get_folded_lines():
+            self.log("info", 'FOLDED {0}'.format(line))
+        if self.timing_history_path:
+            self.record_step_times(adaptor_version)
+        self.step_timer = None
+
+    def _get_adaptor_version(self):
+        """
+        Return the adaptor version on the test's node, or on the first
+        managed node, asking each node only once per run.
+        """
+        node = getattr(self, 'primary_node', None) or \
+            self.get_managed_node_filenames()[0]
+        if node not in self.adaptor_versions:
+            self.adaptor_versions[node] = self.get_pkg_version(
+                node, self.adaptor_pkg_name)
+        return self.adaptor_versions[node]
+
+    def record_step_times(self, adaptor_version):
+        """
+        Description:
+            Add the step times of the test to the timing history, and
+            log the steps which were significantly slower than with
+            earlier adaptor versions.
+
+        Args:
+            adaptor_version (str): The adaptor version tested, None if
+                                   it is not installed.
+
+        Returns:
+            list. The slower steps, see
+            TimingHistory.find_regressions.
+        """
+        test_name = self.step_timer.stack[0]
+        history = TimingHistory(self.timing_history_path)
+        try:
+            history.record(RUN_ID, adaptor_version or 'none',
+                           self.timing_history_suite, test_name,
+                           self.step_timer.get_step_totals())
+            regressions = history.find_regressions(RUN_ID, test_name)
+        finally:
+            history.close()
+        for regression in regressions:
+            self.log("info", 'REGRESSION {0}: {1:.2f}s per call against a '
+                     'median of {2:.2f}s over {3} runs of earlier '
+                     'versions'.format(regression['step'],
+                                       regression['seconds'],
+                                       regression['baseline_median'],
+                                       regression['baseline_runs']))
+        return regressions
@@ -0,0 +1,293 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Field accessors for a vm-service's config.json, and the
+            helpers preparing its image, bridges and meta-data.
+"""
+
+import copy
+import json
+
+# Values of internal_status_check active
+STATUS_CHECK_ON = 'on'
+STATUS_CHECK_OFF = 'off'
+
+
+class VMConfig(object):
+    """
+    The vm_data and adaptor_data of a vm-service's config.json. Keys
+    without an accessor are kept as they were read.
+    """
+
+    def __init__(self, data=None):
+        """
+        Args:
+            data (dict): The parsed config.json, empty by default.
+        """
+        self.data = data if data is not None else {}
+        self.data.setdefault('vm_data', {})
+        self.data.setdefault('adaptor_data', {})
+
+    @classmethod
+    def from_json(cls, text):
+        """
+        Function to return the config held in a JSON document.
+
+        Args:
+            text (str): The document, e.g. the output of
+                        LibvirtUtils.compile_vm_config_file.
+
+        Return:
+            VMConfig. The config.
+        """
+        return cls(json.loads(text))
+
+    @classmethod
+    def from_lines(cls, lines):
+        """
+        Function to return the config held in the lines of a file, e.g.
+        config.json read from a node.
+
+        Args:
+            lines (list): The lines of the document.
+
+        Return:
+            VMConfig. The config.
+        """
+        return cls.from_json('\n'.join(lines))
+
+    def copy(self):
+        """
+        Function to return an independent copy of the config.
+
+        Return:
+            VMConfig. The copy.
+        """
+        return VMConfig(copy.deepcopy(self.data))
+
+    @property
+    def vm_data(self):
+        """
+        The vm_data of the config, as a dict.
+        """
+        return self.data['vm_data']
+
+    @property
+    def adaptor_data(self):
+        """
+        The adaptor_data of the config, as a dict.
+        """
+        return self.data['adaptor_data']
+
+    @property
+    def image(self):
+        """
+        The name of the VM's image in the libvirt image directory.
+        """
+        return self.vm_data.get('image')
+
+    @image.setter
+    def image(self, image_name):
+        self.vm_data['image'] = image_name
+
+    @property
+    def interfaces(self):
+        """
+        The VM's interfaces, keyed by device name, e.g.
+        {"eth0": {"host_device": "br0", "ipaddress": "10.10.10.2"}}.
+        """
+        return self.vm_data.get('interfaces', {})
+
+    @interfaces.setter
+    def interfaces(self, interfaces):
+        self.vm_data['interfaces'] = interfaces
+
+    @property
+    def internal_status_check(self):
+        """
+        The internal status check settings, as a dict with "active" and
+        "ip_address", empty if the config has none.
+        """
+        return self.adaptor_data.get('internal_status_check') or {}
+
+    def set_internal_status_check(self, active, ip_address=None):
+        """
+        Set the internal status check.
+
+        Args:
+            active (str): STATUS_CHECK_ON or STATUS_CHECK_OFF.
+
+            ip_address (str): The address the check is made on.
+        """
+        self.adaptor_data['internal_status_check'] = {
+            'active': active, 'ip_address': ip_address}
+
+    def set_timeouts(self, status_retry=None, status_timeout=None,
+                     start_timeout=None):
+        """
+        Set the adaptor's retry and timeouts, those given as None being
+        left as they are.
+
+        Args:
+            status_retry (int): status-retry.
+
+            status_timeout (int): status-timeout, in seconds.
+
+            start_timeout (int): start-timeout, in seconds.
+        """
+        for key, value in (('status-retry', status_retry),
+                           ('status-timeout', status_timeout),
+                           ('start-timeout', start_timeout)):
+            if value is not None:
+                self.adaptor_data[key] = value
+
+    def to_json(self):
+        """
+        Function to return the config as a JSON document.
+
+        Return:
+            str. The document.
+        """
+        return json.dumps(self.data, indent=4, sort_keys=True)
+
+    def to_lines(self):
+        """
+        Function to return the config as the lines of config.json, e.g.
+        for create_file_on_node.
+
+        Return:
+            list. The lines.
+        """
+        return self.to_json().split('\n')
+
+
+class VMConfigMixin(object):
+    """
+    Test helpers preparing the config.json, bridges and meta-data of a
+    vm-service.
+
+    The bridges are those of the test set's primary_node, read from
+    the model on its management_server.
+    """
+
+    def set_vm_config_image(self, config_file_dump, image_name):
+        """
+        Description:
+            Return a vm-service config.json with its image replaced, so
+            that the VM boots from an image named with get_test_name.
+
+        Args:
+            config_file_dump (str): The config, as from
+                                    LibvirtUtils.compile_vm_config_file.
+
+            image_name (str): The image file in the libvirt image
+                              directory.
+
+        Returns:
+            str. The updated config.
+        """
+        vm_config = VMConfig.from_json(config_file_dump)
+        vm_config.image = image_name
+        return vm_config.to_json()
+
+    def get_bridge_urls(self):
+        """
+        Description:
+            Return the bridges modelled on the test set's primary_node,
+            from the deployment on its management_server.
+
+        Returns:
+            list. The URLs of the bridges.
+        """
+        node_url = \
+            self.get_node_url_from_filename(self.management_server,
+                                            self.primary_node)
+
+        bridge_urls = self.find_cached(self.management_server,
+                                       node_url + "/network_interfaces",
+                                       "bridge")
+        return bridge_urls
+
+    def get_bridge_details(self, bridge_urls):
+        """
+        Description:
+            Return the device name of each bridge and a free IP address
+            on its network, for the interfaces of a vm-service.
+
+        Args:
+            bridge_urls (list): The URLs of the bridges.
+
+        Returns:
+            dict. A free IP address keyed by bridge device name.
+        """
+        self.assertNotEqual([], bridge_urls)
+        bridges = {}
+        for bridge_url in bridge_urls:
+            bridge_name = \
+                self.get_cached_props(self.management_server, bridge_url,
+                                      "device_name")
+            net_name = \
+                self.get_cached_props(self.management_server, bridge_url,
+                                      "network_name")
+            free_ipaddress = \
+                self.get_free_ip_by_net_name(self.management_server, net_name)
+            bridges[bridge_name] = free_ipaddress
+        return bridges
+
+    def prepare_metadata_content(self, bridge_urls, check_ipaddress):
+        """
+        Description:
+            Return the content of the meta-data file of a vm-service
+            with a static address on the network of the first bridge.
+
+        Args:
+            bridge_urls (list): The URLs of the bridges on the node.
+
+            check_ipaddress (str): The vm-service's address.
+
+        Returns:
+            list. The lines of the meta-data file.
+        """
+        network_name = \
+            self.get_cached_props(self.management_server, bridge_urls[0],
+                                  "network_name")
+        bridge_name = \
+            self.get_cached_props(self.management_server, bridge_urls[0],
+                                  "device_name")
+        ifconfig_cmd = \
+            self.net_utils.get_ifconfig_cmd(bridge_name)
+        stdout, _, _ = \
+            self.run_command(self.primary_node,
+                             ifconfig_cmd, su_root=True)
+        split_address = check_ipaddress.split('.')
+        broadcast = \
+            "{0}.{1}.{2}.255".format(split_address[0], split_address[1],
+                                     split_address[2])
+        gateway = \
+            "{0}.{1}.{2}.1".format(split_address[0], split_address[1],
+                                   split_address[2])
+        ifconfig_dict = self.net_utils.get_ifcfg_dict(stdout, bridge_name)
+        netmask = ifconfig_dict['MASK']
+        meta_data_content = \
+            ["instance-id: service_name",
+             "local-hostname: vm-service-host",
+             "network-interfaces: \"iface eth0 inet static",
+             "",
+             "address {0}".format(check_ipaddress),
+             "",
+             "network {0}".format(network_name),
+             "",
+             "netmask {0}".format(netmask),
+             "",
+             "broadcast {0}".format(broadcast),
+             "",
+             "gateway {0}".format(gateway),
+             "",
+             "\""]
+        return meta_data_content
@@ -0,0 +1,536 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     Oct 2026
+@summary:   Command builders and test helpers for staging VM images
+            on the peer nodes.
+"""
+
+import os
+
+from fake_hypervisor import FakeHypervisor
+from step_timer import timed_step
+
+# Ways of provisioning an image into the libvirt image directory
+PROVISION_COPY = 'copy'
+PROVISION_CLONE = 'clone'
+PROVISION_OVERLAY = 'overlay'
+PROVISION_HARDLINK = 'hardlink'
+
+# Name of the image cache directory, kept in the libvirt image directory
+# so images are provisioned from it within one filesystem
+IMAGE_CACHE_DIR_NAME = '.mnlibvirt_image_cache'
+
+
+class VMImageUtils(object):
+    """
+    Generates the shell commands used to stage VM test images on a
+    peer node.
+
+    Images are held in a content-addressed cache directory on the node,
+    one file per MS image name and checksum, so an image is downloaded
+    from the MS at most once no matter how many tests ask for it.
+    """
+
+    def __init__(self, image_dir):
+        """
+        Args:
+            image_dir (str): The libvirt image directory of the peer
+                             nodes, which holds the image cache.
+        """
+        self.cache_dir = '{0}/{1}'.format(image_dir, IMAGE_CACHE_DIR_NAME)
+
+    def get_cache_filename(self, ms_image_name, checksum):
+        """
+        Function to return the name under which an MS image is held in
+        the cache.
+
+        Args:
+            ms_image_name (str): Name of the image in the MS image dir.
+
+            checksum (str): md5 checksum of the image on the MS.
+
+        Return:
+            str. The cache file name.
+        """
+        return '{0}-{1}'.format(checksum, ms_image_name)
+
+    def get_cache_path(self, ms_image_name, checksum):
+        """
+        Function to return the full path of an image in the cache.
+
+        Args:
+            ms_image_name (str): Name of the image in the MS image dir.
+
+            checksum (str): md5 checksum of the image on the MS.
+
+        Return:
+            str. The path of the cached image on the node.
+        """
+        return '{0}/{1}'.format(self.cache_dir,
+                                self.get_cache_filename(ms_image_name,
+                                                        checksum))
+
+    @staticmethod
+    def get_checksum_cmd(path):
+        """
+        Function to return the command which prints the md5 checksum of
+        a file, and nothing else.
+
+        Args:
+            path (str): The file to checksum.
+
+        Return:
+            str. The checksum command.
+        """
+        return "/usr/bin/md5sum {0} | /bin/awk '{{print $1}}'".format(path)
+
+    def get_cache_lookup_cmd(self, cache_path):
+        """
+        Function to return the command which makes sure the cache
+        directory exists and checks whether an image is already in it.
+
+        The directory is world writable with the sticky bit set, as for
+        /tmp, so that images can be downloaded into it by a non root
+        user.
+
+        Args:
+            cache_path (str): Path of the image in the cache.
+
+        Return:
+            str. The command, which returns 0 on a cache hit.
+        """
+        return '/bin/mkdir -p -m 1777 {0} && /usr/bin/test -s {1}'.format(
+            self.cache_dir, cache_path)
+
+    @staticmethod
+    def get_cache_commit_cmd(partial_path, cache_path, checksum):
+        """
+        Function to return the command which verifies a freshly
+        downloaded image and moves it into place in the cache.
+
+        The move is atomic so a concurrent reader never sees a partly
+        written image.
+
+        Args:
+            partial_path (str): Path the image was downloaded to.
+
+            cache_path (str): Path of the image in the cache.
+
+            checksum (str): Expected md5 checksum of the image.
+
+        Return:
+            str. The command, which returns 0 if the image was cached.
+        """
+        return ('/bin/echo "{0}  {1}" | /usr/bin/md5sum -c --status && '
+                '/bin/mv -f {1} {2} || '
+                '{{ /bin/rm -f {1}; /bin/false; }}').format(checksum,
+                                                           partial_path,
+                                                           cache_path)
+
+    @staticmethod
+    def get_link_cmd(src_path, dest_path):
+        """
+        Function to return the command which makes a cached image
+        available at another path, hard linking where possible and
+        copying otherwise.
+
+        Args:
+            src_path (str): Path of the image in the cache.
+
+            dest_path (str): Path the image is required at.
+
+        Return:
+            str. The link command.
+        """
+        return ('/bin/ln -f {0} {1} 2>/dev/null || '
+                '/bin/cp -f {0} {1}').format(src_path, dest_path)
+
+    @staticmethod
+    def get_reflink_cmd(src_path, dest_path):
+        """
+        Function to return the command which makes a copy on write
+        clone of a file. Fails on filesystems without reflink support.
+
+        Args:
+            src_path (str): The file to clone.
+
+            dest_path (str): Path of the clone.
+
+        Return:
+            str. The reflink command.
+        """
+        return '/bin/cp --reflink=always -f {0} {1}'.format(src_path,
+                                                          dest_path)
+
+    @staticmethod
+    def get_image_format_cmd(path):
+        """
+        Function to return the command which prints the format of an
+        image, e.g. "qcow2" or "raw", as reported by qemu-img.
+
+        Args:
+            path (str): The image.
+
+        Return:
+            str. The command, which fails if the format is not known.
+        """
+        return ('/usr/bin/qemu-img info --output=json {0} | '
+                '/usr/bin/python -c "import json, sys; '
+                'print(json.load(sys.stdin)[\'format\'])"').format(path)
+
+    def get_overlay_cmd(self, backing_path, dest_path):
+        """
+        Function to return the command which creates a qcow2 overlay
+        image on top of a backing image. Guest writes land in the
+        overlay, leaving the backing image untouched.
+
+        The format of the backing image is read from the image itself,
+        so raw images can be overlaid as well as qcow2 ones.
+
+        Args:
+            backing_path (str): Absolute path of the backing image.
+
+            dest_path (str): Path of the overlay image.
+
+        Return:
+            str. The command, grouped so it can be chained with || and
+                 failing if the format of the backing image is not known.
+        """
+        return ('{{ backing_fmt=$({0}) && /usr/bin/test -n "$backing_fmt" '
+                '&& /bin/rm -f {2} && /usr/bin/qemu-img create -q -f qcow2 '
+                '-o backing_file={1},backing_fmt=$backing_fmt {2}; }}').format(
+                    self.get_image_format_cmd(backing_path), backing_path,
+                    dest_path)
+
+    def get_provision_cmd(self, src_path, dest_path,
+                          mode=PROVISION_CLONE):
+        """
+        Function to return the command which provisions a private copy
+        of an image for a VM.
+
+        Modes:
+            copy: full copy of the image.
+            clone: reflink clone where the filesystem supports it,
+                   otherwise a qcow2 overlay, otherwise a full copy.
+            overlay: qcow2 overlay backed by the source image,
+                     otherwise a full copy.
+            hardlink: hard link to the source image. Only safe where
+                      the guest never writes to the image itself.
+
+        Args:
+            src_path (str): Absolute path of the source image.
+
+            dest_path (str): Path of the image to provision.
+
+            mode (str): One of the PROVISION_* modes.
+
+        Return:
+            str. The provisioning command.
+        """
+        copy_cmd = '/bin/cp -f {0} {1}'.format(src_path, dest_path)
+        if mode == PROVISION_COPY:
+            return copy_cmd
+        if mode == PROVISION_OVERLAY:
+            return '{0} 2>/dev/null || {1}'.format(
+                self.get_overlay_cmd(src_path, dest_path), copy_cmd)
+        if mode == PROVISION_HARDLINK:
+            return '/bin/ln -f {0} {1}'.format(src_path, dest_path)
+        if mode == PROVISION_CLONE:
+            return '{0} 2>/dev/null || {1} 2>/dev/null || {2}'.format(
+                self.get_reflink_cmd(src_path, dest_path),
+                self.get_overlay_cmd(src_path, dest_path),
+                copy_cmd)
+        raise ValueError('Unknown image provisioning mode: {0}'.format(mode))
+
+
+class ImageStagingMixin(object):
+    """
+    Test helpers staging the MS images on the nodes through the image
+    cache, and provisioning private copies of them for each test.
+
+    Images are provisioned using the test class's image_provision_mode.
+    With fake_hypervisor set, fake images stand in for those of the MS.
+    """
+
+    # The VM image directory on the MS
+    ms_image_dir = None
+
+    # The libvirt image directory on the nodes
+    libvirt_image_dir = None
+
+    # Images staged during this run, shared by every test set in the
+    # process. Keyed by (node, MS image name), the value is the path of the
+    # image in the node's image cache. Only spares the process a lookup:
+    # the cache itself is shared by every process, see _fill_image_cache.
+    staged_images = {}
+
+    # Cache path behind each staged copy, keyed by (node, staged path).
+    staged_cache_paths = {}
+
+    # md5 checksums of the images on the MS, keyed by (MS, image name).
+    ms_image_checksums = {}
+
+    # Contents of the MS image directory, keyed by MS.
+    ms_image_names = {}
+
+    def setUp(self):
+        """
+        Description:
+            Start the test with nothing staged or provisioned.
+        """
+        super(ImageStagingMixin, self).setUp()
+        self.staged_paths = []
+        self.provisioned_images = []
+
+    def get_ms_image_names(self, ms_node):
+        """
+        Description:
+            Return the contents of the VM image directory on the MS,
+            listing it only once per run. With fake_hypervisor set, the
+            MS is not used and the fake images are returned.
+
+        Args:
+            ms_node (str): The MS node filename.
+
+        Returns:
+            list. The image names in self.ms_image_dir.
+        """
+        if self.fake_hypervisor:
+            return FakeHypervisor.get_ms_image_names()
+        if ms_node not in self.ms_image_names:
+            self.ms_image_names[ms_node] = \
+                self.list_dir_contents(ms_node,
+                                       self.ms_image_dir)
+        return self.ms_image_names[ms_node]
+
+    def _get_ms_image_checksum(self, ms_node, ms_image_name):
+        """
+        Return the md5 checksum of an image in the MS image directory.
+        """
+        if self.fake_hypervisor:
+            return FakeHypervisor().get_image_checksum(ms_image_name)
+        key = (ms_node, ms_image_name)
+        if key not in self.ms_image_checksums:
+            checksum_cmd = self.image_utils.get_checksum_cmd(
+                '{0}/{1}'.format(self.ms_image_dir,
+                                 ms_image_name))
+            stdout, _, _ = self.run_command(ms_node, checksum_cmd,
+                                            su_root=True,
+                                            default_asserts=True)
+            self.ms_image_checksums[key] = stdout[0]
+        return self.ms_image_checksums[key]
+
+    def _fill_image_cache(self, ms_node, node, ms_image_name):
+        """
+        Make sure an MS image is in the node's image cache, downloading
+        it if it is not, and return its path in the cache. With
+        fake_hypervisor set, the fake image is written to the cache
+        instead.
+        """
+        checksum = self._get_ms_image_checksum(ms_node, ms_image_name)
+        cache_path = self.image_utils.get_cache_path(ms_image_name,
+                                                     checksum)
+        if self.fake_hypervisor:
+            self.run_command(node, '/bin/mkdir -p {0} && {1}'.format(
+                self.image_utils.cache_dir,
+                self.remote_cmds.get_write_file_cmd(
+                    cache_path,
+                    FakeHypervisor.get_image_lines(ms_image_name))),
+                su_root=True, default_asserts=True)
+            return cache_path
+        lookup_cmd = self.image_utils.get_cache_lookup_cmd(cache_path)
+        _, _, return_code = self.run_command(node, lookup_cmd,
+                                             su_root=True)
+        if return_code != 0:
+            # DOWNLOAD UNDER A PROCESS SPECIFIC NAME AND MOVE INTO PLACE
+            # ONCE VERIFIED, SO CONCURRENT RUNS NEVER SHARE A PARTIAL FILE
+            partial_name = '{0}.part.{1}'.format(
+                self.image_utils.get_cache_filename(ms_image_name,
+                                                    checksum),
+                os.getpid())
+            self.wget_image_to_node(ms_node, node, ms_image_name,
+                                    self.image_utils.cache_dir,
+                                    partial_name)
+            commit_cmd = self.image_utils.get_cache_commit_cmd(
+                '{0}/{1}'.format(self.image_utils.cache_dir, partial_name),
+                cache_path, checksum)
+            self.run_command(node, commit_cmd, su_root=True,
+                             default_asserts=True)
+        return cache_path
+
+    @timed_step
+    def stage_image(self, ms_node, node, ms_image_name, image_name,
+                    dest_dir='/tmp'):
+        """
+        Description:
+            Make an image from the MS image directory available on a
+            node. The image is downloaded into the node's image cache
+            the first time it is asked for in a run; every later
+            request is served from the cache.
+
+            The staged copy belongs to the current test and is removed
+            when it ends; the image cache is left in place.
+
+        Args:
+            ms_node (str): The MS node filename.
+
+            node (str): The node to stage the image on.
+
+            ms_image_name (str): Name of the image in the MS image dir.
+
+            image_name (str): Name the image is required under.
+
+            dest_dir (str): Directory the image is required in.
+
+        Returns:
+            str. The path of the staged image on the node.
+        """
+        key = (node, ms_image_name)
+        if key not in self.staged_images:
+            self.staged_images[key] = self._fill_image_cache(ms_node, node,
+                                                         ms_image_name)
+        dest_path = '{0}/{1}'.format(dest_dir, image_name)
+        link_cmd = self.image_utils.get_link_cmd(self.staged_images[key],
+                                                 dest_path)
+        self.run_command(node, link_cmd, su_root=True,
+                         default_asserts=True)
+        self.staged_cache_paths[(node, dest_path)] = self.staged_images[key]
+        if not self.staged_paths:
+            self.addCleanup(self._remove_staged_paths)
+        if (node, dest_path) not in self.staged_paths:
+            self.staged_paths.append((node, dest_path))
+        return dest_path
+
+    def _remove_staged_paths(self):
+        """
+        Remove the copies staged by the current test, in one command
+        per node.
+        """
+        for node in sorted(set(node for node, _ in self.staged_paths)):
+            paths = [path for path_node, path in self.staged_paths
+                     if path_node == node]
+            for path in paths:
+                self.staged_cache_paths.pop((node, path), None)
+            self.run_command(node, '/bin/rm -f {0}'.format(' '.join(paths)),
+                             su_root=True)
+        self.staged_paths = []
+
+    @timed_step
+    def provision_image(self, node, image_name, src_dir='/tmp',
+                        dest_name=None):
+        """
+        Description:
+            Provision a private copy of a staged image in the libvirt
+            image directory, using the class's image_provision_mode.
+            Images staged with stage_image are provisioned from the
+            image cache, so setup time does not depend on image size
+            where the node supports reflinks or qcow2 overlays.
+
+        Args:
+            node (str): The node to provision the image on.
+
+            image_name (str): Name of the staged image.
+
+            src_dir (str): Directory the image was staged in.
+
+            dest_name (str): Name of the provisioned image, defaults to
+                             image_name.
+
+        Returns:
+            str. The path of the provisioned image.
+        """
+        provision_cmd = self.get_provision_image_cmd(node, image_name,
+                                                     src_dir, dest_name)
+        self.run_command(node, provision_cmd, su_root=True,
+                         default_asserts=True)
+        return self.get_provisioned_path(image_name, dest_name)
+
+    def get_provisioned_path(self, image_name, dest_name=None):
+        """
+        Description:
+            Return the path an image is provisioned at in the libvirt
+            image directory.
+
+        Args:
+            image_name (str): Name of the staged image.
+
+            dest_name (str): Name of the provisioned image, defaults to
+                             image_name.
+
+        Returns:
+            str. The path.
+        """
+        return '{0}/{1}'.format(self.libvirt_image_dir,
+                                dest_name or image_name)
+
+    def get_provision_image_cmd(self, node, image_name, src_dir='/tmp',
+                                dest_name=None):
+        """
+        Description:
+            Return the command which provisions an image as for
+            provision_image, for callers which run it as part of a
+            batch. The image is recorded for drop_provisioned_images.
+
+        Args:
+            node (str): The node the command is run on.
+
+            image_name (str): Name of the staged image.
+
+            src_dir (str): Directory the image was staged in.
+
+            dest_name (str): Name of the provisioned image, defaults to
+                             image_name.
+
+        Returns:
+            str. The provisioning command.
+        """
+        src_path = '{0}/{1}'.format(src_dir, image_name)
+        src_path = self.staged_cache_paths.get((node, src_path), src_path)
+        dest_path = self.get_provisioned_path(image_name, dest_name)
+        provision_cmd = self.image_utils.get_provision_cmd(
+            src_path, dest_path, self.image_provision_mode)
+        if (node, dest_path) not in self.provisioned_images:
+            self.provisioned_images.append((node, dest_path))
+        return provision_cmd
+
+    @timed_step
+    def drop_provisioned_images(self, node):
+        """
+        Description:
+            Remove every image provisioned on a node by the current test.
+            The staged images and the image cache are left in place.
+
+        Args:
+            node (str): The node to remove the images from.
+        """
+        drop_cmd = self.get_drop_provisioned_images_cmd(node)
+        if drop_cmd:
+            self.run_command(node, drop_cmd, su_root=True)
+
+    def get_drop_provisioned_images_cmd(self, node):
+        """
+        Description:
+            Return the command which removes every image provisioned on
+            a node by the current test, for callers which run it as part
+            of a batch. The images are forgotten, so they are not
+            removed again.
+
+        Args:
+            node (str): The node to remove the images from.
+
+        Returns:
+            str. The command, or None if there is nothing to remove.
+        """
+        paths = [path for img_node, path in self.provisioned_images
+                 if img_node == node]
+        self.provisioned_images = [img for img in self.provisioned_images
+                                   if img[0] != node]
+        if not paths:
+            return None
+        return '/bin/rm -f {0}'.format(' '.join(paths))